@@ -19,8 +19,26 @@ Usage:
     icon_path = get_icon_png('rocket', color='#3B82F6', size=48)
     canvas.drawImage(icon_path, x, y, width=48, height=48, mask='auto')
 
-    # Search icons by keyword
+    # Or as a decoded reportlab ImageReader, reused from memory on repeats
+    canvas.drawImage(get_icon_image('rocket', color='#3B82F6', size=48),
+                     x, y, width=48, height=48, mask='auto')
+
+    # Render a whole palette's icons at once (misses render in parallel)
+    paths = get_icon_pngs([('rocket', '#3B82F6', 48), ('check', '#10B981', 32)])
+
+    # Or pack a brand's icon set into one sprite atlas (one image XObject)
+    atlas = build_icon_atlas(ICON_CATEGORIES['growth'], color='#3B82F6',
+                             size=48, brand='acme')
+    draw_atlas_icon(canvas, atlas, 'target', x, y, width=48, height=48)
+
+    # Inspect or trim the on-disk PNG cache
+    print(cache_stats())  # {'hit_rate': 0.97, 'disk_bytes': 412345, ...}
+    prune_cache(max_bytes=16 * 1024 * 1024)
+
+    # Search icon names by keyword, best matches first
     matches = search_icons('chart')  # ['chart-bar', 'chart-line', ...]
+    # Opt in to Lucide tags/categories and typo-tolerant matches
+    matches = search_icons('money', limit=5, tags=True, fuzzy=True)
 
     # List all icons in a category
     business_icons = ICON_CATEGORIES['business']
@@ -32,8 +50,21 @@ Requirements:
 """
 
 import os
+import re
 import tempfile
 import hashlib
+import json
+import math
+import multiprocessing
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 
 # Try to import cairosvg, provide helpful error if missing
@@ -56,12 +87,52 @@ def _get_plugin_dir() -> Path:
     return Path(__file__).parent.parent
 
 
+def _env_bytes(name: str, default_mb: float) -> int:
+    """Read a size in megabytes from the environment, as bytes.
+
+    Falls back to default_mb when the variable is unset or not a number,
+    so a typo never stops the module from importing.
+    """
+    try:
+        return int(float(os.environ.get(name, default_mb)) * 1024 * 1024)
+    except ValueError:
+        return int(default_mb * 1024 * 1024)
+
+
 # Path to Lucide icons (from infographic-generator's node_modules)
 ICONS_DIR = _get_plugin_dir() / "skills" / "infographic-generator" / "node_modules" / "lucide-static" / "icons"
 
-# Cache directory for converted PNGs
+# Cache directory for converted PNGs, content-addressed (see _content_path)
 CACHE_DIR = Path(tempfile.gettempdir()) / "brand-content-design-icons"
 
+# Size cap for CACHE_DIR; least recently used files are evicted past it
+# (override with BCD_ICON_CACHE_MB)
+DISK_CACHE_MAX_BYTES = _env_bytes('BCD_ICON_CACHE_MB', 64)
+
+# Files used this recently are never evicted, so a path already handed to
+# a render in progress (in any process) stays readable
+EVICTION_GRACE_SECONDS = 300
+
+# Lucide's icon → tags metadata, shipped with lucide-static
+TAGS_PATH = ICONS_DIR.parent / "tags.json"
+
+# Prebuilt name/tag index, rebuilt when ICONS_DIR or TAGS_PATH changes
+INDEX_PATH = CACHE_DIR / "icon-index.json"
+
+# get_icon_pngs renders fewer misses than this in-process; starting
+# worker processes would cost more than it saves
+MIN_POOL_MISSES = 4
+
+# Upper bound for the in-process cache of rendered icons, in bytes
+# (override with BCD_ICON_MEMORY_CACHE_MB)
+MEMORY_CACHE_MAX_BYTES = _env_bytes('BCD_ICON_MEMORY_CACHE_MB', 32)
+
+# Lucide icons start with a license comment
+_COMMENT_RE = re.compile(r'<!--[\s\S]*?-->\s*')
+
+# An SVG root tag, whatever whitespace follows it (Lucide breaks the line)
+_SVG_TAG_RE = re.compile(r'<svg\b')
+
 # Common icon categories for carousels/presentations
 ICON_CATEGORIES = {
     'business': ['briefcase', 'building', 'building-2', 'landmark', 'store', 'factory', 'warehouse'],
@@ -86,12 +157,350 @@ def _ensure_cache_dir():
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+class _IconMemoryCache:
+    """
+    Process-level LRU of rendered icons, keyed by (name, color, size).
+
+    Each entry holds the PNG bytes, the on-disk path once known, and the
+    decoded reportlab ImageReader once requested. Entries are charged their
+    PNG size plus the decoded RGBA size, and the least recently used ones
+    are dropped once the total passes max_bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> dict:
+        """Return the entry for key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, png: bytes, path: str = None) -> dict:
+        """Store rendered PNG bytes for key and return the entry."""
+        size = key[2]
+        entry = {'png': png, 'path': path, 'image': None,
+                 'touched': time.time(), 'cost': len(png) + size * size * 4}
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old['cost']
+            self._entries[key] = entry
+            self.bytes += entry['cost']
+            while self.bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted['cost']
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+_memory_cache = _IconMemoryCache(MEMORY_CACHE_MAX_BYTES)
+
+
+# Per-process cache counters, reported by cache_stats()
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+# Estimated CACHE_DIR size, scanned on first write (see _note_written)
+_disk_bytes = None
+
+
+def _count(**deltas):
+    with _stats_lock:
+        _stats.update(deltas)
+
+
+def _content_path(svg_content: str, color: str, size: int,
+                  suffix: str = '.png', prefix: str = '') -> Path:
+    """
+    Content-addressed cache path for a rendering of svg_content.
+
+    The name is the full SHA-256 of the SVG bytes, color, size and the
+    cairosvg version, so edited icons, upgrades and near-identical
+    parameters never share a file.
+    """
+    digest = hashlib.sha256()
+    version = getattr(cairosvg, '__version__', '') if CAIROSVG_AVAILABLE else ''
+    for part in (svg_content, color, str(size), version):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return CACHE_DIR / f"{prefix}{digest.hexdigest()}{suffix}"
+
+
 def _get_cache_path(name: str, color: str, size: int) -> Path:
-    """Generate cache path for an icon with specific parameters."""
-    # Create hash of parameters for unique filename
-    params = f"{name}-{color}-{size}"
-    hash_str = hashlib.md5(params.encode()).hexdigest()[:8]
-    return CACHE_DIR / f"{name}_{size}_{hash_str}.png"
+    """Cache path for an icon with specific parameters, None if not found."""
+    svg_content = get_icon_svg(name, color, size)
+    if not svg_content:
+        return None
+    return _content_path(svg_content, color, size)
+
+
+def _write_atomic(path: Path, data: bytes):
+    """
+    Write data to path via a temp file and rename.
+
+    Readers in other threads or processes see either no file or the whole
+    file, never a half-written PNG.
+    """
+    _ensure_cache_dir()
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix=path.suffix)
+    try:
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp)
+        raise
+    _note_written(len(data))
+
+
+def _touch(path: Path) -> bool:
+    """Mark a cache file as recently used; False if it is gone."""
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _cache_files() -> list:
+    """(mtime, size, path) for every file in CACHE_DIR, oldest first."""
+    files = []
+    if not CACHE_DIR.exists():
+        return files
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            with suppress(FileNotFoundError):
+                if entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+    files.sort()
+    return files
+
+
+def _note_written(size: int):
+    """Track CACHE_DIR growth and evict once it passes DISK_CACHE_MAX_BYTES."""
+    global _disk_bytes
+    if _disk_bytes is None:
+        _disk_bytes = sum(size for _, size, _ in _cache_files())
+    else:
+        _disk_bytes += size
+    if _disk_bytes > DISK_CACHE_MAX_BYTES:
+        # Prune below the cap so the next few writes don't rescan
+        prune_cache(int(DISK_CACHE_MAX_BYTES * 0.8))
+
+
+def prune_cache(max_bytes: int = None,
+                grace_seconds: float = EVICTION_GRACE_SECONDS) -> int:
+    """
+    Evict least recently used files from CACHE_DIR down to max_bytes.
+
+    Recency is the file mtime, refreshed on every cache hit. Files used
+    within grace_seconds are kept even over the cap; leftover temp files
+    from interrupted writes are removed once older than that.
+
+    Args:
+        max_bytes: Target size (default: DISK_CACHE_MAX_BYTES)
+        grace_seconds: Minimum idle time before a file may be evicted
+
+    Returns:
+        Number of bytes removed
+    """
+    global _disk_bytes
+    if max_bytes is None:
+        max_bytes = DISK_CACHE_MAX_BYTES
+    files = _cache_files()
+    total = sum(size for _, size, _ in files)
+    cutoff = time.time() - grace_seconds
+    removed = evicted = 0
+    for mtime, size, path in files:
+        stale_temp = path.name.startswith('.tmp-') and mtime < cutoff
+        if not stale_temp and (total - removed <= max_bytes or mtime >= cutoff):
+            continue
+        if path == INDEX_PATH and grace_seconds:
+            continue
+        with suppress(FileNotFoundError):
+            path.unlink()
+            removed += size
+            evicted += 1
+    _disk_bytes = total - removed
+    _count(evictions=evicted, evicted_bytes=removed)
+    return removed
+
+
+def cache_stats() -> dict:
+    """
+    Report icon cache effectiveness and size.
+
+    Hit and miss counts cover this process; disk figures cover CACHE_DIR
+    as shared by all processes.
+
+    Returns:
+        Dict with memory_hits, disk_hits, misses, hit_rate (0-1),
+        memory_entries, memory_bytes, disk_files, disk_bytes,
+        disk_max_bytes, evictions and evicted_bytes
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    hits = stats.get('memory_hits', 0) + stats.get('disk_hits', 0)
+    lookups = hits + stats.get('misses', 0)
+    files = _cache_files()
+    return {
+        'memory_hits': stats.get('memory_hits', 0),
+        'disk_hits': stats.get('disk_hits', 0),
+        'misses': stats.get('misses', 0),
+        'hit_rate': hits / lookups if lookups else 0.0,
+        'memory_entries': len(_memory_cache._entries),
+        'memory_bytes': _memory_cache.bytes,
+        'disk_files': len(files),
+        'disk_bytes': sum(size for _, size, _ in files),
+        'disk_max_bytes': DISK_CACHE_MAX_BYTES,
+        'evictions': stats.get('evictions', 0),
+        'evicted_bytes': stats.get('evicted_bytes', 0),
+    }
+
+
+def _trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _IconIndex:
+    """
+    Icon names and tags with prefix and trigram lookups.
+
+    Built from an icon → tags map; see _icon_index for how that map is
+    loaded and persisted.
+    """
+
+    def __init__(self, tags: dict):
+        self.names = sorted(tags)
+        self.tags = tags
+        self._postings = {}
+        for name, name_tags in tags.items():
+            for text in (name, *name_tags):
+                for gram in _trigrams(text):
+                    self._postings.setdefault(gram, set()).add(name)
+
+    def _prefixed(self, term: str) -> list:
+        start = bisect_left(self.names, term)
+        end = bisect_left(self.names, term + '\uffff')
+        return self.names[start:end]
+
+    def _candidates(self, term: str) -> set:
+        """Names whose name or a tag may contain term (superset)."""
+        grams = {term[i:i + 3] for i in range(len(term) - 2)}
+        if not grams:
+            # Too short for trigrams; the index is in memory either way
+            return set(self.names)
+        postings = sorted((self._postings.get(g, set()) for g in grams), key=len)
+        return set.intersection(*postings)
+
+    def _rank(self, name: str, term: str, tags: bool) -> int:
+        """0 exact, 1 prefix, 2 word prefix, 3 substring, 4/5 tag; else None."""
+        if name == term:
+            return 0
+        if name.startswith(term):
+            return 1
+        if any(part.startswith(term) for part in name.split('-')[1:]):
+            return 2
+        if term in name:
+            return 3
+        if not tags:
+            return None
+        name_tags = self.tags[name]
+        if term in name_tags:
+            return 4
+        if any(term in tag for tag in name_tags):
+            return 5
+        return None
+
+    def search(self, term: str, limit: int = None, tags: bool = False,
+               fuzzy: bool = False) -> list:
+        scored = {name: int(name != term) for name in self._prefixed(term)}
+        for name in self._candidates(term):
+            if name not in scored:
+                rank = self._rank(name, term, tags)
+                if rank is not None:
+                    scored[name] = rank
+        if fuzzy and len(term) >= 3:
+            # Typos: names sharing most trigrams with the term. Postings
+            # also hold tag trigrams, so the count only shortlists.
+            term_grams = _trigrams(term)
+            shared = Counter()
+            for gram in term_grams:
+                shared.update(self._postings.get(gram, ()))
+            for name, count in shared.items():
+                if name in scored or count < len(term_grams) // 2:
+                    continue
+                name_grams = _trigrams(name)
+                overlap = len(term_grams & name_grams)
+                similarity = overlap / len(term_grams | name_grams)
+                if similarity >= 0.4:
+                    scored[name] = 6 + (1 - similarity)
+        ranked = sorted(scored, key=lambda name: (scored[name], len(name), name))
+        return ranked[:limit] if limit else ranked
+
+
+def _scan_icons() -> dict:
+    """Walk ICONS_DIR and TAGS_PATH once: icon name → tags."""
+    tags = {}
+    with os.scandir(ICONS_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith('.svg'):
+                tags[entry.name[:-4]] = []
+    if TAGS_PATH.exists():
+        for name, name_tags in json.loads(TAGS_PATH.read_text()).items():
+            if name in tags:
+                tags[name] = [tag.lower() for tag in name_tags]
+    # The curated categories double as tags ('business', 'growth', ...)
+    for category, names in ICON_CATEGORIES.items():
+        for name in names:
+            if name in tags and category not in tags[name]:
+                tags[name].append(category)
+    return tags
+
+
+@lru_cache(maxsize=1)
+def _icon_index() -> _IconIndex:
+    """
+    Load the icon index once per process.
+
+    The name → tags map is kept in INDEX_PATH and reused while ICONS_DIR
+    and TAGS_PATH are unchanged, so only the first run after an install or
+    upgrade walks the icons directory.
+    """
+    if not ICONS_DIR.exists():
+        return _IconIndex({})
+    source = [
+        str(ICONS_DIR),
+        ICONS_DIR.stat().st_mtime_ns,
+        TAGS_PATH.stat().st_mtime_ns if TAGS_PATH.exists() else 0,
+        sorted(ICON_CATEGORIES.items()),
+    ]
+    try:
+        stored = json.loads(INDEX_PATH.read_text())
+        if stored.get('source') == json.loads(json.dumps(source)):
+            return _IconIndex(stored['icons'])
+    except (OSError, ValueError):
+        pass
+    tags = _scan_icons()
+    # Best effort: a read-only cache dir only costs the next process a scan
+    with suppress(OSError):
+        _write_atomic(
+            INDEX_PATH, json.dumps({'source': source, 'icons': tags}).encode('utf-8')
+        )
+    return _IconIndex(tags)
 
 
 def list_icons() -> list:
@@ -99,28 +508,56 @@ def list_icons() -> list:
     List all available Lucide icon names.
 
     Returns:
-        List of icon names (without .svg extension)
+        Sorted list of icon names (without .svg extension)
     """
     if not ICONS_DIR.exists():
         print(f"Warning: Icons directory not found: {ICONS_DIR}")
         return []
 
-    return [f.stem for f in ICONS_DIR.glob("*.svg")]
+    return list(_icon_index().names)
 
 
-def search_icons(keyword: str) -> list:
+def search_icons(keyword: str, limit: int = None, tags: bool = False,
+                 fuzzy: bool = False) -> list:
     """
-    Search icons by keyword.
+    Search icons by keyword, best matches first.
+
+    Uses the prebuilt icon index instead of scanning the icons directory.
+    By default this returns the icons whose name contains the keyword,
+    ranked exact name, name prefix ('chart' → 'chart-bar'), word prefix
+    inside the name ('bar' → 'chart-bar'), then other substrings. tags
+    adds Lucide tag and category matches ('money' → 'banknote'); fuzzy
+    adds near-miss spellings ('rockt' → 'rocket'), ranked last.
 
     Args:
         keyword: Search term (case-insensitive)
+        limit: Maximum number of results (default: all)
+        tags: Also match Lucide tags and ICON_CATEGORIES
+        fuzzy: Also match trigram-similar names, for typos
 
     Returns:
         List of matching icon names
     """
-    icons = list_icons()
-    term = keyword.lower()
-    return [name for name in icons if term in name.lower()]
+    term = keyword.strip().lower()
+    if not term:
+        return []
+    if not ICONS_DIR.exists():
+        print(f"Warning: Icons directory not found: {ICONS_DIR}")
+        return []
+    return _icon_index().search(term, limit=limit, tags=tags, fuzzy=fuzzy)
+
+
+def get_icon_tags(name: str) -> list:
+    """
+    Get an icon's Lucide tags and curated categories.
+
+    Args:
+        name: Icon name
+
+    Returns:
+        List of tags (empty if the icon is unknown)
+    """
+    return list(_icon_index().tags.get(name, []))
 
 
 def get_icons_by_category(category: str) -> list:
@@ -141,6 +578,15 @@ def list_categories() -> list:
     return list(ICON_CATEGORIES.keys())
 
 
+@lru_cache(maxsize=256)
+def _svg_template(name: str) -> str:
+    """Read an icon's SVG once per process, license comment stripped."""
+    svg_path = ICONS_DIR / f"{name}.svg"
+    if not svg_path.exists():
+        return None
+    return _COMMENT_RE.sub('', svg_path.read_text()).strip()
+
+
 def get_icon_svg(name: str, color: str = 'currentColor', size: int = 24) -> str:
     """
     Get icon as SVG string with color and size applied.
@@ -153,18 +599,11 @@ def get_icon_svg(name: str, color: str = 'currentColor', size: int = 24) -> str:
     Returns:
         SVG string or None if not found
     """
-    svg_path = ICONS_DIR / f"{name}.svg"
-
-    if not svg_path.exists():
+    svg_content = _svg_template(name)
+    if svg_content is None:
         print(f"Icon not found: {name}")
         return None
 
-    svg_content = svg_path.read_text()
-
-    # Strip license comments
-    import re
-    svg_content = re.sub(r'<!--[\s\S]*?-->\s*', '', svg_content).strip()
-
     # Update color and size
     svg_content = svg_content.replace('width="24"', f'width="{size}"')
     svg_content = svg_content.replace('height="24"', f'height="{size}"')
@@ -173,11 +612,92 @@ def get_icon_svg(name: str, color: str = 'currentColor', size: int = 24) -> str:
     return svg_content
 
 
+def _render_png(name: str, color: str, size: int) -> dict:
+    """
+    Return the memory-cache entry for an icon, rendering it on a miss.
+
+    Lookup order: in-process LRU, then the PNG cache in CACHE_DIR, then
+    cairosvg. Returns None if the icon is missing or conversion fails.
+    """
+    key = (name, color, size)
+    entry = _memory_cache.get(key)
+    if entry is not None:
+        _count(memory_hits=1)
+        _refresh(entry)
+        return entry
+
+    entry, cache_path = _from_disk(key)
+    if entry is not None or cache_path is None:
+        return entry
+
+    _count(misses=1)
+    return _store_png(key, _svg_to_png(key), cache_path)
+
+
+def _refresh(entry: dict):
+    """Keep a memory hit's file from being evicted under another process.
+
+    Touches the file at most every half grace period; if it was evicted
+    anyway, it is rewritten from the PNG bytes in memory.
+    """
+    if entry['path'] and time.time() - entry['touched'] > EVICTION_GRACE_SECONDS / 2:
+        if not _touch(Path(entry['path'])):
+            _write_atomic(Path(entry['path']), entry['png'])
+        entry['touched'] = time.time()
+
+
+def _from_disk(key):
+    """Return (memory entry, cache path) for a key; entry None on a miss.
+
+    The path is None when the icon does not exist.
+    """
+    cache_path = _get_cache_path(*key)
+    if cache_path is None:
+        return None, None
+    try:
+        png = cache_path.read_bytes()
+    except FileNotFoundError:
+        return None, cache_path
+    _touch(cache_path)
+    _count(disk_hits=1)
+    return _memory_cache.put(key, png, str(cache_path)), cache_path
+
+
+def _svg_to_png(key) -> bytes:
+    """Render one (name, color, size) icon with cairosvg; None on failure.
+
+    Module-level so get_icon_pngs can run it in worker processes.
+    """
+    name, color, size = key
+    svg_content = get_icon_svg(name, color, size)
+    if not svg_content:
+        return None
+
+    try:
+        return cairosvg.svg2png(
+            bytestring=svg_content.encode('utf-8'),
+            output_width=size,
+            output_height=size
+        )
+    except Exception as e:
+        print(f"Error converting icon {name} to PNG: {e}")
+        return None
+
+
+def _store_png(key, png: bytes, cache_path: Path) -> dict:
+    """Write a freshly rendered PNG to CACHE_DIR and the memory cache."""
+    if png is None:
+        return None
+    _write_atomic(cache_path, png)
+    return _memory_cache.put(key, png, str(cache_path))
+
+
 def get_icon_png(name: str, color: str = '#000000', size: int = 48) -> str:
     """
     Get icon as PNG file path for reportlab embedding.
 
-    Converts SVG to PNG and caches the result.
+    Converts SVG to PNG and caches the result, on disk and in memory, so
+    repeated icons across a deck render once.
 
     Args:
         name: Icon name (e.g., 'rocket', 'check-circle')
@@ -195,31 +715,279 @@ def get_icon_png(name: str, color: str = '#000000', size: int = 48) -> str:
         print("Error: cairosvg not installed. Run: pip install cairosvg")
         return None
 
-    _ensure_cache_dir()
+    entry = _render_png(name, color, size)
+    return entry['path'] if entry else None
 
-    # Check cache first
-    cache_path = _get_cache_path(name, color, size)
-    if cache_path.exists():
-        return str(cache_path)
 
-    # Get SVG content
-    svg_content = get_icon_svg(name, color, size)
-    if not svg_content:
+def get_icon_pngs(specs, max_workers: int = None) -> list:
+    """
+    Get many icons as PNG file paths, rendering the misses in parallel.
+
+    Duplicate specs are rendered once. Icons already in memory or in
+    CACHE_DIR are served from there; the rest are rendered with cairosvg
+    on a process pool sized to the CPU count, so pre-warming a whole brand
+    palette scales with cores instead of running one icon at a time.
+    Fewer than MIN_POOL_MISSES misses, or a pool that cannot start or
+    breaks, are rendered serially in this process instead.
+
+    Workers are forked where the platform allows it. Elsewhere (Windows)
+    they re-import the calling script, which must then keep its top-level
+    code under ``if __name__ == '__main__':``.
+
+    Args:
+        specs: Iterable of (name, color, size) tuples
+        max_workers: Worker processes (default: os.cpu_count())
+
+    Returns:
+        List of PNG paths in the same order as specs, None where an icon
+        is missing or conversion failed
+
+    Example:
+        paths = get_icon_pngs([(name, brand_colors['primary'], 48)
+                               for name in ICON_CATEGORIES['growth']])
+    """
+    specs = [tuple(spec) for spec in specs]
+    if not CAIROSVG_AVAILABLE:
+        print("Error: cairosvg not installed. Run: pip install cairosvg")
+        return [None] * len(specs)
+
+    entries = {}
+    misses = []
+    for key in dict.fromkeys(specs):
+        entry = _memory_cache.get(key)
+        if entry is not None:
+            _count(memory_hits=1)
+            _refresh(entry)
+        else:
+            entry, cache_path = _from_disk(key)
+            if entry is None and cache_path is not None:
+                misses.append((key, cache_path))
+        entries[key] = entry
+
+    _count(misses=len(misses))
+    keys = [key for key, _ in misses]
+
+    rendered = _render_many(keys, max_workers)
+    for (key, cache_path), png in zip(misses, rendered):
+        entries[key] = _store_png(key, png, cache_path)
+
+    return [entries[key]['path'] if entries[key] else None for key in specs]
+
+
+def _render_many(keys: list, max_workers: int = None) -> list:
+    """Render keys with _svg_to_png, on a process pool when it pays off."""
+    workers = min(max_workers or os.cpu_count() or 1, len(keys))
+    if workers > 1 and len(keys) >= MIN_POOL_MISSES:
+        # fork never re-imports __main__, so scripts without a main guard
+        # work; spawn-only platforms get the default context
+        context = None
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=context) as pool:
+                return list(pool.map(_svg_to_png, keys))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # No usable worker processes (e.g. sandboxed /dev/shm, or a
+            # worker died on start-up): go serial
+            pass
+    return [_svg_to_png(key) for key in keys]
+
+
+def get_icon_png_bytes(name: str, color: str = '#000000', size: int = 48) -> bytes:
+    """
+    Get icon as PNG bytes, served from memory after the first render.
+
+    Args:
+        name: Icon name (e.g., 'rocket', 'check-circle')
+        color: Stroke color (hex code)
+        size: Width and height in pixels
+
+    Returns:
+        PNG bytes, or None if conversion fails
+    """
+    if not CAIROSVG_AVAILABLE:
+        print("Error: cairosvg not installed. Run: pip install cairosvg")
         return None
 
-    # Convert to PNG
+    entry = _render_png(name, color, size)
+    return entry['png'] if entry else None
+
+
+def get_icon_image(name: str, color: str = '#000000', size: int = 48):
+    """
+    Get icon as a reportlab ImageReader, decoded once per process.
+
+    Passing the same ImageReader to canvas.drawImage for every occurrence
+    skips the file stat and PNG decode that a path costs on each call.
+
+    Args:
+        name: Icon name (e.g., 'rocket', 'check-circle')
+        color: Stroke color (hex code)
+        size: Width and height in pixels
+
+    Returns:
+        reportlab.lib.utils.ImageReader, or None if conversion fails
+
+    Example:
+        icon = get_icon_image('lightbulb', color='#3B82F6', size=48)
+        canvas.drawImage(icon, x, y, width=48, height=48, mask='auto')
+    """
+    if not CAIROSVG_AVAILABLE:
+        print("Error: cairosvg not installed. Run: pip install cairosvg")
+        return None
+
+    entry = _render_png(name, color, size)
+    if not entry:
+        return None
+    if entry['image'] is None:
+        from reportlab.lib.utils import ImageReader
+        entry['image'] = ImageReader(BytesIO(entry['png']))
+    return entry['image']
+
+
+def build_icon_atlas(names, color: str = '#000000', size: int = 48,
+                     brand: str = 'default', columns: int = None,
+                     padding: int = 2) -> dict:
+    """
+    Pack a set of icons into one sprite-atlas PNG plus a JSON offset map.
+
+    All icons are placed as nested SVGs in one document and rendered by a
+    single cairosvg call. Drawing cells with draw_atlas_icon embeds one
+    image in the PDF instead of one per icon, and the temp cache holds two
+    files per set instead of one per icon. Atlases are cached in CACHE_DIR
+    under the hash of the composed sheet, so any change to the icon list,
+    layout or icon artwork produces a new atlas.
+
+    Args:
+        names: Icon names to include (duplicates and missing icons skipped)
+        color: Stroke color (hex code)
+        size: Cell width and height in pixels
+        brand: Brand slug, prefixed to the atlas file names (characters
+            other than letters, digits, '-' and '_' become '-')
+        columns: Cells per row (default: roughly square)
+        padding: Transparent gutter around each cell, in pixels
+
+    Returns:
+        Atlas dict: {'image': png path, 'map': json path, 'size', 'color',
+        'padding', 'width', 'height', 'icons': {name: [x, y]}} where x, y
+        is the cell's top-left pixel in the PNG; None if nothing rendered
+
+    Example:
+        atlas = build_icon_atlas(ICON_CATEGORIES['growth'], color='#3B82F6')
+        draw_atlas_icon(canvas, atlas, 'trophy', x, y, width=48, height=48)
+    """
+    if not CAIROSVG_AVAILABLE:
+        print("Error: cairosvg not installed. Run: pip install cairosvg")
+        return None
+
+    names = list(dict.fromkeys(names))
+    columns = columns or max(1, math.ceil(math.sqrt(len(names))))
+    pitch = size + 2 * padding
+    cells = []
+    icons = {}
+    for name in names:
+        svg_content = get_icon_svg(name, color, size)
+        if not svg_content:
+            continue
+        row, col = divmod(len(icons), columns)
+        x, y = col * pitch + padding, row * pitch + padding
+        icons[name] = [x, y]
+        cells.append(_SVG_TAG_RE.sub(f'<svg x="{x}" y="{y}"', svg_content, count=1))
+    if not icons:
+        return None
+
+    width = min(len(icons), columns) * pitch
+    height = math.ceil(len(icons) / columns) * pitch
+    sheet = (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+        f'height="{height}">{"".join(cells)}</svg>'
+    )
+    slug = re.sub(r'[^A-Za-z0-9_-]+', '-', brand).strip('-') or 'default'
+    image_path = _content_path(sheet, color, size, prefix=f"atlas-{slug}-")
+    map_path = image_path.with_suffix('.json')
+    # The map is written last, so it only exists next to a complete image
+    if _touch(map_path) and _touch(image_path):
+        _count(disk_hits=1)
+        return json.loads(map_path.read_text())
+
+    _count(misses=1)
     try:
-        cairosvg.svg2png(
-            bytestring=svg_content.encode('utf-8'),
-            write_to=str(cache_path),
-            output_width=size,
-            output_height=size
+        png = cairosvg.svg2png(
+            bytestring=sheet.encode('utf-8'),
+            output_width=width,
+            output_height=height
         )
-        return str(cache_path)
     except Exception as e:
-        print(f"Error converting icon {name} to PNG: {e}")
+        print(f"Error rendering icon atlas for {brand}: {e}")
         return None
 
+    atlas = {
+        'image': str(image_path),
+        'map': str(map_path),
+        'size': size,
+        'color': color,
+        'padding': padding,
+        'width': width,
+        'height': height,
+        'icons': icons,
+    }
+    _write_atomic(image_path, png)
+    _write_atomic(map_path, json.dumps(atlas, indent=2).encode('utf-8'))
+    return atlas
+
+
+@lru_cache(maxsize=32)
+def _atlas_image(image_path: str):
+    """One decoded ImageReader per atlas file, so reportlab embeds it once."""
+    from reportlab.lib.utils import ImageReader
+    return ImageReader(image_path)
+
+
+def draw_atlas_icon(canvas, atlas: dict, name: str, x: float, y: float,
+                    width: float = None, height: float = None) -> bool:
+    """
+    Draw one atlas cell on a reportlab canvas, clipped to the cell.
+
+    The whole atlas image is drawn, scaled and offset so the cell lands on
+    (x, y), inside a clip rectangle; reportlab stores the image once per
+    PDF however many cells are drawn.
+
+    Args:
+        canvas: reportlab canvas
+        atlas: Dict returned by build_icon_atlas
+        name: Icon name in the atlas
+        x, y: Position (bottom-left of icon)
+        width, height: Drawn size (default: the atlas cell size)
+
+    Returns:
+        True if the icon was drawn, False if it is not in the atlas
+    """
+    cell = atlas['icons'].get(name)
+    if cell is None:
+        return False
+    size = atlas['size']
+    width = width or size
+    height = height or size
+    scale_x, scale_y = width / size, height / size
+    cell_x, cell_y = cell
+
+    canvas.saveState()
+    clip = canvas.beginPath()
+    clip.rect(x, y, width, height)
+    canvas.clipPath(clip, stroke=0, fill=0)
+    # PNG rows run top-down, PDF y runs bottom-up
+    canvas.drawImage(
+        _atlas_image(atlas['image']),
+        x - cell_x * scale_x,
+        y - (atlas['height'] - cell_y - size) * scale_y,
+        width=atlas['width'] * scale_x,
+        height=atlas['height'] * scale_y,
+        mask='auto'
+    )
+    canvas.restoreState()
+    return True
+
 
 def get_icon_data_uri(name: str, color: str = '#000000', size: int = 24) -> str:
     """
@@ -243,11 +1011,18 @@ def get_icon_data_uri(name: str, color: str = '#000000', size: int = 24) -> str:
 
 
 def clear_cache():
-    """Clear the icon PNG cache."""
+    """Clear the icon PNG cache, on disk and in memory.
+
+    Removes every file in CACHE_DIR, including ones other processes are
+    using; prefer prune_cache to trim it safely.
+    """
+    _memory_cache.clear()
+    _svg_template.cache_clear()
+    _atlas_image.cache_clear()
+    _icon_index.cache_clear()
     if CACHE_DIR.exists():
-        import shutil
-        shutil.rmtree(CACHE_DIR)
-        print(f"Cleared icon cache: {CACHE_DIR}")
+        removed = prune_cache(0, grace_seconds=0)
+        print(f"Cleared icon cache: {CACHE_DIR} ({removed} bytes)")
 
 
 # Quick test when run directly
@@ -275,5 +1050,6 @@ if __name__ == "__main__":
         png_path = get_icon_png('rocket', color='#3B82F6', size=48)
         if png_path:
             print(f"\nGenerated PNG: {png_path}")
+        print(f"Cache: {cache_stats()}")
     else:
         print("\ncairosvg not installed - PNG conversion unavailable")
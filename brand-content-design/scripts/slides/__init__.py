@@ -15,9 +15,27 @@ Public API:
 * :func:`slides.auth.build_services` — env vars → ``(slides_service, drive_service)``.
 * :func:`slides.auth.resolve_mode` — env-var routing.
 * :class:`slides.runner.SlidesRunner` — execute Slides + Drive calls.
+
+These names resolve on first access, so ``import slides.cli`` does not pay
+for the Google client libraries until a command needs them.
 """
 
-from slides.auth import SCOPES, build_services, resolve_mode
-from slides.runner import SlidesRunner
+import importlib
+
+#: Public name → defining submodule.
+_EXPORTS = {
+    "SCOPES": "slides.auth",
+    "build_services": "slides.auth",
+    "resolve_mode": "slides.auth",
+    "SlidesRunner": "slides.runner",
+}
 
 __all__ = ["SCOPES", "SlidesRunner", "build_services", "resolve_mode"]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'slides' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
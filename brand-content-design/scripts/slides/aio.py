@@ -0,0 +1,877 @@
+"""Asyncio twins of :class:`~slides.runner.SlidesRunner` and
+:class:`~slides.runner.DriveFolderMirror`.
+
+For orchestrators that mirror many renders from one event loop instead of
+one ``slides.cli`` process each. The methods match the synchronous classes
+but are coroutines, and they talk to the Slides/Drive REST endpoints through
+one shared ``httpx.AsyncClient``. That client keeps a bounded pool of
+keep-alive connections and uses HTTP/2 when the ``h2`` package is installed.
+
+Optional dependency — ``pip install "httpx[http2]"``. Importing this module
+without httpx works; constructing a client raises ``RuntimeError``.
+
+Usage::
+
+    async with AsyncGoogleClient.from_env() as client:
+        runner = AsyncSlidesRunner(client)
+        mirror = AsyncDriveFolderMirror(client, cache=FolderIdCache.for_root(None))
+        folder_ids = await asyncio.gather(
+            *(mirror.ensure_render_folder(b, "presentations", s) for b, s in jobs)
+        )
+
+Retries, ``Retry-After`` handling, the create-recovery rules and the
+``BCD_SLIDES_RATE_LIMIT`` throttle are the same as the synchronous path
+(:meth:`slides.retry.RetryPolicy.acall`). Errors are
+:class:`AsyncHttpError`, shaped like ``googleapiclient``'s ``HttpError``
+(``.resp.status``, ``.content``) so the CLI error payloads still apply.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+import json
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Literal,
+    Optional,
+)
+
+from slides.cache import FolderIdCache
+from slides.retry import NO_RETRY, RetryPolicy
+from slides.runner import (
+    BRAND_CONTENT_ROOT_NAME,
+    DEFAULT_BATCH_MAX_BYTES,
+    LIST_PAGE_SIZE,
+    DEFAULT_BATCH_MAX_REQUESTS,
+    PRESENTATIONS_SUBFOLDER,
+    TEMPLATES_SUBFOLDER,
+    BatchUpdateChunkError,
+    DriveFolderMirror,
+    SlidesRunner,
+    StaleFolderError,
+    _chunks_reporting_progress,
+    _http_status,
+    _walk_path,
+)
+from slides.uploads import chunk_size, resumable_threshold
+
+try:
+    import httpx
+except ImportError:  # optional dependency
+    httpx = None
+
+
+SLIDES_ENDPOINT = "https://slides.googleapis.com/v1"
+DRIVE_ENDPOINT = "https://www.googleapis.com/drive/v3"
+DRIVE_UPLOAD_ENDPOINT = "https://www.googleapis.com/upload/drive/v3"
+_GOOGLE_ROOTS = ("https://slides.googleapis.com", "https://www.googleapis.com")
+
+#: Pool bounds for the shared client. Enough for a few dozen renders in
+#: flight without opening a socket per call.
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_TIMEOUT = 60.0
+
+
+class _Resp(dict):
+    """``httplib2.Response`` look-alike: lower-cased headers plus ``.status``."""
+
+    def __init__(self, status: int, headers: Iterable[tuple[str, str]]):
+        super().__init__((key.lower(), value) for key, value in headers)
+        self.status = status
+
+
+class AsyncHttpError(Exception):
+    """Non-2xx response from a Google API, shaped like ``HttpError``."""
+
+    def __init__(self, status: int, headers, content: bytes, method: str, url: str):
+        self.resp = _Resp(status, headers)
+        self.content = content
+        super().__init__(f"<HttpError {status} when requesting {method} {url}>")
+
+
+def _multipart_related(
+    metadata: dict, media: bytes, mimetype: str
+) -> tuple[bytes, str]:
+    """Body + content type for a Drive ``uploadType=multipart`` request."""
+    boundary = f"bcd-{uuid.uuid4().hex}"
+    head = (
+        f"--{boundary}\r\n"
+        "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+        f"{json.dumps(metadata)}\r\n"
+        f"--{boundary}\r\n"
+        f"Content-Type: {mimetype}\r\n\r\n"
+    ).encode("utf-8")
+    tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+    return head + media + tail, f"multipart/related; boundary={boundary}"
+
+
+def _read_chunk(local_path: str, offset: int, size: int) -> bytes:
+    with open(local_path, "rb") as handle:
+        handle.seek(offset)
+        return handle.read(size)
+
+
+def _committed(response) -> int:
+    """Bytes Drive has stored, from a ``308`` resumable-upload response."""
+    received = response.headers.get("range")
+    return int(received.rsplit("-", 1)[1]) + 1 if received else 0
+
+
+class AsyncGoogleClient:
+    """Authenticated, pooled HTTP transport shared by the async classes.
+
+    Parameters
+    ----------
+    credentials:
+        google-auth credentials (see :func:`slides.auth.build_services`).
+        Token refreshes run in a worker thread, one at a time.
+    retry:
+        :class:`~slides.retry.RetryPolicy` for every call. Defaults to a
+        single attempt.
+    http_client:
+        An ``httpx.AsyncClient`` to use instead of the default pooled one;
+        the caller then owns closing it.
+    api_endpoint:
+        Base URL (e.g. :mod:`slides.fakeserver`'s) that replaces the Google
+        hosts in every request, like ``BCD_SLIDES_API_ENDPOINT``.
+    """
+
+    def __init__(
+        self,
+        credentials,
+        *,
+        retry: Optional[RetryPolicy] = None,
+        http_client=None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        api_endpoint: Optional[str] = None,
+    ):
+        if httpx is None:
+            raise RuntimeError(
+                'slides.aio needs httpx: pip install "httpx[http2]"'
+            )
+        self.credentials = credentials
+        self.retry = retry or NO_RETRY
+        self._api_endpoint = api_endpoint.rstrip("/") if api_endpoint else None
+        self._owns_http = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=min(max_connections, DEFAULT_MAX_KEEPALIVE),
+            ),
+            timeout=DEFAULT_TIMEOUT,
+        )
+        self._auth_lock = asyncio.Lock()
+
+    @classmethod
+    def from_env(cls, env: dict | None = None, **kwargs: Any) -> "AsyncGoogleClient":
+        """Credentials, retry and rate limit from the usual ``BCD_SLIDES_*`` env."""
+        from slides.auth import AnonymousCredentials, _build_credentials, api_endpoint
+        from slides.ratelimit import TokenBucketLimiter
+
+        if env is None:
+            env = os.environ
+        endpoint = api_endpoint(env)
+        limiter = TokenBucketLimiter.from_env(env)
+        kwargs.setdefault(
+            "retry",
+            RetryPolicy.from_env(
+                env, throttle=limiter.acquire if limiter is not None else None
+            ),
+        )
+        if endpoint:
+            kwargs.setdefault("api_endpoint", endpoint)
+            return cls(AnonymousCredentials(), **kwargs)
+        return cls(_build_credentials(env), **kwargs)
+
+    async def __aenter__(self) -> "AsyncGoogleClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_http:
+            await self._http.aclose()
+
+    # ----- private --------------------------------------------------------- #
+
+    async def _authorize(self, headers: dict[str, str]) -> None:
+        if not self.credentials.valid:
+            async with self._auth_lock:
+                if not self.credentials.valid:
+                    from google_auth_httplib2 import Request
+                    from googleapiclient.http import build_http
+
+                    await asyncio.to_thread(
+                        self.credentials.refresh, Request(build_http())
+                    )
+        self.credentials.apply(headers)
+
+    async def _send(
+        self,
+        http_method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        json_body: Any = None,
+        content: Optional[bytes] = None,
+        content_type: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        raw: bool = False,
+    ) -> Any:
+        headers = dict(headers or {})
+        if content_type:
+            headers["Content-Type"] = content_type
+        await self._authorize(headers)
+        try:
+            response = await self._http.request(
+                http_method,
+                url,
+                params=params,
+                json=json_body,
+                content=content,
+                headers=headers,
+            )
+        except httpx.TransportError as exc:
+            # Dropped connections are transient to RetryPolicy.
+            raise ConnectionError(str(exc)) from exc
+        if response.status_code >= 400:
+            raise AsyncHttpError(
+                response.status_code,
+                response.headers.items(),
+                response.content,
+                http_method,
+                url,
+            )
+        if raw:
+            return response
+        return response.json() if response.content else {}
+
+    def _resolve(self, url: str) -> str:
+        if self._api_endpoint is not None:
+            for google_root in _GOOGLE_ROOTS:
+                if url.startswith(google_root):
+                    return self._api_endpoint + url[len(google_root) :]
+        return url
+
+    # ----- public ---------------------------------------------------------- #
+
+    async def request(
+        self,
+        http_method: str,
+        url: str,
+        *,
+        method: str,
+        params: Optional[dict] = None,
+        json_body: Any = None,
+        content: Optional[bytes] = None,
+        content_type: Optional[str] = None,
+        headers: Optional[dict[str, str]] = None,
+        raw: bool = False,
+        idempotent: bool = True,
+        recover: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        """One API call under :attr:`retry`. ``method`` is e.g. ``drive.files.list``.
+
+        Returns the decoded JSON body, or the ``httpx.Response`` itself when
+        ``raw`` is set.
+        """
+        url = self._resolve(url)
+        return await self.retry.acall(
+            lambda: self._send(
+                http_method,
+                url,
+                params=params,
+                json_body=json_body,
+                content=content,
+                content_type=content_type,
+                headers=headers,
+                raw=raw,
+            ),
+            method=method,
+            idempotent=idempotent,
+            recover=recover,
+        )
+
+    async def resumable_upload(
+        self,
+        url: str,
+        local_path: str,
+        mimetype: str,
+        *,
+        method: str,
+        metadata: dict,
+        params: Optional[dict] = None,
+    ) -> dict:
+        """Send ``local_path`` with Drive's resumable protocol; returns the file.
+
+        Chunks are :func:`slides.uploads.chunk_size` bytes, read one at a
+        time, so large decks are never held in memory whole. Each chunk runs
+        under :attr:`retry`; after a failed one Drive is asked for the
+        committed range first, so the file is created at most once. Unlike
+        the CLI path the session URI is not saved for a later run to resume.
+        """
+        size = (await asyncio.to_thread(os.stat, local_path)).st_size
+        session = await self.request(
+            "POST",
+            url,
+            method=method,
+            params={**(params or {}), "uploadType": "resumable"},
+            json_body=metadata,
+            headers={
+                "X-Upload-Content-Type": mimetype,
+                "X-Upload-Content-Length": str(size),
+            },
+            raw=True,
+        )
+        location = self._resolve(session.headers["location"])
+        step = chunk_size()
+        state = {"offset": 0, "resync": False}
+
+        async def _put_chunk():
+            if state["resync"]:
+                probe = await self._send(
+                    "PUT",
+                    location,
+                    content=b"",
+                    headers={"Content-Range": f"bytes */{size}"},
+                    raw=True,
+                )
+                if probe.status_code != 308:
+                    return probe  # the failed chunk was the last one and landed
+                state["offset"] = _committed(probe)
+            state["resync"] = True
+            start = state["offset"]
+            chunk = await asyncio.to_thread(_read_chunk, local_path, start, step)
+            response = await self._send(
+                "PUT",
+                location,
+                content=chunk,
+                headers={
+                    "Content-Range": f"bytes {start}-{start + len(chunk) - 1}/{size}"
+                },
+                raw=True,
+            )
+            state["resync"] = False
+            return response
+
+        label = Path(local_path).name
+        while True:
+            response = await self.retry.acall(
+                _put_chunk,
+                method=method,
+                detail={"upload": label, "offset": state["offset"]},
+            )
+            if response.status_code != 308:
+                return response.json() if response.content else {}
+            state["offset"] = _committed(response)
+
+
+class AsyncSlidesRunner:
+    """Coroutine version of :class:`~slides.runner.SlidesRunner`.
+
+    Parameters
+    ----------
+    client:
+        :class:`AsyncGoogleClient`; share one across runners and mirrors.
+    """
+
+    def __init__(self, client: AsyncGoogleClient):
+        self._client = client
+
+    @property
+    def retry(self) -> RetryPolicy:
+        return self._client.retry
+
+    # ----------------------------------------------------------------- Slides
+
+    async def create_deck(self, title: str) -> str:
+        """Create a blank Slides deck and return its presentation id."""
+        response = await self._client.request(
+            "POST",
+            f"{SLIDES_ENDPOINT}/presentations",
+            method="slides.presentations.create",
+            json_body={"title": title},
+            idempotent=False,
+        )
+        return response["presentationId"]
+
+    async def apply_batch_update(
+        self,
+        deck_id: str,
+        requests: list[dict],
+        *,
+        chunked: bool = False,
+        max_requests: int = DEFAULT_BATCH_MAX_REQUESTS,
+        max_bytes: int = DEFAULT_BATCH_MAX_BYTES,
+    ) -> dict[str, Any]:
+        """See :meth:`SlidesRunner.apply_batch_update`."""
+        if chunked:
+            return await self.apply_batch_update_chunked(
+                deck_id, requests, max_requests=max_requests, max_bytes=max_bytes
+            )
+        return await self._batch_update(deck_id, {"requests": requests}, False)
+
+    async def apply_batch_update_chunked(
+        self,
+        deck_id: str,
+        requests: Iterable[dict],
+        *,
+        max_requests: int = DEFAULT_BATCH_MAX_REQUESTS,
+        max_bytes: int = DEFAULT_BATCH_MAX_BYTES,
+        required_revision_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """See :meth:`SlidesRunner.apply_batch_update_chunked`."""
+        replies: list[dict] = []
+        write_control: Optional[dict] = None
+        revision = required_revision_id
+        batch_count = 0
+        for chunk in _chunks_reporting_progress(
+            requests, replies, max_requests=max_requests, max_bytes=max_bytes
+        ):
+            body: dict[str, Any] = {"requests": chunk}
+            if revision:
+                body["writeControl"] = {"requiredRevisionId": revision}
+            try:
+                response = await self._batch_update(deck_id, body, bool(revision))
+            except Exception as exc:  # noqa: BLE001 — re-raised with progress
+                raise BatchUpdateChunkError(len(replies), replies, exc) from exc
+            batch_count += 1
+            chunk_replies = list(response.get("replies", []))
+            chunk_replies += [{}] * (len(chunk) - len(chunk_replies))
+            replies.extend(chunk_replies)
+            write_control = response.get("writeControl") or write_control
+            revision = (write_control or {}).get("requiredRevisionId")
+        merged: dict[str, Any] = {
+            "presentationId": deck_id,
+            "replies": replies,
+            "batchCount": batch_count,
+        }
+        if write_control is not None:
+            merged["writeControl"] = write_control
+        return merged
+
+    async def _batch_update(self, deck_id: str, body: dict, idempotent: bool) -> dict:
+        return await self._client.request(
+            "POST",
+            f"{SLIDES_ENDPOINT}/presentations/{deck_id}:batchUpdate",
+            method="slides.presentations.batchUpdate",
+            json_body=body,
+            idempotent=idempotent,
+        )
+
+    # ------------------------------------------------------------------ Drive
+
+    async def move_to_folder(self, deck_id: str, folder_id: str) -> None:
+        """See :meth:`SlidesRunner.move_to_folder`."""
+        metadata = await self._client.request(
+            "GET",
+            f"{DRIVE_ENDPOINT}/files/{deck_id}",
+            method="drive.files.get",
+            params={"fields": "parents"},
+        )
+        await self._client.request(
+            "PATCH",
+            f"{DRIVE_ENDPOINT}/files/{deck_id}",
+            method="drive.files.update",
+            params={
+                "addParents": folder_id,
+                "removeParents": ",".join(metadata.get("parents", [])),
+                "fields": "id, parents",
+            },
+            json_body={},
+        )
+
+    async def upload_file(
+        self,
+        folder_id: str,
+        local_path: str,
+        mimetype: str,
+        *,
+        name: Optional[str] = None,
+        convert_to: Optional[str] = None,
+    ) -> str:
+        """Upload ``local_path`` into ``folder_id``. Returns file id.
+
+        ``convert_to`` sets the target ``mimeType`` (e.g. native Slides for a
+        PPTX). Files at or above :func:`slides.uploads.resumable_threshold`
+        go up in chunks (:meth:`AsyncGoogleClient.resumable_upload`), smaller
+        ones in one multipart request. Like the CLI upload helpers, a failed
+        attempt is only retried after checking that it did not land; a result
+        in the trash raises :class:`~slides.runner.StaleFolderError`.
+        """
+        name = name or Path(local_path).name
+        metadata: dict[str, Any] = {"name": name, "parents": [folder_id]}
+        if convert_to:
+            metadata["mimeType"] = convert_to
+        size = (await asyncio.to_thread(os.stat, local_path)).st_size
+        if size >= resumable_threshold():
+            created = await self._client.resumable_upload(
+                f"{DRIVE_UPLOAD_ENDPOINT}/files",
+                local_path,
+                mimetype,
+                method="drive.files.create",
+                metadata=metadata,
+                params={"fields": "id, trashed"},
+            )
+        else:
+            created = await self._multipart_upload(
+                folder_id, local_path, mimetype, metadata
+            )
+        if created.get("trashed") is True:
+            raise StaleFolderError(folder_id)
+        return created["id"]
+
+    async def _multipart_upload(
+        self, folder_id: str, local_path: str, mimetype: str, metadata: dict
+    ) -> dict:
+        name = metadata["name"]
+        media = await asyncio.to_thread(Path(local_path).read_bytes)
+        body, content_type = _multipart_related(metadata, media, mimetype)
+        started = datetime.now(timezone.utc)
+        escaped = name.replace("'", r"\'")
+        stamp = (started - timedelta(seconds=5)).strftime("%Y-%m-%dT%H:%M:%S")
+
+        async def _recover() -> Optional[dict]:
+            response = await self._client.request(
+                "GET",
+                f"{DRIVE_ENDPOINT}/files",
+                method="drive.files.list",
+                params={
+                    "q": (
+                        f"name = '{escaped}' and '{folder_id}' in parents "
+                        f"and trashed = false and createdTime > '{stamp}'"
+                    ),
+                    "fields": "files(id, trashed)",
+                    "pageSize": 1,
+                },
+            )
+            files = response.get("files", [])
+            return files[0] if files else None
+
+        return await self._client.request(
+            "POST",
+            f"{DRIVE_UPLOAD_ENDPOINT}/files",
+            method="drive.files.create",
+            params={"uploadType": "multipart", "fields": "id, trashed"},
+            content=body,
+            content_type=content_type,
+            idempotent=False,
+            recover=_recover,
+        )
+
+    # ------------------------------------------------------------------- Pure
+
+    deck_url = staticmethod(SlidesRunner.deck_url)
+
+
+class AsyncDriveFolderMirror:
+    """Coroutine version of :class:`~slides.runner.DriveFolderMirror`.
+
+    Same folder convention, cache and stale-id rules. Concurrent calls that
+    resolve the same ``(parent, name)`` wait for each other, so mirroring
+    many renders at once never creates duplicate intermediate folders.
+    Without a ``cache`` an in-memory :class:`~slides.cache.FolderIdCache` is
+    used, so the waiters reuse the first caller's result.
+    """
+
+    FOLDER_MIME = DriveFolderMirror.FOLDER_MIME
+    _kind_subfolder = staticmethod(DriveFolderMirror._kind_subfolder)
+
+    def __init__(
+        self,
+        client: AsyncGoogleClient,
+        root_id: Optional[str] = None,
+        cache: Optional[FolderIdCache] = None,
+    ):
+        self._client = client
+        self._root_id = root_id or "root"
+        self._cache = cache if cache is not None else FolderIdCache()
+        #: ``(parent, name)`` -> [lock, callers holding or awaiting it].
+        self._locks: dict[tuple[str, str], list] = {}
+
+    # ----- private --------------------------------------------------------- #
+
+    @contextlib.asynccontextmanager
+    async def _folder_lock(self, key: tuple[str, str]) -> AsyncIterator[None]:
+        """Serialize resolvers of one ``(parent, name)``; dropped when idle."""
+        entry = self._locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[key]
+
+    def _stale(self, folder_id: str) -> None:
+        self._cache.invalidate(folder_id)
+        raise StaleFolderError(folder_id)
+
+    async def _lookup_folder(self, name: str, parent_id: str) -> Optional[str]:
+        cached = self._cache.get(parent_id, name)
+        if cached is not None:
+            return cached
+        escaped = name.replace("'", r"\'")
+        response = await self._client.request(
+            "GET",
+            f"{DRIVE_ENDPOINT}/files",
+            method="drive.files.list",
+            params={
+                "q": (
+                    f"name = '{escaped}' and '{parent_id}' in parents "
+                    f"and mimeType = '{self.FOLDER_MIME}' and trashed = false"
+                ),
+                "fields": "files(id, name)",
+                "pageSize": 1,
+            },
+        )
+        files = response.get("files", [])
+        if not files:
+            return None
+        folder_id = files[0]["id"]
+        self._cache.put(parent_id, name, folder_id)
+        return folder_id
+
+    async def _create_folder(self, name: str, parent_id: str) -> str:
+        """See :meth:`DriveFolderMirror._create_folder`."""
+
+        async def _recover() -> Optional[dict]:
+            found = await self._lookup_folder(name, parent_id)
+            return {"id": found} if found is not None else None
+
+        try:
+            created = await self._client.request(
+                "POST",
+                f"{DRIVE_ENDPOINT}/files",
+                method="drive.files.create",
+                params={"fields": "id, trashed"},
+                json_body={
+                    "name": name,
+                    "mimeType": self.FOLDER_MIME,
+                    "parents": [parent_id],
+                },
+                idempotent=False,
+                recover=_recover,
+            )
+        except Exception as exc:  # noqa: BLE001 — match runner.py handling
+            if _http_status(exc) == 404:
+                self._stale(parent_id)
+            raise
+        if created.get("trashed") is True:
+            self._stale(parent_id)
+        self._cache.put(parent_id, name, created["id"])
+        return created["id"]
+
+    async def _resolve_level(
+        self, name: str, parent_id: str, parent_is_new: bool, create: bool
+    ) -> tuple[Optional[str], bool]:
+        """One step of :func:`~slides.runner._walk_path`: find, then create.
+
+        Creating holds the ``(parent, name)`` lock from the lookup on, and a
+        waiter re-reads the cache first, so only one caller ever creates.
+        """
+        if not create:
+            return await self._lookup_folder(name, parent_id), False
+        async with self._folder_lock((parent_id, name)):
+            if parent_is_new:
+                folder_id = self._cache.get(parent_id, name)
+            else:
+                folder_id = await self._lookup_folder(name, parent_id)
+            if folder_id is not None:
+                return folder_id, False
+            return await self._create_folder(name, parent_id), True
+
+    async def _resolve_path_once(
+        self, names: tuple[str, ...], create: bool
+    ) -> tuple[Optional[str], ...]:
+        walk = _walk_path(names, self._root_id, self._cache)
+        reply = None
+        while True:
+            try:
+                step = walk.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply = await self._resolve_level(*step, create)
+
+    async def _find_kind_folder(self, brand_name: str, kind: str) -> Optional[str]:
+        path = await self.resolve_path(
+            (BRAND_CONTENT_ROOT_NAME, brand_name, self._kind_subfolder(kind))
+        )
+        return path[-1]
+
+    # ----- public: brand chain -------------------------------------------- #
+
+    async def resolve_path(
+        self, names: Iterable[str], *, create: bool = False
+    ) -> tuple[Optional[str], ...]:
+        """See :meth:`DriveFolderMirror.resolve_path`.
+
+        The walk itself is shared with the synchronous mirror, so both issue
+        the same lookups. A :class:`StaleFolderError` re-runs it once.
+        """
+        names = tuple(names)
+        try:
+            return await self._resolve_path_once(names, create)
+        except StaleFolderError:
+            return await self._resolve_path_once(names, create)
+
+    async def ensure_brand_folder(self, brand_name: str) -> str:
+        """Create or find ``{root}/brand-content/{brand_name}/``."""
+        path = await self.resolve_path(
+            (BRAND_CONTENT_ROOT_NAME, brand_name), create=True
+        )
+        return path[-1]
+
+    async def ensure_presentations_folder(self, brand_name: str) -> str:
+        """Create or find ``brand-content/{brand}/presentations/``."""
+        path = await self.resolve_path(
+            (BRAND_CONTENT_ROOT_NAME, brand_name, PRESENTATIONS_SUBFOLDER),
+            create=True,
+        )
+        return path[-1]
+
+    async def ensure_templates_folder(self, brand_name: str) -> str:
+        """Create or find ``brand-content/{brand}/templates/``."""
+        path = await self.resolve_path(
+            (BRAND_CONTENT_ROOT_NAME, brand_name, TEMPLATES_SUBFOLDER),
+            create=True,
+        )
+        return path[-1]
+
+    async def ensure_render_folder(
+        self,
+        brand_name: str,
+        kind: Literal["presentations", "templates"],
+        render_slug: str,
+    ) -> str:
+        """Create or find ``brand-content/{brand}/{kind}/{render_slug}/``."""
+        path = await self.resolve_path(
+            (
+                BRAND_CONTENT_ROOT_NAME,
+                brand_name,
+                self._kind_subfolder(kind),
+                render_slug,
+            ),
+            create=True,
+        )
+        return path[-1]
+
+    async def find_render_folder(
+        self, brand_name: str, kind: str, render_slug: str
+    ) -> Optional[str]:
+        """Render folder id if it exists (non-trashed), else None. Never creates."""
+        path = await self.resolve_path(
+            (
+                BRAND_CONTENT_ROOT_NAME,
+                brand_name,
+                self._kind_subfolder(kind),
+                render_slug,
+            )
+        )
+        return path[-1]
+
+    async def find_render_folders(
+        self, brand_name: str, kind: str, render_slugs: Iterable[str]
+    ) -> dict[str, Optional[str]]:
+        """See :meth:`DriveFolderMirror.find_render_folders`.
+
+        The slug lookups run concurrently over the shared client instead of
+        as one Drive batch request.
+        """
+        slugs = list(render_slugs)
+        kind_id = await self._find_kind_folder(brand_name, kind)
+        if not kind_id:
+            return {slug: None for slug in slugs}
+        found = await asyncio.gather(
+            *(self._lookup_folder(slug, kind_id) for slug in slugs)
+        )
+        return dict(zip(slugs, found))
+
+    async def list_render_folder_names(
+        self, brand_name: str, kind: str, name_contains: str
+    ) -> list[str]:
+        """See :meth:`DriveFolderMirror.list_render_folder_names`."""
+        kind_id = await self._find_kind_folder(brand_name, kind)
+        if not kind_id:
+            return []
+        escaped = name_contains.replace("'", r"\'")
+        params: dict[str, Any] = {
+            "q": (
+                f"name contains '{escaped}' and '{kind_id}' in parents "
+                f"and mimeType = '{self.FOLDER_MIME}' and trashed = false"
+            ),
+            "fields": "nextPageToken, files(name)",
+            "pageSize": LIST_PAGE_SIZE,
+        }
+        names: list[str] = []
+        while True:
+            response = await self._client.request(
+                "GET",
+                f"{DRIVE_ENDPOINT}/files",
+                method="drive.files.list",
+                params=params,
+            )
+            names.extend(f["name"] for f in response.get("files", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return names
+            params = {**params, "pageToken": page_token}
+
+    async def trash_render_folders(self, folder_ids: Iterable[str]) -> None:
+        """See :meth:`DriveFolderMirror.trash_render_folders`.
+
+        The updates run concurrently; the first non-404 error is raised once
+        all of them have finished.
+        """
+        results = await asyncio.gather(
+            *(
+                self.trash_render_folder(folder_id)
+                for folder_id in dict.fromkeys(folder_ids)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def trash_render_folder(self, folder_id: str) -> None:
+        """Soft-delete a render folder; a 404 is swallowed."""
+        self._cache.invalidate(folder_id)
+        try:
+            await self._client.request(
+                "PATCH",
+                f"{DRIVE_ENDPOINT}/files/{folder_id}",
+                method="drive.files.update",
+                json_body={"trashed": True},
+            )
+        except Exception as exc:  # noqa: BLE001 — match runner.py handling
+            if _http_status(exc) == 404:
+                return
+            raise
+
+    def invalidate_cache(self, folder_id: Optional[str] = None) -> int:
+        """Evict ``folder_id`` and its cached descendants (all when None)."""
+        return self._cache.invalidate(folder_id)
+
+    def cached_brand_folder(self, brand_name: str) -> Optional[str]:
+        """Cached id of ``brand-content/{brand_name}/`` or None. No Drive call."""
+        brand_content_id = self._cache.get(self._root_id, BRAND_CONTENT_ROOT_NAME)
+        if brand_content_id is None:
+            return None
+        return self._cache.get(brand_content_id, brand_name)
+
+    folder_url = staticmethod(DriveFolderMirror.folder_url)
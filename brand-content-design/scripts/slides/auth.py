@@ -9,16 +9,26 @@ Two modes per ``brand-content-design/references/slides-credentials.md``:
 
 Service account wins when both are configured. An incomplete OAuth trio is a
 hard error — the runner refuses to start rather than silently falling back.
+
+``BCD_SLIDES_API_ENDPOINT`` (e.g. ``http://127.0.0.1:8089``) sends every call
+to that host instead of Google, with anonymous credentials — for
+:mod:`slides.fakeserver`. Real credentials are never sent to it.
 """
 
 from __future__ import annotations
 
+import functools
+import json
 import os
-from typing import Literal, Tuple
+from typing import Any, Literal, Optional, Tuple
 
+from google.auth.credentials import AnonymousCredentials
 from google.oauth2.credentials import Credentials as OAuthCredentials
 from google.oauth2.service_account import Credentials as SACredentials
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+
+from slides.tokencache import TokenCache, token_cache_enabled
 
 
 #: Default OAuth scopes — narrowest workable set per the credentials reference.
@@ -31,10 +41,13 @@ SCOPES: list[str] = [
 # Re-exported so unit tests can monkey-patch via ``patch.object(auth, ...)``.
 __all__ = [
     "SCOPES",
+    "AnonymousCredentials",
     "OAuthCredentials",
     "SACredentials",
-    "build",
+    "api_endpoint",
+    "build_from_document",
     "build_services",
+    "discovery_document",
     "resolve_mode",
 ]
 
@@ -74,32 +87,85 @@ def resolve_mode(env: dict | None = None) -> Literal["service-account", "oauth"]
 
 
 def _build_credentials(env: dict):
-    """Build google-auth credentials per the resolved mode."""
+    """Build google-auth credentials per the resolved mode.
+
+    Both modes go through :class:`slides.tokencache.TokenCache` (unless
+    ``BCD_SLIDES_TOKEN_CACHE=0``), so a still-valid access token minted by an
+    earlier process is reused instead of refreshed.
+    """
     mode = resolve_mode(env)
     if mode == "service-account":
-        return SACredentials.from_service_account_file(
+        creds = SACredentials.from_service_account_file(
             env["BCD_SLIDES_SA_KEY_FILE"], scopes=SCOPES
         )
-    # OAuth refresh-token: token=None forces refresh on first API call.
-    return OAuthCredentials(
-        token=None,
-        refresh_token=env["BCD_SLIDES_OAUTH_REFRESH_TOKEN"],
-        token_uri="https://oauth2.googleapis.com/token",
-        client_id=env["BCD_SLIDES_OAUTH_CLIENT_ID"],
-        client_secret=env["BCD_SLIDES_OAUTH_CLIENT_SECRET"],
-        scopes=SCOPES,
-    )
+    else:
+        # OAuth refresh-token: token=None forces refresh on first API call
+        # unless the token cache has one.
+        creds = OAuthCredentials(
+            token=None,
+            refresh_token=env["BCD_SLIDES_OAUTH_REFRESH_TOKEN"],
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id=env["BCD_SLIDES_OAUTH_CLIENT_ID"],
+            client_secret=env["BCD_SLIDES_OAUTH_CLIENT_SECRET"],
+            scopes=SCOPES,
+        )
+    if token_cache_enabled(env):
+        TokenCache.for_credentials(creds, env).attach(creds)
+    return creds
+
+
+@functools.lru_cache(maxsize=None)
+def discovery_document(api: str, version: str) -> dict[str, Any]:
+    """Parsed discovery document for ``api``/``version``, once per process.
+
+    Read from the copy packaged with ``google-api-python-client`` (2.x ships
+    one per API), so it is versioned with the pinned library and never
+    fetched over the network. Raises :class:`RuntimeError` if the installed
+    library has no document for the API.
+    """
+    raw = get_static_doc(api, version)
+    if raw is None:
+        raise RuntimeError(
+            f"google-api-python-client ships no discovery document for "
+            f"{api} {version}; upgrade it (see requirements.txt)."
+        )
+    return json.loads(raw)
+
+
+def api_endpoint(env: dict | None = None) -> Optional[str]:
+    """``BCD_SLIDES_API_ENDPOINT`` without a trailing slash, or None."""
+    if env is None:
+        env = os.environ
+    value = env.get("BCD_SLIDES_API_ENDPOINT", "").strip().rstrip("/")
+    return value or None
+
+
+def _pointed_at(document: dict[str, Any], endpoint: Optional[str]) -> dict[str, Any]:
+    """``document`` with every URL root (API, upload, batch) on ``endpoint``.
+
+    ``client_options.api_endpoint`` would only move the API base; uploads
+    keep their https scheme and batches keep Google's host.
+    """
+    if endpoint is None:
+        return document
+    return {**document, "rootUrl": f"{endpoint}/", "mtlsRootUrl": f"{endpoint}/"}
 
 
 def build_services(env: dict | None = None) -> Tuple[object, object]:
     """Return ``(slides_service, drive_service)``.
 
-    Both are ``googleapiclient.discovery.Resource`` instances built with
-    ``cache_discovery=False`` to avoid ``oauth2client`` cache warnings.
+    Both are ``googleapiclient.discovery.Resource`` instances built offline
+    with ``build_from_document`` from :func:`discovery_document`. Repeat
+    calls in one process (daemon, batch) skip reading and parsing the JSON.
     """
     if env is None:
         env = os.environ
-    creds = _build_credentials(env)
-    slides_service = build("slides", "v1", credentials=creds, cache_discovery=False)
-    drive_service = build("drive", "v3", credentials=creds, cache_discovery=False)
+    endpoint = api_endpoint(env)
+    creds = AnonymousCredentials() if endpoint else _build_credentials(env)
+    slides_service = build_from_document(
+        _pointed_at(discovery_document("slides", "v1"), endpoint), credentials=creds
+    )
+    drive_service = build_from_document(
+        _pointed_at(discovery_document("drive", "v3"), endpoint), credentials=creds
+    )
     return slides_service, drive_service
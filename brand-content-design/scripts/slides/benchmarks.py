@@ -0,0 +1,289 @@
+"""Benchmarks for the mirror pipeline, run against :mod:`slides.fakeserver`.
+
+Each scenario drives the real CLI code (real googleapiclient services over
+HTTP) against a fresh fake server with ``latency`` seconds per round trip,
+and reports wall time next to what actually matters for Google's latency:
+HTTP round trips and API calls per operation.
+
+Round-trip and call counts are deterministic, so they are compared against
+``benchmarks_baseline.json`` next to this file; a scenario that needs more
+of either than its baseline is a regression. Wall time is reported only.
+
+    python -m slides.benchmarks                    # report + regression check
+    python -m slides.benchmarks --latency 0.1      # slower simulated network
+    python -m slides.benchmarks --update-baseline  # after an intended change
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from slides import cli
+from slides.fakeserver import FakeGoogleServer
+
+
+#: Committed round-trip / call counts per scenario.
+BASELINE_PATH = Path(__file__).with_name("benchmarks_baseline.json")
+
+#: Default simulated per-round-trip latency, seconds.
+DEFAULT_LATENCY = 0.02
+
+#: Env vars a benchmark run must not inherit from the caller's shell.
+_CLEARED_ENV = (
+    "BCD_SLIDES_SA_KEY_FILE",
+    "BCD_SLIDES_OAUTH_CLIENT_ID",
+    "BCD_SLIDES_OAUTH_CLIENT_SECRET",
+    "BCD_SLIDES_OAUTH_REFRESH_TOKEN",
+    "BRAND_CONTENT_DRIVE_ROOT_ID",
+    "BCD_SLIDES_RATE_LIMIT",
+    "BCD_SLIDES_DAEMON",
+    "BCD_SLIDES_FOLDER_CACHE",
+    "BCD_SLIDES_RESUMABLE_THRESHOLD_MB",
+    "BCD_SLIDES_UPLOAD_CHUNK_MB",
+)
+
+
+@contextmanager
+def _environment(overrides: dict[str, str]) -> Iterator[None]:
+    saved = dict(os.environ)
+    for name in _CLEARED_ENV:
+        os.environ.pop(name, None)
+    os.environ.update(overrides)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+class BenchContext:
+    """What a scenario gets: a runner on a fresh fake server and a scratch dir."""
+
+    def __init__(self, server: FakeGoogleServer, workdir: Path):
+        self.server = server
+        self.workdir = workdir
+        self.runner = cli._build_runner()
+        self.result: Optional[dict[str, Any]] = None
+
+    def command(self, name: str, payload: dict) -> dict[str, Any]:
+        """Run a CLI command; raise if it failed."""
+        code, output = cli.run_command(self.runner, name, payload)
+        if code != 0:
+            raise RuntimeError(f"{name} failed: {output}")
+        return output
+
+    def new_process(self) -> None:
+        """Forget in-process state, as if the next command ran in a new CLI."""
+        cli._mirror_slot = None
+        self.runner = cli._build_runner()
+
+    def render_dir(self, slug: str = "launch", *, pdf: bytes = b"%PDF-1") -> dict:
+        local = self.workdir / slug
+        local.mkdir(exist_ok=True)
+        (local / f"{slug}.pptx").write_bytes(b"PPTX" * 2048)
+        (local / f"{slug}.pdf").write_bytes(pdf)
+        (local / "outline.md").write_text(f"# {slug}\n")
+        return {
+            "brand": "acme",
+            "render_slug": slug,
+            "local_dir": str(local),
+            "pptx_path": str(local / f"{slug}.pptx"),
+            "deck_title": slug,
+            "pdf_path": str(local / f"{slug}.pdf"),
+            "outline_path": str(local / "outline.md"),
+        }
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        """Count round trips, calls and wall time for the enclosed block."""
+        self.server.reset_counters()
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        self.result = {
+            "round_trips": self.server.round_trips,
+            "api_calls": sum(self.server.calls.values()),
+            "calls": dict(sorted(self.server.calls.items())),
+            "wall_ms": round(elapsed * 1000, 1),
+        }
+
+
+# ----- scenarios ----------------------------------------------------------- #
+
+
+def _ensure_cold(ctx: BenchContext) -> None:
+    payload = {"brand": "acme", "kind": "presentations", "render_slug": "launch"}
+    with ctx.measure():
+        ctx.command("ensure_render_folder", payload)
+
+
+def _ensure_warm(ctx: BenchContext) -> None:
+    ctx.command(
+        "ensure_render_folder",
+        {"brand": "acme", "kind": "presentations", "render_slug": "first"},
+    )
+    ctx.new_process()
+    payload = {"brand": "acme", "kind": "presentations", "render_slug": "launch"}
+    with ctx.measure():
+        ctx.command("ensure_render_folder", payload)
+
+
+def _mirror(ctx: BenchContext) -> None:
+    payload = ctx.render_dir()
+    with ctx.measure():
+        ctx.command("mirror_presentation", payload)
+
+
+def _replace(strategy: str) -> Callable[[BenchContext], None]:
+    def _scenario(ctx: BenchContext) -> None:
+        payload = ctx.render_dir()
+        ctx.command("mirror_presentation", payload)
+        ctx.new_process()
+        # One artifact changed, the usual re-render.
+        Path(payload["pdf_path"]).write_bytes(b"%PDF-2")
+        with ctx.measure():
+            ctx.command("replace_render", {**payload, "strategy": strategy})
+
+    return _scenario
+
+
+def _batch_update(size: int) -> Callable[[BenchContext], None]:
+    def _scenario(ctx: BenchContext) -> None:
+        deck_id = ctx.command("create_deck", {"title": "bench"})["deck_id"]
+        requests = [
+            {"createSlide": {"objectId": f"slide_{i}"}} for i in range(size)
+        ]
+        with ctx.measure():
+            ctx.command(
+                "apply_batch_update",
+                {"deck_id": deck_id, "requests": requests, "chunked": True},
+            )
+
+    return _scenario
+
+
+#: Scenario name → body. Names are the keys of the baseline file.
+SCENARIOS: dict[str, Callable[[BenchContext], None]] = {
+    "ensure_render_folder.cold": _ensure_cold,
+    "ensure_render_folder.warm": _ensure_warm,
+    "mirror_presentation": _mirror,
+    "replace_render.trash": _replace("trash"),
+    "replace_render.incremental": _replace("incremental"),
+    "replace_render.keep_alongside": _replace("keep_alongside"),
+    "apply_batch_update.10": _batch_update(10),
+    "apply_batch_update.100": _batch_update(100),
+    "apply_batch_update.1000": _batch_update(1000),
+}
+
+
+def run_scenario(name: str, *, latency: float = DEFAULT_LATENCY) -> dict[str, Any]:
+    """Run one scenario in isolation (own server, cache dir and env)."""
+    with tempfile.TemporaryDirectory(prefix="slides-bench-") as tmp:
+        with FakeGoogleServer(latency=latency) as server, _environment(
+            {
+                "BCD_SLIDES_API_ENDPOINT": server.endpoint,
+                "BCD_SLIDES_CACHE_DIR": str(Path(tmp) / "cache"),
+            }
+        ):
+            cli._mirror_slot = None
+            try:
+                ctx = BenchContext(server, Path(tmp))
+                SCENARIOS[name](ctx)
+            finally:
+                cli._mirror_slot = None
+    if ctx.result is None:
+        raise RuntimeError(f"scenario {name!r} never called measure()")
+    return ctx.result
+
+
+def run_all(
+    names: Optional[list[str]] = None, *, latency: float = DEFAULT_LATENCY
+) -> dict[str, dict[str, Any]]:
+    return {name: run_scenario(name, latency=latency) for name in names or SCENARIOS}
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, dict[str, int]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def regressions(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, int]]
+) -> list[str]:
+    """One message per scenario that needs more round trips or calls."""
+    problems = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            problems.append(f"{name}: no baseline (run with --update-baseline)")
+            continue
+        for metric in ("round_trips", "api_calls"):
+            if result[metric] > expected[metric]:
+                problems.append(
+                    f"{name}: {metric} {result[metric]} > baseline {expected[metric]}"
+                )
+    return problems
+
+
+def write_baseline(
+    results: dict[str, dict[str, Any]], path: Path = BASELINE_PATH
+) -> None:
+    counts = {
+        name: {"round_trips": r["round_trips"], "api_calls": r["api_calls"]}
+        for name, r in sorted(results.items())
+    }
+    path.write_text(json.dumps(counts, indent=2) + "\n", encoding="utf-8")
+
+
+def _report(results: dict[str, dict[str, Any]], baseline: dict, out) -> None:
+    out.write(f"{'scenario':32} {'trips':>6} {'calls':>6} {'base':>6} {'ms':>9}\n")
+    for name, r in results.items():
+        base = baseline.get(name, {}).get("round_trips", "-")
+        out.write(
+            f"{name:32} {r['round_trips']:>6} {r['api_calls']:>6} "
+            f"{base:>6} {r['wall_ms']:>9.1f}\n"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="slides.benchmarks")
+    parser.add_argument("scenarios", nargs="*", metavar="scenario")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY)
+    parser.add_argument("--json", action="store_true", help="print raw results")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(
+            f"unknown scenario(s) {', '.join(unknown)}; "
+            f"pick from {', '.join(SCENARIOS)}"
+        )
+
+    results = run_all(args.scenarios or None, latency=args.latency)
+    if args.update_baseline:
+        write_baseline({**load_baseline(), **results})
+        return 0
+    baseline = load_baseline()
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        _report(results, baseline, sys.stdout)
+    problems = regressions(results, baseline)
+    for problem in problems:
+        print(f"REGRESSION {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
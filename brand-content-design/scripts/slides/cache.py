@@ -0,0 +1,167 @@
+"""On-disk caches shared by the Slides + Drive runner.
+
+Everything lives under one per-user directory so a single ``rm -rf`` resets
+all of it:
+
+* ``BCD_SLIDES_CACHE_DIR`` if set, else
+* ``$XDG_CACHE_HOME/brand-content-design/slides``, else
+* ``~/.cache/brand-content-design/slides``.
+
+:class:`FolderIdCache` maps ``(parent_id, name)`` → Drive folder id for one
+``brand-content`` root so :class:`slides.runner.DriveFolderMirror` can skip
+the ``files.list`` walk on repeat runs. Entries are trusted until a Drive
+call reports the id as deleted (404) or trashed; the mirror then drops the
+stale subtree and re-resolves it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+
+#: Bump when the on-disk shape changes; older files are ignored, not migrated.
+FOLDER_CACHE_VERSION = 1
+
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def default_cache_dir(env: dict | None = None) -> Path:
+    """Return the cache directory per the env-var precedence above."""
+    if env is None:
+        env = os.environ
+    if env.get("BCD_SLIDES_CACHE_DIR"):
+        return Path(env["BCD_SLIDES_CACHE_DIR"])
+    xdg = env.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "brand-content-design" / "slides"
+
+
+def write_json_atomic(path: Path, payload: dict, *, mode: int = 0o644) -> None:
+    """Write ``payload`` as JSON via temp file + rename.
+
+    Readers in other processes see either the old file or the new one, never
+    a partial write.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2, sort_keys=True)
+            fh.write("\n")
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class FolderIdCache:
+    """Persistent ``(parent_id, name) → folder_id`` map for one Drive root.
+
+    Parameters
+    ----------
+    path:
+        JSON file backing the cache. ``None`` keeps the cache in memory only
+        (useful for tests and for callers that want per-process memoization
+        without touching disk).
+
+    The file is loaded lazily on first access and rewritten atomically after
+    every mutation. Concurrent writers are last-writer-wins; a lost entry
+    only costs one extra ``files.list`` on the next run.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = Path(path) if path is not None else None
+        self._folders: Optional[dict[str, dict[str, str]]] = None
+
+    @classmethod
+    def for_root(
+        cls, root_id: Optional[str], env: dict | None = None
+    ) -> "FolderIdCache":
+        """Return the on-disk cache for ``root_id`` (``None`` → My Drive)."""
+        safe = _UNSAFE_FILENAME_RE.sub("_", root_id or "root")
+        return cls(default_cache_dir(env) / f"folders-{safe}.json")
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._path
+
+    # ----- private --------------------------------------------------------- #
+
+    def _load(self) -> dict[str, dict[str, str]]:
+        if self._folders is not None:
+            return self._folders
+        self._folders = {}
+        if self._path is not None and self._path.exists():
+            try:
+                data = json.loads(self._path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("version") == FOLDER_CACHE_VERSION:
+                self._folders = data.get("folders", {})
+        return self._folders
+
+    def _save(self) -> None:
+        if self._path is None:
+            return
+        write_json_atomic(
+            self._path,
+            {"version": FOLDER_CACHE_VERSION, "folders": self._load()},
+        )
+
+    # ----- public ---------------------------------------------------------- #
+
+    def get(self, parent_id: str, name: str) -> Optional[str]:
+        """Return the cached folder id of ``name`` under ``parent_id``."""
+        return self._load().get(parent_id, {}).get(name)
+
+    def put(self, parent_id: str, name: str, folder_id: str) -> None:
+        """Record ``name`` under ``parent_id`` as ``folder_id``."""
+        folders = self._load()
+        if folders.get(parent_id, {}).get(name) == folder_id:
+            return
+        folders.setdefault(parent_id, {})[name] = folder_id
+        self._save()
+
+    def invalidate(self, folder_id: Optional[str] = None) -> int:
+        """Drop ``folder_id`` and every cached descendant of it.
+
+        With no argument the whole cache is cleared. Returns the number of
+        entries removed.
+        """
+        folders = self._load()
+        if folder_id is None:
+            removed = sum(len(children) for children in folders.values())
+            folders.clear()
+        else:
+            doomed = {folder_id}
+            pending = [folder_id]
+            while pending:
+                for child_id in folders.get(pending.pop(), {}).values():
+                    if child_id not in doomed:
+                        doomed.add(child_id)
+                        pending.append(child_id)
+            removed = 0
+            for parent_id in list(folders):
+                if parent_id in doomed:
+                    removed += len(folders.pop(parent_id))
+                    continue
+                children = folders[parent_id]
+                for name in [n for n, fid in children.items() if fid in doomed]:
+                    del children[name]
+                    removed += 1
+                if not children:
+                    del folders[parent_id]
+        if removed:
+            self._save()
+        return removed
@@ -8,6 +8,11 @@ Usage::
     python -m slides.cli create_deck       <<< '{"title": "My deck"}'
     python -m slides.cli apply_batch_update <<< '{"deck_id": "...", "requests": [...]}'
     python -m slides.cli move_to_folder    <<< '{"deck_id": "...", "folder_id": "..."}'
+    python -m slides.cli batch             < records.ndjson
+    python -m slides.cli serve             # long-lived daemon, see slides.daemon
+
+With ``BCD_SLIDES_DAEMON=1`` every command is forwarded to that daemon
+(spawned on demand) instead of authenticating in this process.
 
 PPTX-import path (canonical, 2026-05-26+) — mirror commands also accept a
 ``pptx_path`` instead of a ``deck_id``. When ``pptx_path`` is provided the
@@ -29,27 +34,85 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Optional
-
-from googleapiclient.http import MediaFileUpload
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from slides.auth import build_services
+from slides.cache import FolderIdCache
+from slides.ratelimit import TokenBucketLimiter
+from slides.retry import NO_RETRY, RetryPolicy
 from slides.runner import (
+    DEFAULT_BATCH_MAX_BYTES,
+    DEFAULT_BATCH_MAX_REQUESTS,
     DriveFolderMirror,
     SlidesRunner,
+    StaleFolderError,
+    _http_status,
+    iter_requests_file,
     read_slides_url_file,
     write_slides_url_file,
 )
+from slides.tracing import Tracer, tracing_enabled
+from slides.uploads import (
+    SOURCE_MD5_PROPERTY,
+    chunk_size,
+    file_md5,
+    resumable_threshold,
+    run_resumable_upload,
+    session_key,
+)
 
+if TYPE_CHECKING:
+    from google_auth_httplib2 import AuthorizedHttp
 
-def _make_mirror(drive_service) -> DriveFolderMirror:
-    """Build a :class:`DriveFolderMirror` honoring the env-var root override."""
-    return DriveFolderMirror(
-        drive_service,
-        root_id=os.environ.get("BRAND_CONTENT_DRIVE_ROOT_ID") or None,
+
+def _folder_cache_enabled() -> bool:
+    """``BCD_SLIDES_FOLDER_CACHE=0`` (or ``false``/``off``) disables it."""
+    value = os.environ.get("BCD_SLIDES_FOLDER_CACHE", "1").strip().lower()
+    return value not in ("0", "false", "off", "no")
+
+
+#: Last mirror built by :func:`_make_mirror` and the inputs it was built
+#: from. Long-lived modes (``serve``) reuse one Drive service across many
+#: commands, so they also get one mirror and its in-memory folder cache.
+_mirror_slot: Optional[tuple[object, tuple, DriveFolderMirror]] = None
+
+
+def _make_mirror(
+    drive_service, retry: Optional[RetryPolicy] = None
+) -> DriveFolderMirror:
+    """Build a :class:`DriveFolderMirror` honoring the env-var root override.
+
+    The persistent folder-id cache (``slides.cache``) is on by default; set
+    ``BCD_SLIDES_FOLDER_CACHE=0`` to keep it in memory only. Repeat calls
+    with the same Drive service and settings return the same mirror.
+    ``retry`` is normally the owning runner's policy.
+    """
+    global _mirror_slot
+    root_id = os.environ.get("BRAND_CONTENT_DRIVE_ROOT_ID") or None
+    settings = (
+        root_id,
+        _folder_cache_enabled(),
+        os.environ.get("BCD_SLIDES_CACHE_DIR"),
     )
+    if (
+        _mirror_slot is not None
+        and _mirror_slot[0] is drive_service
+        and _mirror_slot[1] == settings
+    ):
+        return _mirror_slot[2]
+    # With the disk cache off, still resolve each folder once per process.
+    cache = (
+        FolderIdCache.for_root(root_id) if _folder_cache_enabled() else FolderIdCache()
+    )
+    mirror = DriveFolderMirror(
+        drive_service, root_id=root_id, cache=cache, retry=retry
+    )
+    _mirror_slot = (drive_service, settings, mirror)
+    return mirror
 
 
 PPTX_MIMETYPE = (
@@ -58,22 +121,172 @@ PPTX_MIMETYPE = (
 GOOGLE_SLIDES_MIMETYPE = "application/vnd.google-apps.presentation"
 
 
+# ----- lazy Google imports ----- #
+#
+# google-auth, httplib2 and the discovery client take a few hundred ms to
+# import. Usage errors, bad JSON and daemon forwarding never touch them, so
+# they load on the first command that builds services or uploads a file.
+
+
+def build_services():
+    """:func:`slides.auth.build_services`, imported on first use."""
+    from slides.auth import build_services as _build_services
+
+    return _build_services()
+
+
+def MediaFileUpload(*args, **kwargs):  # noqa: N802 — stands in for the class
+    """``googleapiclient.http.MediaFileUpload``, imported on first use."""
+    from googleapiclient.http import MediaFileUpload as _MediaFileUpload
+
+    return _MediaFileUpload(*args, **kwargs)
+
+
+#: Deck, PDF and outline upload concurrently once the folder is known.
+UPLOAD_WORKERS = 3
+
+
+def _worker_http(drive_service) -> Optional[AuthorizedHttp]:
+    """A fresh authorized transport for one upload thread.
+
+    httplib2 connections are not thread-safe, so each worker gets its own
+    ``Http`` wrapping the service's credentials. Returns None when the
+    service is not on an ``AuthorizedHttp`` (e.g. a test double); callers
+    then stay on one thread.
+    """
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.http import build_http
+
+    shared = getattr(drive_service, "_http", None)
+    if not isinstance(shared, AuthorizedHttp):
+        return None
+    return AuthorizedHttp(shared.credentials, http=build_http())
+
+
+def _check_not_trashed(created: dict, folder_id: str) -> None:
+    """A file created inside a trashed folder comes back ``trashed: true``.
+
+    That only happens when ``folder_id`` came from a stale folder cache.
+    """
+    if created.get("trashed") is True:
+        raise StaleFolderError(folder_id)
+
+
+def _uploaded_since(
+    drive_service,
+    folder_id: str,
+    name: str,
+    since: datetime,
+    retry: RetryPolicy,
+    http=None,
+):
+    """Build a ``recover`` callable for :meth:`RetryPolicy.execute`.
+
+    Looks for a file called ``name`` in ``folder_id`` created after
+    ``since`` — i.e. by a create attempt that failed on our side after Drive
+    had already committed it. Returns the file dict or None.
+    """
+    escaped = name.replace("'", r"\'")
+    # Drive compares createdTime in UTC; allow a little local clock skew.
+    stamp = (since - timedelta(seconds=5)).strftime("%Y-%m-%dT%H:%M:%S")
+    query = (
+        f"name = '{escaped}' "
+        f"and '{folder_id}' in parents "
+        f"and trashed = false "
+        f"and createdTime > '{stamp}'"
+    )
+
+    def _recover():
+        response = retry.execute(
+            drive_service.files().list(
+                q=query, fields="files(id, trashed)", pageSize=1
+            ),
+            http=http,
+        )
+        files = response.get("files", [])
+        return files[0] if files else None
+
+    return _recover
+
+
+def _create_with_media(
+    drive_service,
+    *,
+    body: dict,
+    local_path: str,
+    mimetype: str,
+    fields: str,
+    folder_id: str,
+    retry: RetryPolicy,
+    http=None,
+) -> dict:
+    """``files.create`` with ``local_path`` as media; returns the file dict.
+
+    Files under :func:`slides.uploads.resumable_threshold` go up in one
+    request, retried via :func:`_uploaded_since` recovery. Larger ones use a
+    resumable session (see :mod:`slides.uploads`) that survives dropped
+    chunks and, across runs, an interrupted process.
+    """
+    name = body["name"]
+    if os.path.getsize(local_path) < resumable_threshold():
+        started = datetime.now(timezone.utc)
+        media = MediaFileUpload(local_path, mimetype=mimetype, resumable=False)
+        created = retry.execute(
+            drive_service.files().create(
+                body=body, media_body=media, fields=fields
+            ),
+            http=http,
+            idempotent=False,
+            recover=_uploaded_since(
+                drive_service, folder_id, name, started, retry, http
+            ),
+        )
+    else:
+        media = MediaFileUpload(
+            local_path, mimetype=mimetype, resumable=True, chunksize=chunk_size()
+        )
+        created = run_resumable_upload(
+            drive_service.files().create(
+                body=body, media_body=media, fields=fields
+            ),
+            key=session_key(
+                local_path, folder_id, name, body.get("mimeType", mimetype)
+            ),
+            retry=retry,
+            label=Path(local_path).name,
+            http=http,
+        )
+    _check_not_trashed(created, folder_id)
+    return created
+
+
 def _upload_file(
     drive_service,
     folder_id: str,
     local_path: str,
     mimetype: str,
+    retry: RetryPolicy = NO_RETRY,
+    http=None,
+    md5: Optional[str] = None,
 ) -> str:
-    """Upload a single file into the given Drive folder. Returns file id."""
-    media = MediaFileUpload(local_path, mimetype=mimetype, resumable=False)
-    created = (
-        drive_service.files()
-        .create(
-            body={"name": Path(local_path).name, "parents": [folder_id]},
-            media_body=media,
-            fields="id",
-        )
-        .execute()
+    """Upload a single file into the given Drive folder. Returns file id.
+
+    ``http`` overrides the service's shared transport (see
+    :func:`_worker_http`). ``md5`` is recorded in ``appProperties`` for
+    incremental re-mirrors.
+    """
+    body: dict[str, Any] = {"name": Path(local_path).name, "parents": [folder_id]}
+    if md5:
+        body["appProperties"] = {SOURCE_MD5_PROPERTY: md5}
+    created = _create_with_media(
+        drive_service,
+        body=body,
+        local_path=local_path,
+        mimetype=mimetype,
+        fields="id, trashed",
+        folder_id=folder_id,
+        retry=retry,
+        http=http,
     )
     return created["id"]
 
@@ -83,6 +296,9 @@ def _upload_pptx_as_slides(
     folder_id: str,
     pptx_path: str,
     title: str,
+    retry: RetryPolicy = NO_RETRY,
+    http=None,
+    md5: Optional[str] = None,
 ) -> str:
     """Upload a PPTX into the given Drive folder, converted to native Slides.
 
@@ -90,23 +306,162 @@ def _upload_pptx_as_slides(
     from python-pptx) and SHAPE_AUTOFIT — limitations the direct-create
     Slides API path cannot work around. Returns the new deck (file) id.
     """
-    media = MediaFileUpload(pptx_path, mimetype=PPTX_MIMETYPE, resumable=False)
-    created = (
-        drive_service.files()
-        .create(
-            body={
-                "name": title,
-                "mimeType": GOOGLE_SLIDES_MIMETYPE,
-                "parents": [folder_id],
-            },
-            media_body=media,
-            fields="id, webViewLink",
-        )
-        .execute()
+    body: dict[str, Any] = {
+        "name": title,
+        "mimeType": GOOGLE_SLIDES_MIMETYPE,
+        "parents": [folder_id],
+    }
+    if md5:
+        body["appProperties"] = {SOURCE_MD5_PROPERTY: md5}
+    created = _create_with_media(
+        drive_service,
+        body=body,
+        local_path=pptx_path,
+        mimetype=PPTX_MIMETYPE,
+        fields="id, webViewLink, trashed",
+        folder_id=folder_id,
+        retry=retry,
+        http=http,
     )
     return created["id"]
 
 
+def _update_with_media(
+    drive_service,
+    file_id: str,
+    *,
+    local_path: str,
+    mimetype: str,
+    md5: str,
+    retry: RetryPolicy,
+    http=None,
+) -> dict:
+    """Replace a mirrored file's content in place with ``files.update``.
+
+    The file id, and so every link to it, survives. Re-sending the same bytes
+    is harmless, so unlike a create this is retried freely.
+    """
+    body = {"appProperties": {SOURCE_MD5_PROPERTY: md5}}
+    if os.path.getsize(local_path) < resumable_threshold():
+        media = MediaFileUpload(local_path, mimetype=mimetype, resumable=False)
+        return retry.execute(
+            drive_service.files().update(
+                fileId=file_id, body=body, media_body=media, fields="id"
+            ),
+            http=http,
+        )
+    media = MediaFileUpload(
+        local_path, mimetype=mimetype, resumable=True, chunksize=chunk_size()
+    )
+    return run_resumable_upload(
+        drive_service.files().update(
+            fileId=file_id, body=body, media_body=media, fields="id"
+        ),
+        key=session_key(local_path, file_id, "update", mimetype),
+        retry=retry,
+        label=Path(local_path).name,
+        http=http,
+    )
+
+
+def _current_artifact(
+    drive_service, file_id: str, folder_id: str, retry: RetryPolicy, http=None
+) -> Optional[dict]:
+    """Drive metadata of a previously mirrored file still in ``folder_id``.
+
+    None when the file is gone, trashed or no longer in the folder.
+    """
+    try:
+        current = retry.execute(
+            drive_service.files().get(
+                fileId=file_id,
+                fields="id, md5Checksum, appProperties, trashed, parents",
+            ),
+            http=http,
+        )
+    except Exception as exc:  # noqa: BLE001 — a missing file is re-created
+        if _http_status(exc) == 404:
+            return None
+        raise
+    if current.get("trashed") or folder_id not in current.get("parents", []):
+        return None
+    return current
+
+
+def _sync_artifact(
+    drive_service,
+    folder_id: str,
+    local_path: str,
+    *,
+    mimetype: str,
+    previous: Optional[dict],
+    create: Callable[[str], str],
+    retry: RetryPolicy,
+    http=None,
+) -> dict[str, Any]:
+    """Mirror one local file, reusing the Drive copy from the last run.
+
+    ``previous`` is the artifact's ``{"file_id", "md5"}`` record from the
+    pointer file, or None. If that file is still in ``folder_id`` its
+    ``appProperties`` MD5 (or, for blobs, Drive's ``md5Checksum``) decides
+    between leaving it alone and updating it in place. Otherwise
+    ``create(md5)`` uploads a new copy and returns its id.
+
+    Returns ``{"file_id", "md5", "action"}`` where ``action`` is
+    ``created``, ``updated`` or ``unchanged``.
+    """
+    md5 = file_md5(local_path)
+    current = None
+    if previous and previous.get("file_id"):
+        current = _current_artifact(
+            drive_service, previous["file_id"], folder_id, retry, http
+        )
+    if current is None:
+        return {"file_id": create(md5), "md5": md5, "action": "created"}
+    remote_md5 = (current.get("appProperties") or {}).get(
+        SOURCE_MD5_PROPERTY
+    ) or current.get("md5Checksum")
+    if remote_md5 != md5:
+        _update_with_media(
+            drive_service,
+            current["id"],
+            local_path=local_path,
+            mimetype=mimetype,
+            md5=md5,
+            retry=retry,
+            http=http,
+        )
+        return {"file_id": current["id"], "md5": md5, "action": "updated"}
+    return {"file_id": current["id"], "md5": md5, "action": "unchanged"}
+
+
+def _folder_not_found(exc: BaseException, folder_id: str, *, only_id: bool) -> bool:
+    """Whether ``exc`` is a 404 for ``folder_id`` rather than another file.
+
+    Drive names the missing id in the error (``File not found: <id>.``).
+    ``only_id`` says the failed call touched no other file, so any 404 is
+    the folder's.
+    """
+    if _http_status(exc) != 404:
+        return False
+    if only_id:
+        return True
+    content = getattr(exc, "content", b"") or b""
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", "replace")
+    return folder_id in f"{exc} {content}"
+
+
+def _trash_quietly(drive_service, file_id: str, retry: RetryPolicy) -> None:
+    """Best-effort trash of one file; failures are swallowed."""
+    try:
+        retry.execute(
+            drive_service.files().update(fileId=file_id, body={"trashed": True})
+        )
+    except Exception:  # noqa: BLE001 — the caller is already failing
+        pass
+
+
 def _mirror_into_folder(
     runner: SlidesRunner,
     mirror: DriveFolderMirror,
@@ -120,6 +475,7 @@ def _mirror_into_folder(
     deck_title: Optional[str] = None,
     pdf_path: Optional[str],
     outline_path: Optional[str],
+    previous: Optional[dict] = None,
 ) -> dict[str, Any]:
     """Shared body of mirror_presentation / mirror_template_sample.
 
@@ -145,6 +501,21 @@ def _mirror_into_folder(
     ``.slides.url`` pointer file. PDF/outline are skipped when their
     paths are absent or empty — that is how the templates flow opts out
     of mirroring source files per the epic alignment.
+
+    Once the folder is known the deck, PDF and outline go up concurrently
+    (up to :data:`UPLOAD_WORKERS` threads, each on its own transport). A deck
+    failure raises; PDF/outline failures are returned under
+    ``upload_errors`` keyed ``pdf`` / ``outline``, with that file's id None.
+    When the deck fails, any PDF/outline that round created is trashed again
+    (best-effort) before the error propagates or the round is retried. Only
+    a 404 for the folder itself (not for ``deck_id``) counts as a stale
+    cached folder.
+
+    ``previous`` is the last pointer file for this render (incremental
+    mode). When it points at the same folder, each file it lists is checked
+    by content hash and left alone or updated in place rather than
+    re-uploaded (see :func:`_sync_artifact`). The new pointer file records
+    every artifact's id and MD5 either way.
     """
     if not pptx_path and not deck_id:
         raise ValueError(
@@ -155,40 +526,155 @@ def _mirror_into_folder(
     folder_id = mirror.ensure_render_folder(brand, kind, render_slug)
     drive_service = runner._drive  # already authenticated
 
-    if pptx_path:
-        # Canonical PPTX-import path — upload directly into the folder so
-        # there is no second reparent call.
-        title = deck_title or Path(pptx_path).stem
-        deck_id = _upload_pptx_as_slides(
-            drive_service, folder_id, pptx_path, title
-        )
-    else:
+    def _place_deck(target_folder_id: str, http, prior) -> dict[str, Any]:
+        if pptx_path:
+            # Canonical PPTX-import path — upload directly into the folder so
+            # there is no second reparent call.
+            title = deck_title or Path(pptx_path).stem
+            return _sync_artifact(
+                drive_service,
+                target_folder_id,
+                pptx_path,
+                mimetype=PPTX_MIMETYPE,
+                previous=prior,
+                create=lambda md5: _upload_pptx_as_slides(
+                    drive_service,
+                    target_folder_id,
+                    pptx_path,
+                    title,
+                    runner.retry,
+                    http=http,
+                    md5=md5,
+                ),
+                retry=runner.retry,
+                http=http,
+            )
         # Deprecated direct-create path — deck already exists at another
-        # parent, reparent it into our folder.
-        runner.move_to_folder(deck_id, folder_id)
-
-    pdf_file_id: Optional[str] = None
-    outline_file_id: Optional[str] = None
+        # parent, reparent it into our folder. This is the only job left on
+        # the service's shared transport.
+        runner.move_to_folder(deck_id, target_folder_id)
+        return {"file_id": deck_id, "md5": None, "action": "moved"}
+
+    def _file_job(local_path: str, mimetype: str):
+        def _job(target_folder_id: str, http, prior) -> dict[str, Any]:
+            return _sync_artifact(
+                drive_service,
+                target_folder_id,
+                local_path,
+                mimetype=mimetype,
+                previous=prior,
+                create=lambda md5: _upload_file(
+                    drive_service,
+                    target_folder_id,
+                    local_path,
+                    mimetype,
+                    runner.retry,
+                    http,
+                    md5=md5,
+                ),
+                retry=runner.retry,
+                http=http,
+            )
+
+        return _job
+
+    jobs: dict[str, Callable[[str, Any, Optional[dict]], dict[str, Any]]] = {
+        "deck": _place_deck
+    }
     if pdf_path:
-        pdf_file_id = _upload_file(
-            drive_service, folder_id, pdf_path, "application/pdf"
-        )
+        jobs["pdf"] = _file_job(pdf_path, "application/pdf")
     if outline_path:
-        outline_file_id = _upload_file(
-            drive_service, folder_id, outline_path, "text/markdown"
+        jobs["outline"] = _file_job(outline_path, "text/markdown")
+
+    def _run_jobs(target_folder_id: str) -> dict[str, Any]:
+        """Run every job into ``target_folder_id``; values are records or errors."""
+        prior: dict[str, dict] = {}
+        if previous and previous.get("folder_id") == target_folder_id:
+            prior = previous.get("artifacts") or {}
+        transports = {name: _worker_http(drive_service) for name in jobs}
+        parallel = all(http is not None for http in transports.values())
+        workers = min(UPLOAD_WORKERS, len(jobs)) if parallel else 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                name: pool.submit(
+                    job, target_folder_id, transports[name], prior.get(name)
+                )
+                for name, job in jobs.items()
+            }
+        outcomes: dict[str, Any] = {}
+        for name, future in futures.items():
+            exc = future.exception()
+            outcomes[name] = exc if exc is not None else future.result()
+        return outcomes
+
+    def _trash_created(outcomes: dict[str, Any]) -> None:
+        # No pointer file is written for a round whose deck failed, so
+        # nothing would ever find the siblings it created; trash them.
+        for record in outcomes.values():
+            if isinstance(record, dict) and record["action"] == "created":
+                _trash_quietly(drive_service, record["file_id"], runner.retry)
+
+    # The deck doubles as the lazy revalidation of a cached folder id: a 404
+    # for the folder or a trashed result evicts the stale id, the chain is
+    # resolved again and all uploads are redone there, once.
+    outcomes = _run_jobs(folder_id)
+    deck_error = outcomes["deck"]
+    if isinstance(deck_error, Exception):
+        _trash_created(outcomes)
+        trashed = isinstance(deck_error, StaleFolderError)
+        # The direct-create path also 404s for a deck_id that is gone.
+        gone = trashed or _folder_not_found(
+            deck_error, folder_id, only_id=bool(pptx_path)
         )
+        if not gone:
+            raise deck_error
+        if mirror.invalidate_cache(folder_id) == 0 and not trashed:
+            raise deck_error
+        folder_id = mirror.ensure_render_folder(brand, kind, render_slug)
+        outcomes = _run_jobs(folder_id)
+        if isinstance(outcomes["deck"], Exception):
+            _trash_created(outcomes)
+            raise outcomes["deck"]
+    deck_id = outcomes["deck"]["file_id"]
+
+    # PDF / outline failures do not undo the deck; they are reported per file.
+    upload_errors = {
+        name: _error_payload(value)["error"]
+        for name, value in outcomes.items()
+        if isinstance(value, Exception)
+    }
+    artifacts = {
+        name: value
+        for name, value in outcomes.items()
+        if not isinstance(value, Exception)
+    }
+    file_ids = {name: record["file_id"] for name, record in artifacts.items()}
+
+    write_slides_url_file(
+        Path(local_dir),
+        deck_id,
+        folder_id,
+        artifacts={
+            name: {"file_id": record["file_id"], "md5": record["md5"]}
+            for name, record in artifacts.items()
+        },
+    )
 
-    write_slides_url_file(Path(local_dir), deck_id, folder_id)
-
-    return {
+    result = {
         "folder_id": folder_id,
         "folder_url": DriveFolderMirror.folder_url(folder_id),
         "deck_id": deck_id,
         "deck_url": SlidesRunner.deck_url(deck_id),
-        "pdf_file_id": pdf_file_id,
-        "outline_file_id": outline_file_id,
+        "pdf_file_id": file_ids.get("pdf"),
+        "outline_file_id": file_ids.get("outline"),
         "path_used": "pptx_import" if pptx_path else "direct_create",
+        "artifact_actions": {
+            name: record["action"] for name, record in artifacts.items()
+        },
     }
+    if upload_errors:
+        result["upload_errors"] = upload_errors
+    return result
 
 
 def _cmd_create_deck(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
@@ -198,9 +684,32 @@ def _cmd_create_deck(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
 
 
 def _cmd_apply_batch_update(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
+    """Pass-through ``batchUpdate``; ``"chunked": true`` splits big payloads.
+
+    Optional chunking knobs: ``max_requests_per_batch``,
+    ``max_bytes_per_batch``, ``required_revision_id``.
+
+    ``"requests_file"`` (a JSON Lines path, one request per line) replaces
+    ``"requests"`` and implies ``chunked``: the file is streamed into chunks
+    by :func:`slides.runner.iter_requests_file`, so only one chunk of
+    requests is in memory at a time.
+    """
     deck_id = payload["deck_id"]
-    requests = payload["requests"]
-    return runner.apply_batch_update(deck_id, requests)
+    if payload.get("requests_file"):
+        requests = iter_requests_file(Path(payload["requests_file"]))
+    else:
+        requests = payload["requests"]
+        if not payload.get("chunked"):
+            return runner.apply_batch_update(deck_id, requests)
+    return runner.apply_batch_update_chunked(
+        deck_id,
+        requests,
+        max_requests=payload.get(
+            "max_requests_per_batch", DEFAULT_BATCH_MAX_REQUESTS
+        ),
+        max_bytes=payload.get("max_bytes_per_batch", DEFAULT_BATCH_MAX_BYTES),
+        required_revision_id=payload.get("required_revision_id"),
+    )
 
 
 def _cmd_move_to_folder(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
@@ -211,7 +720,7 @@ def _cmd_move_to_folder(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
 
 
 def _cmd_ensure_render_folder(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
-    mirror = _make_mirror(runner._drive)
+    mirror = _make_mirror(runner._drive, runner.retry)
     folder_id = mirror.ensure_render_folder(
         payload["brand"], payload["kind"], payload["render_slug"]
     )
@@ -228,7 +737,7 @@ def _cmd_mirror_presentation(runner: SlidesRunner, payload: dict) -> dict[str, A
     or ``deck_id`` (deprecated direct-create fallback). When both are
     present, ``pptx_path`` wins.
     """
-    mirror = _make_mirror(runner._drive)
+    mirror = _make_mirror(runner._drive, runner.retry)
     return _mirror_into_folder(
         runner,
         mirror,
@@ -255,7 +764,7 @@ def _cmd_mirror_template_sample(runner: SlidesRunner, payload: dict) -> dict[str
     or ``deck_id`` (deprecated direct-create fallback). When both are
     present, ``pptx_path`` wins.
     """
-    mirror = _make_mirror(runner._drive)
+    mirror = _make_mirror(runner._drive, runner.retry)
     return _mirror_into_folder(
         runner,
         mirror,
@@ -272,7 +781,21 @@ def _cmd_mirror_template_sample(runner: SlidesRunner, payload: dict) -> dict[str
 
 
 def _cmd_trash_existing_render(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
-    mirror = _make_mirror(runner._drive)
+    """Trash one render folder (``render_slug``) or several (``render_slugs``).
+
+    With ``render_slugs`` the lookups and the trash calls each go out as a
+    single Drive batch request; the result maps every slug to the id it
+    trashed (or None).
+    """
+    mirror = _make_mirror(runner._drive, runner.retry)
+    if "render_slugs" in payload:
+        found = mirror.find_render_folders(
+            payload["brand"], payload["kind"], payload["render_slugs"]
+        )
+        mirror.trash_render_folders(
+            folder_id for folder_id in found.values() if folder_id
+        )
+        return {"trashed_folder_ids": found}
     existing = mirror.find_render_folder(
         payload["brand"], payload["kind"], payload["render_slug"]
     )
@@ -282,48 +805,126 @@ def _cmd_trash_existing_render(runner: SlidesRunner, payload: dict) -> dict[str,
     return {"trashed_folder_id": existing}
 
 
+def _cmd_invalidate_folder_cache(
+    runner: SlidesRunner, payload: dict
+) -> dict[str, Any]:
+    """Drop cached Drive folder ids.
+
+    Payload keys (all optional): ``folder_id`` evicts that folder and its
+    cached descendants; ``brand`` evicts the brand's subtree; neither clears
+    the whole cache for the current root.
+    """
+    mirror = _make_mirror(runner._drive, runner.retry)
+    folder_id = payload.get("folder_id")
+    if folder_id is None and payload.get("brand"):
+        folder_id = mirror.cached_brand_folder(payload["brand"])
+        if folder_id is None:
+            return {"invalidated": 0}
+    return {"invalidated": mirror.invalidate_cache(folder_id)}
+
+
+def _version_exists(
+    mirror: DriveFolderMirror, brand: str, kind: str, base_slug: str, n: int
+) -> bool:
+    slug = f"{base_slug}-v{n}"
+    return mirror.find_render_folders(brand, kind, [slug])[slug] is not None
+
+
+def _probe_next_version(
+    mirror: DriveFolderMirror, brand: str, kind: str, base_slug: str
+) -> int:
+    """Exponential-then-binary search for the first free version number.
+
+    Assumes versions are contiguous from 2, as keep_alongside creates them:
+    ``O(log N)`` lookups instead of ``N``.
+    """
+    if not _version_exists(mirror, brand, kind, base_slug, 2):
+        return 2
+    taken, step = 2, 1
+    while _version_exists(mirror, brand, kind, base_slug, taken + step):
+        taken += step
+        step *= 2
+    free = taken + step
+    while free - taken > 1:
+        middle = (taken + free) // 2
+        if _version_exists(mirror, brand, kind, base_slug, middle):
+            taken = middle
+        else:
+            free = middle
+    return free
+
+
 def _next_versioned_slug(
     mirror: DriveFolderMirror, brand: str, kind: str, base_slug: str
 ) -> str:
-    """Find first ``{base_slug}-v{N}`` (N>=2) that doesn't exist yet."""
-    n = 2
-    while True:
-        candidate = f"{base_slug}-v{n}"
-        if mirror.find_render_folder(brand, kind, candidate) is None:
-            return candidate
-        n += 1
+    """Return ``{base_slug}-v{N}`` one past the highest existing version.
+
+    Lists the kind folder's ``{base_slug}-v*`` children once (paginated) and
+    parses the suffixes locally. If Drive rejects the listing query, falls
+    back to :func:`_probe_next_version`.
+    """
+    try:
+        names = mirror.list_render_folder_names(brand, kind, base_slug)
+    except Exception as exc:  # noqa: BLE001 — only HTTP errors fall back
+        if _http_status(exc) is None:
+            raise
+        return f"{base_slug}-v{_probe_next_version(mirror, brand, kind, base_slug)}"
+    pattern = re.compile(rf"{re.escape(base_slug)}-v(\d+)")
+    versions = [
+        int(match.group(1)) for match in map(pattern.fullmatch, names) if match
+    ]
+    return f"{base_slug}-v{max([1, *versions]) + 1}"
 
 
 def _cmd_replace_render(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
-    """Trash-and-mirror (default) or keep-alongside as a versioned sibling.
+    """Trash-and-mirror (default), incremental, or keep-alongside.
 
     Strategy ``trash``: trash the existing render folder for this slug (if
-    any), then mirror normally. Strategy ``keep_alongside``: skip trashing;
-    write to a ``{slug}-v2`` (or v3, …) folder instead. Both end with a
-    fresh local ``.slides.url`` pointer file.
+    any), then mirror normally. Strategy ``incremental``: keep the folder
+    and, using the artifact ids/hashes in the local ``.slides.url``, skip
+    files whose content is unchanged and update changed ones in place; with
+    no usable pointer file it behaves like ``trash`` and says so in
+    ``strategy_used``. Strategy ``keep_alongside``: skip trashing; write to
+    a ``{slug}-v2`` (or v3, …) folder instead. All end with a fresh local
+    ``.slides.url`` pointer file.
 
     Like the underlying mirror commands, this accepts either ``pptx_path``
     (preferred — canonical PPTX-import path) or ``deck_id`` (deprecated
     direct-create fallback). When both are present, ``pptx_path`` wins.
     """
-    mirror = _make_mirror(runner._drive)
+    mirror = _make_mirror(runner._drive, runner.retry)
     strategy = payload.get("strategy", "trash")
-    if strategy not in ("trash", "keep_alongside"):
+    if strategy not in ("trash", "incremental", "keep_alongside"):
         raise ValueError(
-            f"strategy must be 'trash' or 'keep_alongside', got {strategy!r}"
+            "strategy must be 'trash', 'incremental' or 'keep_alongside', "
+            f"got {strategy!r}"
         )
 
     brand = payload["brand"]
     kind = payload.get("kind", "presentations")
     base_slug = payload["render_slug"]
     original_slug_if_versioned: Optional[str] = None
+    previous: Optional[dict] = None
 
+    if strategy == "incremental":
+        existing = mirror.find_render_folder(brand, kind, base_slug)
+        previous = read_slides_url_file(Path(payload["local_dir"]))
+        if (
+            existing is not None
+            and previous is not None
+            and previous.get("folder_id") == existing
+            and previous.get("artifacts")
+        ):
+            target_slug = base_slug
+        else:
+            # Nothing to diff against: fall back to a clean mirror.
+            strategy, previous = "trash", None
     if strategy == "trash":
         existing = mirror.find_render_folder(brand, kind, base_slug)
         if existing is not None:
             mirror.trash_render_folder(existing)
         target_slug = base_slug
-    else:  # keep_alongside
+    elif strategy == "keep_alongside":
         existing = mirror.find_render_folder(brand, kind, base_slug)
         if existing is None:
             target_slug = base_slug  # nothing alongside; just use base
@@ -343,6 +944,7 @@ def _cmd_replace_render(runner: SlidesRunner, payload: dict) -> dict[str, Any]:
         deck_title=payload.get("deck_title"),
         pdf_path=payload.get("pdf_path"),
         outline_path=payload.get("outline_path"),
+        previous=previous,
     )
     result["strategy_used"] = strategy
     result["render_slug"] = target_slug
@@ -359,14 +961,163 @@ COMMANDS: dict[str, Callable[[SlidesRunner, dict], dict[str, Any]]] = {
     "mirror_template_sample": _cmd_mirror_template_sample,
     "trash_existing_render": _cmd_trash_existing_render,
     "replace_render": _cmd_replace_render,
+    "invalidate_folder_cache": _cmd_invalidate_folder_cache,
 }
 
 
+#: Subcommands that are not entries in :data:`COMMANDS`.
+MODES = ("batch", "serve")
+
+
+def _error_payload(exc: BaseException) -> dict[str, Any]:
+    """Shape every failure as ``{"error": {type, message, status}}``."""
+    # googleapiclient.errors.HttpError carries .resp.status
+    return {
+        "error": {
+            "type": exc.__class__.__name__,
+            "message": str(exc),
+            "status": _http_status(exc),
+        }
+    }
+
+
+def _build_runner() -> SlidesRunner:
+    """Authenticate and return a runner with the env-configured retry policy.
+
+    When ``BCD_SLIDES_RATE_LIMIT`` is set, every attempt first takes a token
+    from the cross-process bucket in :mod:`slides.ratelimit`.
+    """
+    slides_service, drive_service = build_services()
+    limiter = TokenBucketLimiter.from_env()
+    retry = RetryPolicy.from_env(
+        throttle=limiter.acquire if limiter is not None else None
+    )
+    return SlidesRunner(slides_service, drive_service, retry=retry)
+
+
+def _start_trace(runner: SlidesRunner) -> tuple[Tracer, Callable[[], None]]:
+    """Trace the runner's calls and token refreshes until ``stop()``."""
+    tracer = Tracer()
+    if runner.retry is NO_RETRY:
+        # Never hang a tracer on the shared module-level policy.
+        runner._retry = NO_RETRY.copy()
+    runner.retry.tracer = tracer
+    credentials = getattr(getattr(runner._drive, "_http", None), "credentials", None)
+    restore_refresh = (
+        tracer.wrap_refresh(credentials)
+        if callable(getattr(credentials, "refresh", None))
+        else lambda: None
+    )
+
+    def stop() -> None:
+        runner.retry.tracer = None
+        restore_refresh()
+
+    return tracer, stop
+
+
+def run_command(
+    runner: SlidesRunner, command: str, payload: dict
+) -> tuple[int, dict[str, Any]]:
+    """Run one :data:`COMMANDS` entry. Returns ``(exit_code, output)``.
+
+    Shared by the one-shot CLI and the long-lived modes so every entry point
+    produces byte-identical JSON for the same result. Calls that needed
+    retries are listed under a top-level ``"retries"`` key — absent when
+    every call succeeded first time. With tracing on (``BCD_SLIDES_TRACE=1``
+    or ``"trace": true`` in the payload) every call attempt is listed under
+    ``"trace"`` (see :mod:`slides.tracing`).
+    """
+    runner.retry.take_log()
+    tracer = None
+    traced = isinstance(payload, dict) and payload.get("trace") is True
+    if tracing_enabled() or traced:
+        tracer, stop_trace = _start_trace(runner)
+    try:
+        if not isinstance(payload, dict):
+            raise ValueError("payload must be a JSON object")
+        code, output = 0, COMMANDS[command](runner, payload)
+    except Exception as exc:  # noqa: BLE001 — surface everything as JSON
+        code, output = 1, _error_payload(exc)
+    retries = runner.retry.take_log()
+    if retries and isinstance(output, dict):
+        output["retries"] = retries
+    if tracer is not None:
+        stop_trace()
+        if isinstance(output, dict):
+            output["trace"] = tracer.take()
+        if os.environ.get("BCD_SLIDES_TRACE_FILE"):
+            tracer.export(Path(os.environ["BCD_SLIDES_TRACE_FILE"]), command)
+    return code, output
+
+
+def _daemon_enabled() -> bool:
+    """``BCD_SLIDES_DAEMON=1`` routes commands through ``slides.daemon``."""
+    value = os.environ.get("BCD_SLIDES_DAEMON", "").strip().lower()
+    return value in ("1", "true", "on", "yes")
+
+
+def _emit(output: dict[str, Any]) -> None:
+    json.dump(output, sys.stdout)
+    sys.stdout.write("\n")
+
+
+def run_batch(lines, out) -> int:
+    """Run newline-delimited ``{"command", "payload"}`` records.
+
+    Writes one JSON line per non-blank input line, in order, flushed as each
+    record finishes: ``{"command": ..., "result": ...}`` on success or
+    ``{"command": ..., "error": {...}}`` on failure. An optional ``id`` on
+    the record is echoed back. Services are built once, on the first valid
+    record, and the Drive folder mirror is shared by every record (see
+    :func:`_make_mirror`). Returns ``1`` if any record failed, else ``0``.
+    """
+    runner: Optional[SlidesRunner] = None
+    exit_code = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        record: dict[str, Any] = {}
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("batch record must be a JSON object")
+            command = record.get("command")
+            if command not in COMMANDS:
+                raise ValueError(f"unknown command {command!r}")
+            if runner is None:
+                runner = _build_runner()
+        except Exception as exc:  # noqa: BLE001 — surface everything as JSON
+            code, output = 1, _error_payload(exc)
+        else:
+            payload = record.get("payload") or {}
+            code, output = run_command(runner, command, payload)
+        line_out: dict[str, Any] = {}
+        if "id" in record:
+            line_out["id"] = record["id"]
+        line_out["command"] = record.get("command")
+        if code == 0:
+            line_out["result"] = output
+        else:
+            line_out.update(output)
+            exit_code = 1
+        out.write(json.dumps(line_out) + "\n")
+        out.flush()
+    return exit_code
+
+
 def main(argv: list[str] | None = None) -> int:
     argv = argv if argv is not None else sys.argv[1:]
+    if argv and argv[0] == "serve":
+        from slides.daemon import serve_main
+
+        return serve_main(argv[1:])
+    if argv == ["batch"]:
+        return run_batch(sys.stdin, sys.stdout)
+
     if len(argv) != 1 or argv[0] not in COMMANDS:
         print(
-            f"usage: slides.cli <{ '|'.join(COMMANDS) }>",
+            f"usage: slides.cli <{ '|'.join([*COMMANDS, *MODES]) }>",
             file=sys.stderr,
         )
         return 1
@@ -375,36 +1126,29 @@ def main(argv: list[str] | None = None) -> int:
     try:
         payload = json.load(sys.stdin)
     except json.JSONDecodeError as exc:
-        json.dump(
-            {"error": {"type": "JSONDecodeError", "message": str(exc), "status": None}},
-            sys.stdout,
+        _emit(
+            {"error": {"type": "JSONDecodeError", "message": str(exc), "status": None}}
         )
-        sys.stdout.write("\n")
         return 1
 
+    if _daemon_enabled():
+        from slides import daemon
+
+        try:
+            code, output = daemon.call(command, payload)
+        except Exception as exc:  # noqa: BLE001 — surface everything as JSON
+            code, output = 1, _error_payload(exc)
+        _emit(output)
+        return code
+
     try:
-        slides_service, drive_service = build_services()
-        runner = SlidesRunner(slides_service, drive_service)
-        result = COMMANDS[command](runner, payload)
+        runner = _build_runner()
     except Exception as exc:  # noqa: BLE001 — surface everything as JSON
-        # googleapiclient.errors.HttpError carries .resp.status
-        status = getattr(getattr(exc, "resp", None), "status", None)
-        json.dump(
-            {
-                "error": {
-                    "type": exc.__class__.__name__,
-                    "message": str(exc),
-                    "status": status,
-                }
-            },
-            sys.stdout,
-        )
-        sys.stdout.write("\n")
+        _emit(_error_payload(exc))
         return 1
-
-    json.dump(result, sys.stdout)
-    sys.stdout.write("\n")
-    return 0
+    code, output = run_command(runner, command, payload)
+    _emit(output)
+    return code
 
 
 if __name__ == "__main__":
@@ -0,0 +1,483 @@
+"""Long-lived ``slides.cli`` server behind a Unix-domain socket.
+
+One-shot ``python -m slides.cli <command>`` pays interpreter start, the
+googleapiclient import, two discovery builds and a credential refresh on
+every call. ``python -m slides.cli serve`` pays them once and then answers
+:data:`slides.cli.COMMANDS` over a socket until it has been idle for
+``BCD_SLIDES_DAEMON_IDLE`` seconds (default 300).
+
+Wire format is newline-delimited JSON-RPC 2.0. ``method`` is a command name
+and ``params`` is exactly the JSON object the one-shot CLI reads on stdin::
+
+    → {"jsonrpc": "2.0", "id": 1, "method": "create_deck", "params": {"title": "x"}}
+    ← {"jsonrpc": "2.0", "id": 1, "result": {"deck_id": "...", "deck_url": "..."}}
+
+Command failures come back as JSON-RPC errors whose ``data`` is the same
+``{type, message, status}`` object the one-shot CLI prints under ``error``.
+
+The daemon runs in whatever directory its first client started it from, so
+:func:`call` makes the payload's file paths absolute before sending. It
+also sends the client's per-command env vars (:data:`_FORWARDED_ENV`) as
+an extra top-level ``"env"`` member, which the daemon applies for that one
+request only.
+
+Clients normally do not talk to the socket directly: with
+``BCD_SLIDES_DAEMON=1`` set, ``python -m slides.cli <command>`` forwards to
+the daemon via :func:`call`, spawning it first when nothing is listening.
+Requests are served one at a time — ``googleapiclient`` resources are not
+thread-safe, and the per-call latency is dominated by Google anyway.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from slides.cache import default_cache_dir
+
+
+#: Seconds without a request before ``serve`` exits on its own.
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+#: Seconds a client waits for a freshly spawned daemon to accept connections.
+SPAWN_TIMEOUT = 15.0
+
+#: Seconds the daemon waits on a connected client to send a request or read
+#: a reply, so one stalled client cannot wedge the single-threaded server.
+CONNECTION_TIMEOUT = 30.0
+
+#: JSON-RPC 2.0 error codes used by :class:`SlidesDaemon`.
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+COMMAND_ERROR = -32000
+
+#: Env vars that decide *which* Drive the daemon talks to and how its runner
+#: is built (retry policy, rate limit, token cache). All are read once, when
+#: the daemon builds its runner, so a client only reuses a daemon started
+#: with the same values — see :func:`default_socket_path`.
+_IDENTITY_ENV = (
+    "BCD_SLIDES_SA_KEY_FILE",
+    "BCD_SLIDES_OAUTH_CLIENT_ID",
+    "BCD_SLIDES_OAUTH_REFRESH_TOKEN",
+    "BRAND_CONTENT_DRIVE_ROOT_ID",
+    "BCD_SLIDES_FOLDER_CACHE",
+    "BCD_SLIDES_CACHE_DIR",
+    "BCD_SLIDES_API_ENDPOINT",
+    "BCD_SLIDES_TOKEN_CACHE",
+    "BCD_SLIDES_RETRY_MAX_ATTEMPTS",
+    "BCD_SLIDES_RETRY_BASE_DELAY",
+    "BCD_SLIDES_RETRY_MAX_DELAY",
+    "BCD_SLIDES_RATE_LIMIT",
+    "BCD_SLIDES_RATE_BURST",
+)
+
+#: Env vars read while a command runs. The client sends its values with each
+#: request and the daemon applies them for that request only.
+_FORWARDED_ENV = (
+    "BCD_SLIDES_TRACE",
+    "BCD_SLIDES_TRACE_FILE",
+    "BCD_SLIDES_RESUMABLE_THRESHOLD_MB",
+    "BCD_SLIDES_UPLOAD_CHUNK_MB",
+)
+
+#: Payload keys (and forwarded env vars) holding local paths, made absolute
+#: against the client's working directory before they reach the daemon.
+_PATH_PARAMS = ("local_dir", "pptx_path", "pdf_path", "outline_path", "requests_file")
+_PATH_ENV = ("BCD_SLIDES_TRACE_FILE",)
+
+
+class DaemonUnavailable(RuntimeError):
+    """No daemon is listening and one could not be spawned."""
+
+
+def default_socket_path(env: dict | None = None) -> Path:
+    """Socket path for the current credentials + Drive root.
+
+    ``BCD_SLIDES_SOCKET`` wins when set. Otherwise the name embeds a short
+    hash of :data:`_IDENTITY_ENV`, so switching accounts or roots starts a
+    separate daemon instead of silently reusing the wrong one. Lives in
+    ``$XDG_RUNTIME_DIR`` when available (short, per-user, tmpfs), else in a
+    ``0700`` ``bcd-slides-<uid>`` directory under the temp dir — Unix socket
+    paths are limited to ~100 bytes.
+    """
+    if env is None:
+        env = os.environ
+    if env.get("BCD_SLIDES_SOCKET"):
+        return Path(env["BCD_SLIDES_SOCKET"])
+    identity = "\0".join(env.get(key, "") for key in _IDENTITY_ENV)
+    digest = hashlib.sha256(identity.encode("utf-8")).hexdigest()[:12]
+    if env.get("XDG_RUNTIME_DIR"):
+        base = Path(env["XDG_RUNTIME_DIR"])
+    else:
+        base = Path(tempfile.gettempdir()) / f"bcd-slides-{os.getuid()}"
+    return base / f"bcd-slides-{os.getuid()}-{digest}.sock"
+
+
+@contextmanager
+def _request_env(values: Any) -> Iterator[None]:
+    """Apply a request's :data:`_FORWARDED_ENV` values, then restore.
+
+    Keys outside :data:`_FORWARDED_ENV` are ignored; a ``null`` value unsets
+    the variable, so nothing carries over from the previous client.
+    """
+    if not isinstance(values, dict):
+        yield
+        return
+    saved = {key: os.environ.get(key) for key in _FORWARDED_ENV}
+    try:
+        for key in _FORWARDED_ENV:
+            value = values.get(key)
+            if isinstance(value, str):
+                os.environ[key] = value
+            else:
+                os.environ.pop(key, None)
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _idle_timeout_from_env() -> float:
+    raw = os.environ.get("BCD_SLIDES_DAEMON_IDLE")
+    return float(raw) if raw else DEFAULT_IDLE_TIMEOUT
+
+
+# --------------------------------------------------------------------------- #
+# Server                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+class SlidesDaemon:
+    """Serve :data:`slides.cli.COMMANDS` over a Unix-domain socket.
+
+    Parameters
+    ----------
+    runner_factory:
+        Zero-arg callable returning a :class:`slides.runner.SlidesRunner`.
+        Called on the first command (not at startup) so the socket is
+        accepting connections before auth runs; a failed build is retried on
+        the next command rather than cached.
+    socket_path:
+        Where to listen. An existing socket nobody answers on is replaced.
+    idle_timeout:
+        Exit after this many seconds without a connection.
+    """
+
+    def __init__(
+        self,
+        runner_factory: Callable[[], Any],
+        socket_path: Path,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        self._runner_factory = runner_factory
+        self._runner = None
+        self._socket_path = Path(socket_path)
+        self._idle_timeout = idle_timeout
+        self._stopping = False
+
+    # ----- private --------------------------------------------------------- #
+
+    def _get_runner(self):
+        if self._runner is None:
+            self._runner = self._runner_factory()
+        return self._runner
+
+    @staticmethod
+    def _reply(request_id, *, result=None, error=None) -> dict[str, Any]:
+        reply: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id}
+        if error is not None:
+            reply["error"] = error
+        else:
+            reply["result"] = result
+        return reply
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        try:
+            self._answer(conn)
+        except OSError:
+            # Stalled (timed out) or vanished client; serve the next one.
+            pass
+
+    def _answer(self, conn: socket.socket) -> None:
+        with conn, conn.makefile("rwb") as stream:
+            for raw in stream:
+                if not raw.strip():
+                    continue
+                try:
+                    request = json.loads(raw)
+                except ValueError as exc:
+                    reply = self._reply(
+                        None, error={"code": PARSE_ERROR, "message": str(exc)}
+                    )
+                else:
+                    reply = self.handle(request)
+                stream.write(json.dumps(reply).encode("utf-8") + b"\n")
+                stream.flush()
+                if self._stopping:
+                    return
+
+    # ----- public ---------------------------------------------------------- #
+
+    def handle(self, request: Any) -> dict[str, Any]:
+        """Dispatch one decoded JSON-RPC request and return the reply."""
+        from slides.cli import COMMANDS, _error_payload, run_command
+
+        if not isinstance(request, dict) or not isinstance(
+            request.get("method"), str
+        ):
+            return self._reply(
+                None,
+                error={"code": INVALID_REQUEST, "message": "Invalid Request"},
+            )
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+
+        if method == "ping":
+            return self._reply(request_id, result={"pid": os.getpid()})
+        if method == "shutdown":
+            self._stopping = True
+            return self._reply(request_id, result={"stopping": True})
+        if method not in COMMANDS:
+            return self._reply(
+                request_id,
+                error={
+                    "code": METHOD_NOT_FOUND,
+                    "message": f"Unknown command {method!r}",
+                },
+            )
+
+        try:
+            runner = self._get_runner()
+        except Exception as exc:  # noqa: BLE001 — surface everything as JSON
+            code, output = 1, _error_payload(exc)
+        else:
+            with _request_env(request.get("env")):
+                code, output = run_command(runner, method, params)
+        if code == 0:
+            return self._reply(request_id, result=output)
+        data = output["error"]
+        return self._reply(
+            request_id,
+            error={"code": COMMAND_ERROR, "message": data["message"], "data": data},
+        )
+
+    def serve_forever(self) -> None:
+        """Accept connections until idle for ``idle_timeout`` or shut down."""
+        path = self._socket_path
+        if path.exists():
+            if _ping(path):
+                raise DaemonUnavailable(f"A daemon is already listening on {path}")
+            path.unlink()
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)  # socket file readable by owner only
+        try:
+            server.bind(str(path))
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        server.settimeout(self._idle_timeout)
+        try:
+            while not self._stopping:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    break
+                conn.settimeout(CONNECTION_TIMEOUT)
+                self._serve_connection(conn)
+        finally:
+            server.close()
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def serve_main(argv: list[str]) -> int:
+    """Entry point for ``python -m slides.cli serve``."""
+    parser = argparse.ArgumentParser(prog="slides.cli serve")
+    parser.add_argument("--socket", type=Path, default=None)
+    parser.add_argument("--idle-timeout", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    from slides.cli import _build_runner
+
+    idle_timeout = args.idle_timeout
+    if idle_timeout is None:
+        idle_timeout = _idle_timeout_from_env()
+    daemon = SlidesDaemon(
+        _build_runner,
+        args.socket or default_socket_path(),
+        idle_timeout,
+    )
+    try:
+        daemon.serve_forever()
+    except DaemonUnavailable as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+    return 0
+
+
+# --------------------------------------------------------------------------- #
+# Client                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+def _peer_uid(sock: socket.socket, path: Path) -> int:
+    """Uid of the process behind a connected Unix socket."""
+    if hasattr(socket, "SO_PEERCRED"):  # Linux: asked of the kernel, race-free
+        creds = sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        return struct.unpack("3i", creds)[1]
+    return os.stat(path).st_uid
+
+
+def _connect(path: Path) -> Optional[socket.socket]:
+    """Connect to the daemon at ``path``; None when nothing is listening.
+
+    The socket may live in a shared directory, so a listener run by another
+    user is refused with :class:`DaemonUnavailable` instead of being sent
+    the command payload and forwarded env.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+        owner = _peer_uid(sock, path)
+    except OSError:
+        sock.close()
+        return None
+    if owner != os.getuid():
+        sock.close()
+        raise DaemonUnavailable(
+            f"Refusing daemon socket {path}: it belongs to uid {owner}, "
+            f"not {os.getuid()}"
+        )
+    return sock
+
+
+def _rpc(
+    sock: socket.socket, method: str, params: dict, env: Optional[dict] = None
+) -> dict[str, Any]:
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+    if env is not None:
+        request["env"] = env
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        line = stream.readline()
+    if not line:
+        raise DaemonUnavailable("Daemon closed the connection without replying")
+    return json.loads(line)
+
+
+def _ping(path: Path) -> bool:
+    sock = _connect(path)
+    if sock is None:
+        return False
+    try:
+        return "result" in _rpc(sock, "ping", {})
+    except (OSError, ValueError, DaemonUnavailable):
+        return False
+
+
+def _spawn(path: Path) -> subprocess.Popen:
+    """Start ``python -m slides.cli serve`` detached from this process."""
+    package_parent = str(Path(__file__).resolve().parent.parent)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (package_parent, env.get("PYTHONPATH")) if p
+    )
+    log_dir = default_cache_dir()
+    log_dir.mkdir(parents=True, exist_ok=True)
+    with open(log_dir / "daemon.log", "ab") as log:
+        return subprocess.Popen(
+            [sys.executable, "-m", "slides.cli", "serve", "--socket", str(path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=log,
+            env=env,
+            start_new_session=True,
+        )
+
+
+def _absolute(value: Any) -> Any:
+    if isinstance(value, str) and value and not os.path.isabs(value):
+        return os.path.abspath(value)
+    return value
+
+
+def _client_request(payload: Any) -> tuple[Any, dict[str, Optional[str]]]:
+    """``(payload, env)`` as the daemon should see them.
+
+    Relative paths in :data:`_PATH_PARAMS` / :data:`_PATH_ENV` are resolved
+    against this process's working directory, not the daemon's.
+    """
+    if isinstance(payload, dict):
+        payload = {
+            key: _absolute(value) if key in _PATH_PARAMS else value
+            for key, value in payload.items()
+        }
+    env = {key: os.environ.get(key) for key in _FORWARDED_ENV}
+    for key in _PATH_ENV:
+        env[key] = _absolute(env[key])
+    return payload, env
+
+
+def call(
+    command: str,
+    payload: dict,
+    *,
+    socket_path: Optional[Path] = None,
+    spawn: bool = True,
+) -> tuple[int, dict[str, Any]]:
+    """Run ``command`` on the daemon. Returns ``(exit_code, output)``.
+
+    ``output`` has the exact shape the one-shot CLI would print. When no
+    daemon is listening and ``spawn`` is true, one is started and awaited
+    for up to :data:`SPAWN_TIMEOUT` seconds.
+    """
+    path = Path(socket_path) if socket_path is not None else default_socket_path()
+    sock = _connect(path)
+    if sock is None:
+        if not spawn:
+            raise DaemonUnavailable(f"No daemon listening on {path}")
+        process = _spawn(path)
+        deadline = time.monotonic() + SPAWN_TIMEOUT
+        while sock is None:
+            if process.poll() is not None or time.monotonic() > deadline:
+                raise DaemonUnavailable(
+                    f"slides daemon did not start on {path}; see "
+                    f"{default_cache_dir() / 'daemon.log'}"
+                )
+            time.sleep(0.05)
+            sock = _connect(path)
+
+    payload, env = _client_request(payload)
+    reply = _rpc(sock, command, payload, env)
+    if "error" in reply:
+        error = reply["error"]
+        data = error.get("data") or {
+            "type": "DaemonError",
+            "message": error.get("message"),
+            "status": None,
+        }
+        return 1, {"error": data}
+    return 0, reply["result"]
@@ -0,0 +1,593 @@
+"""In-process stand-in for the Drive v3 + Slides v1 endpoints the runner uses.
+
+Serves, over plain HTTP on ``127.0.0.1``, just enough of both APIs for
+``slides.cli`` to run end to end without credentials or network:
+
+* Drive ``files.list`` (the ``q`` subset the mirror builds: ``name =``,
+  ``name contains``, ``'id' in parents``, ``mimeType =``, ``trashed =``;
+  paginated), ``files.create`` / ``files.update`` with or without media
+  (multipart and resumable uploads), ``files.get``, and ``/batch/drive/v3``;
+* Slides ``presentations.create`` / ``get`` / ``batchUpdate`` (with
+  ``writeControl.requiredRevisionId`` checks).
+
+Point the runner at it with ``BCD_SLIDES_API_ENDPOINT`` (see
+:func:`slides.auth.build_services`)::
+
+    with FakeGoogleServer(latency=0.05) as server:
+        os.environ.update(server.env())
+        slides_service, drive_service = build_services()
+
+Faults for retry / soak testing: ``latency`` seconds per round trip,
+``error_rate`` (503) and ``quota_rate`` (403 ``userRateLimitExceeded``) drawn
+from a seeded RNG per call, and :meth:`FakeGoogleServer.fail_next` for
+deterministic ones. :attr:`FakeGoogleServer.calls` counts API calls by
+method id (a batch counts each inner call) and
+:attr:`FakeGoogleServer.round_trips` counts HTTP requests.
+
+Run standalone for manual soak tests::
+
+    python -m slides.fakeserver --port 8089 --latency 0.05 --error-rate 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+
+FOLDER_MIME = "application/vnd.google-apps.folder"
+SLIDES_MIME = "application/vnd.google-apps.presentation"
+
+#: Largest ``pageSize`` Drive honours for ``files.list``.
+MAX_PAGE_SIZE = 1000
+
+_NAME_EQ_RE = re.compile(r"name = '((?:[^'\\]|\\.)*)'")
+_NAME_CONTAINS_RE = re.compile(r"name contains '((?:[^'\\]|\\.)*)'")
+_PARENT_RE = re.compile(r"'([^']+)' in parents")
+_MIME_RE = re.compile(r"mimeType = '([^']+)'")
+_TRASHED_RE = re.compile(r"trashed = (true|false)")
+
+
+class FakeApiError(Exception):
+    """An HTTP error response: ``status`` plus a Google-shaped JSON body."""
+
+    def __init__(self, status: int, message: str, reason: str = ""):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+
+    def body(self) -> dict[str, Any]:
+        error: dict[str, Any] = {"code": self.status, "message": str(self)}
+        if self.reason:
+            error["errors"] = [{"reason": self.reason, "message": str(self)}]
+        return {"error": error}
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\(.)", r"\1", value)
+
+
+def _parse_multipart(content_type: str, body: bytes):
+    """Parts of a ``multipart/*`` body as ``email.message.Message`` objects."""
+    message = BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    return message.get_payload()
+
+
+class FakeGoogleServer:
+    """Threaded fake of the Drive + Slides subset used by ``slides``.
+
+    Parameters
+    ----------
+    latency:
+        Seconds slept before answering each HTTP request.
+    error_rate, quota_rate:
+        Probability that any single API call fails with a 503, or with a
+        403 ``userRateLimitExceeded``.
+    seed:
+        Seed for the fault RNG, so a soak run is reproducible.
+    port:
+        Port to bind on ``127.0.0.1``; 0 picks a free one.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        quota_rate: float = 0.0,
+        seed: Optional[int] = None,
+        port: int = 0,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.quota_rate = quota_rate
+        self.files: dict[str, dict[str, Any]] = {}
+        self.presentations: dict[str, dict[str, Any]] = {}
+        self.calls: Counter[str] = Counter()
+        self.round_trips = 0
+        self._rng = random.Random(seed)
+        self._faults: list[tuple[int, str]] = []
+        self._uploads: dict[str, dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # ----- lifecycle ------------------------------------------------------- #
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> dict[str, str]:
+        """Environment that points ``slides.auth.build_services`` here."""
+        return {"BCD_SLIDES_API_ENDPOINT": self.endpoint}
+
+    def start(self) -> "FakeGoogleServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="fake-google",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeGoogleServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # ----- faults and counters ------------------------------------------- #
+
+    def fail_next(self, status: int, count: int = 1, *, reason: str = "") -> None:
+        """Fail the next ``count`` API calls with ``status`` (and ``reason``)."""
+        with self._lock:
+            self._faults.extend([(status, reason)] * count)
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.round_trips = 0
+
+    def _call(self, method: str) -> None:
+        """Count one API call and raise any injected fault for it."""
+        with self._lock:
+            self.calls[method] += 1
+            if self._faults:
+                status, reason = self._faults.pop(0)
+                raise FakeApiError(status, "injected failure", reason)
+            roll = self._rng.random()
+        if roll < self.error_rate:
+            raise FakeApiError(503, "Backend Error", "backendError")
+        if roll < self.error_rate + self.quota_rate:
+            raise FakeApiError(403, "Rate Limit Exceeded", "userRateLimitExceeded")
+
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}{next(self._ids)}"
+
+    # ----- Drive ----------------------------------------------------------- #
+
+    def _file(self, file_id: str) -> dict[str, Any]:
+        found = self.files.get(file_id)
+        if found is None:
+            raise FakeApiError(404, f"File not found: {file_id}.", "notFound")
+        return found
+
+    def _public(self, record: dict[str, Any]) -> dict[str, Any]:
+        return {k: v for k, v in record.items() if k != "content"}
+
+    def _matches(self, record: dict[str, Any], query: str) -> bool:
+        for match in _NAME_EQ_RE.finditer(query):
+            if record["name"] != _unescape(match.group(1)):
+                return False
+        for match in _NAME_CONTAINS_RE.finditer(query):
+            if _unescape(match.group(1)) not in record["name"]:
+                return False
+        for match in _PARENT_RE.finditer(query):
+            if match.group(1) not in record["parents"]:
+                return False
+        for match in _MIME_RE.finditer(query):
+            if record["mimeType"] != match.group(1):
+                return False
+        for match in _TRASHED_RE.finditer(query):
+            if record["trashed"] != (match.group(1) == "true"):
+                return False
+        return True
+
+    def files_list(self, params: dict[str, str]) -> dict[str, Any]:
+        self._call("drive.files.list")
+        query = params.get("q", "")
+        page_size = min(int(params.get("pageSize", 100)), MAX_PAGE_SIZE)
+        offset = int(params.get("pageToken") or 0)
+        with self._lock:
+            matches = [
+                self._public(record)
+                for record in self.files.values()
+                if self._matches(record, query)
+            ]
+        page = matches[offset : offset + page_size]
+        response: dict[str, Any] = {"files": page}
+        if offset + page_size < len(matches):
+            response["nextPageToken"] = str(offset + page_size)
+        return response
+
+    def _store_media(self, record: dict[str, Any], media: bytes) -> None:
+        record["content"] = media
+        record["size"] = str(len(media))
+        if record["mimeType"].startswith("application/vnd.google-apps."):
+            record.pop("md5Checksum", None)
+        else:
+            record["md5Checksum"] = hashlib.md5(media).hexdigest()
+
+    def files_create(
+        self, metadata: dict[str, Any], media: Optional[bytes] = None
+    ) -> dict[str, Any]:
+        self._call("drive.files.create")
+        with self._lock:
+            parents = list(metadata.get("parents") or ["root"])
+            trashed = False
+            for parent in parents:
+                if parent != "root":
+                    trashed = trashed or self._file(parent)["trashed"]
+            record = {
+                "id": self._new_id("file-"),
+                "name": metadata.get("name", "Untitled"),
+                "mimeType": metadata.get("mimeType", "application/octet-stream"),
+                "parents": parents,
+                # Like Drive: anything created in a trashed folder is trashed.
+                "trashed": trashed,
+                "appProperties": dict(metadata.get("appProperties") or {}),
+            }
+            if media is not None:
+                self._store_media(record, media)
+            self.files[record["id"]] = record
+            if record["mimeType"] == SLIDES_MIME:
+                self._new_presentation(record["id"], record["name"])
+            return self._public(record)
+
+    def files_get(self, file_id: str) -> dict[str, Any]:
+        self._call("drive.files.get")
+        with self._lock:
+            return self._public(self._file(file_id))
+
+    def files_update(
+        self,
+        file_id: str,
+        params: dict[str, str],
+        metadata: dict[str, Any],
+        media: Optional[bytes] = None,
+    ) -> dict[str, Any]:
+        self._call("drive.files.update")
+        with self._lock:
+            record = self._file(file_id)
+            for parent in filter(None, params.get("removeParents", "").split(",")):
+                if parent in record["parents"]:
+                    record["parents"].remove(parent)
+            for parent in filter(None, params.get("addParents", "").split(",")):
+                if parent != "root":
+                    self._file(parent)
+                record["parents"].append(parent)
+            for key in ("name", "trashed", "mimeType"):
+                if key in metadata:
+                    record[key] = metadata[key]
+            if "appProperties" in metadata:
+                record["appProperties"].update(metadata["appProperties"])
+            if media is not None:
+                self._store_media(record, media)
+            return self._public(record)
+
+    # ----- resumable uploads --------------------------------------------- #
+
+    def start_upload(
+        self, file_id: Optional[str], params: dict[str, str], metadata: dict
+    ) -> str:
+        upload_id = self._new_id("upload-")
+        with self._lock:
+            self._uploads[upload_id] = {
+                "file_id": file_id,
+                "params": params,
+                "metadata": metadata,
+                "data": b"",
+            }
+        return upload_id
+
+    def put_chunk(
+        self, upload_id: str, content_range: str, chunk: bytes
+    ) -> tuple[int, Any]:
+        """Apply one resumable ``PUT``; ``(308, received)`` or ``(200, file)``."""
+        with self._lock:
+            session = self._uploads.get(upload_id)
+            if session is None:
+                raise FakeApiError(404, "Upload session expired.")
+            match = re.fullmatch(r"bytes (\*|(\d+)-(\d+))/(\*|\d+)", content_range)
+            if match is None:
+                raise FakeApiError(400, f"Bad Content-Range: {content_range!r}")
+            if match.group(2) is not None:
+                start = int(match.group(2))
+                if start != len(session["data"]):
+                    raise FakeApiError(400, "Chunk does not continue the upload.")
+                session["data"] += chunk
+            total = match.group(4)
+            if total == "*" or len(session["data"]) < int(total):
+                return 308, len(session["data"])
+            del self._uploads[upload_id]
+        media = session["data"]
+        if session["file_id"] is None:
+            return 200, self.files_create(session["metadata"], media)
+        return 200, self.files_update(
+            session["file_id"], session["params"], session["metadata"], media
+        )
+
+    # ----- Slides ---------------------------------------------------------- #
+
+    def _new_presentation(self, deck_id: str, title: str) -> dict[str, Any]:
+        deck = {
+            "presentationId": deck_id,
+            "title": title,
+            "slides": [{"objectId": "p"}],
+            "revisionId": "rev-0",
+        }
+        self.presentations[deck_id] = deck
+        return deck
+
+    def presentations_create(self, body: dict[str, Any]) -> dict[str, Any]:
+        self._call("slides.presentations.create")
+        with self._lock:
+            deck_id = self._new_id("deck-")
+            title = body.get("title", "Untitled presentation")
+            self.files[deck_id] = {
+                "id": deck_id,
+                "name": title,
+                "mimeType": SLIDES_MIME,
+                "parents": ["root"],
+                "trashed": False,
+                "appProperties": {},
+            }
+            return dict(self._new_presentation(deck_id, title))
+
+    def presentations_get(self, deck_id: str) -> dict[str, Any]:
+        self._call("slides.presentations.get")
+        with self._lock:
+            deck = self.presentations.get(deck_id)
+            if deck is None:
+                raise FakeApiError(404, f"Requested entity was not found: {deck_id}")
+            return json.loads(json.dumps(deck))
+
+    def presentations_batch_update(
+        self, deck_id: str, body: dict[str, Any]
+    ) -> dict[str, Any]:
+        self._call("slides.presentations.batchUpdate")
+        with self._lock:
+            deck = self.presentations.get(deck_id)
+            if deck is None:
+                raise FakeApiError(404, f"Requested entity was not found: {deck_id}")
+            required = (body.get("writeControl") or {}).get("requiredRevisionId")
+            if required is not None and required != deck["revisionId"]:
+                raise FakeApiError(
+                    400,
+                    "The required revision ID does not match.",
+                    "failedPrecondition",
+                )
+            replies = []
+            for request in body.get("requests", []):
+                if "createSlide" in request:
+                    object_id = request["createSlide"].get("objectId") or (
+                        self._new_id("slide-")
+                    )
+                    deck["slides"].append({"objectId": object_id})
+                    replies.append({"createSlide": {"objectId": object_id}})
+                    continue
+                if "deleteObject" in request:
+                    object_id = request["deleteObject"]["objectId"]
+                    deck["slides"] = [
+                        s for s in deck["slides"] if s["objectId"] != object_id
+                    ]
+                replies.append({})
+            revision = int(deck["revisionId"].split("-")[1]) + 1
+            deck["revisionId"] = f"rev-{revision}"
+            return {
+                "presentationId": deck_id,
+                "replies": replies,
+                "writeControl": {"requiredRevisionId": deck["revisionId"]},
+            }
+
+    # ----- routing --------------------------------------------------------- #
+
+    def dispatch(
+        self,
+        http_method: str,
+        target: str,
+        headers: Any,
+        body: bytes,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer one HTTP request; returns ``(status, headers, body)``."""
+        parsed = urllib.parse.urlsplit(target)
+        path = parsed.path
+        params = dict(urllib.parse.parse_qsl(parsed.query))
+        try:
+            if path == "/batch/drive/v3" and http_method == "POST":
+                return self._batch(headers.get("content-type", ""), body)
+            status, payload, extra = self._route(
+                http_method, path, params, headers, body
+            )
+        except FakeApiError as exc:
+            status, payload, extra = exc.status, exc.body(), {}
+        if isinstance(payload, bytes):
+            return status, extra, payload
+        content = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        return status, {"Content-Type": "application/json", **extra}, content
+
+    def _media_request(
+        self, headers: Any, body: bytes, params: dict[str, str]
+    ) -> tuple[dict[str, Any], bytes]:
+        if params.get("uploadType") == "media":
+            return {}, body
+        parts = _parse_multipart(headers.get("content-type", ""), body)
+        metadata = json.loads(parts[0].get_payload(decode=True) or b"{}")
+        return metadata, parts[1].get_payload(decode=True)
+
+    def _route(self, http_method, path, params, headers, body):
+        as_json = json.loads(body) if body and not path.startswith("/upload/") else {}
+        upload_id = params.get("upload_id")
+        if upload_id and http_method == "PUT":
+            status, result = self.put_chunk(
+                upload_id, headers.get("content-range", ""), body
+            )
+            if status == 308:
+                extra = {"Range": f"bytes=0-{result - 1}"} if result else {}
+                return 308, None, extra
+            return 200, result, {}
+        if params.get("uploadType") == "resumable":
+            file_id = path.rsplit("/", 1)[1] if http_method == "PATCH" else None
+            metadata = json.loads(body) if body else {}
+            upload = self.start_upload(file_id, params, metadata)
+            location = f"{self.endpoint}{path}?uploadType=resumable&upload_id={upload}"
+            return 200, {}, {"Location": location}
+
+        if path in ("/drive/v3/files", "/upload/drive/v3/files"):
+            if http_method == "GET":
+                return 200, self.files_list(params), {}
+            if http_method == "POST":
+                if path.startswith("/upload/"):
+                    metadata, media = self._media_request(headers, body, params)
+                    return 200, self.files_create(metadata, media), {}
+                return 200, self.files_create(as_json), {}
+        match = re.fullmatch(r"(/upload)?/drive/v3/files/([^/]+)", path)
+        if match:
+            file_id = match.group(2)
+            if http_method == "GET":
+                if params.get("alt") == "media":
+                    self._call("drive.files.get")
+                    with self._lock:
+                        return 200, self._file(file_id).get("content", b""), {}
+                return 200, self.files_get(file_id), {}
+            if http_method == "PATCH":
+                if match.group(1):
+                    metadata, media = self._media_request(headers, body, params)
+                    return 200, self.files_update(file_id, params, metadata, media), {}
+                return 200, self.files_update(file_id, params, as_json), {}
+        if path == "/v1/presentations" and http_method == "POST":
+            return 200, self.presentations_create(as_json), {}
+        match = re.fullmatch(r"/v1/presentations/([^/:]+)(:batchUpdate)?", path)
+        if match:
+            if match.group(2) and http_method == "POST":
+                return 200, self.presentations_batch_update(match.group(1), as_json), {}
+            if not match.group(2) and http_method == "GET":
+                return 200, self.presentations_get(match.group(1)), {}
+        raise FakeApiError(404, f"No fake for {http_method} {path}")
+
+    def _batch(
+        self, content_type: str, body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        """``multipart/mixed`` in, ``multipart/mixed`` out, one part per call."""
+        boundary = "fake-batch-" + hashlib.md5(body).hexdigest()
+        out = []
+        for part in _parse_multipart(content_type, body):
+            # googleapiclient ends the request line with a bare "\n".
+            request_line, _, rest = part.get_payload(decode=True).partition(b"\n")
+            inner_method, inner_target, _ = request_line.decode("latin-1").split(" ", 2)
+            inner = BytesParser().parsebytes(rest)
+            inner_headers = {key.lower(): value for key, value in inner.items()}
+            inner_body = inner.get_payload(decode=True) or b""
+            status, headers, content = self.dispatch(
+                inner_method, inner_target, inner_headers, inner_body
+            )
+            content_id = part["Content-ID"] or ""
+            response_id = "<response-" + content_id.strip("<>") + ">"
+            header_text = "".join(f"{k}: {v}\r\n" for k, v in headers.items())
+            out.append(
+                f"--{boundary}\r\n"
+                f"Content-Type: application/http\r\n"
+                f"Content-ID: {response_id}\r\n\r\n"
+                f"HTTP/1.1 {status} FAKE\r\n{header_text}\r\n".encode("latin-1")
+                + content
+                + b"\r\n"
+            )
+        payload = b"".join(out) + f"--{boundary}--\r\n".encode("latin-1")
+        return (
+            200,
+            {"Content-Type": f"multipart/mixed; boundary={boundary}"},
+            payload,
+        )
+
+
+def _handler_for(server: FakeGoogleServer) -> type:
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _answer(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            with server._lock:
+                server.round_trips += 1
+            if server.latency:
+                time.sleep(server.latency)
+            headers = {k.lower(): v for k, v in self.headers.items()}
+            status, out_headers, content = server.dispatch(
+                self.command, self.path, headers, body
+            )
+            self.send_response(status)
+            for key, value in out_headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _answer
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            pass
+
+    return _Handler
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="slides.fakeserver")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--quota-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    server = FakeGoogleServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        quota_rate=args.quota_rate,
+        seed=args.seed,
+        port=args.port,
+    )
+    print(f"export BCD_SLIDES_API_ENDPOINT={server.endpoint}", flush=True)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,174 @@
+"""Client-side token-bucket rate limiting shared across processes.
+
+Parallel ``slides.cli`` processes each see Drive's per-user quota as theirs
+alone and trip ``userRateLimitExceeded`` together. :class:`TokenBucketLimiter`
+keeps one bucket per API (``drive``, ``slides``) in the cache directory; every
+process takes a token from the same bucket under an ``flock`` before each
+HTTP attempt, so N workers together stay at the configured rate.
+
+Configured by env var, off by default::
+
+    BCD_SLIDES_RATE_LIMIT="drive=10,slides=5"   # requests per second per API
+    BCD_SLIDES_RATE_BURST=10                    # bucket size (default: 1 s worth)
+
+The limiter is wired in as the ``throttle`` hook of
+:class:`slides.retry.RetryPolicy`, which sees every attempt — retries
+included — of every ``files()`` / ``presentations()`` call.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from slides.cache import default_cache_dir
+
+try:  # POSIX only; elsewhere the bucket is per-process.
+    import fcntl
+except ImportError:  # pragma: no cover - exercised on Windows only
+    fcntl = None
+
+
+def parse_rates(spec: str) -> dict[str, float]:
+    """Parse ``"drive=10,slides=5"`` into ``{"drive": 10.0, "slides": 5.0}``."""
+    rates: dict[str, float] = {}
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        api, sep, value = part.partition("=")
+        if not sep:
+            raise ValueError(f"Bad rate spec {part!r}; expected api=rps")
+        rate = float(value)
+        if rate <= 0:
+            raise ValueError(f"Rate for {api.strip()!r} must be positive")
+        rates[api.strip()] = rate
+    return rates
+
+
+class TokenBucketLimiter:
+    """Token buckets keyed by API name, persisted for cross-process sharing.
+
+    Parameters
+    ----------
+    rates:
+        Requests per second per API, e.g. ``{"drive": 10, "slides": 5}``.
+        Calls to APIs not listed here are not throttled.
+    state_dir:
+        Where bucket state and lock files live. ``None`` keeps buckets in
+        memory (per process).
+    burst:
+        Bucket capacity in tokens. Defaults to one second of traffic at each
+        API's rate (minimum 1).
+    clock, sleep:
+        Injection points for tests. ``clock`` must be wall time, since
+        processes compare timestamps written by each other.
+    """
+
+    def __init__(
+        self,
+        rates: dict[str, float],
+        *,
+        state_dir: Optional[Path] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._rates = dict(rates)
+        self._state_dir = Path(state_dir) if state_dir is not None else None
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._local_lock = threading.Lock()
+        self._memory: dict[str, dict[str, float]] = {}
+
+    @classmethod
+    def from_env(cls, env: dict | None = None) -> Optional["TokenBucketLimiter"]:
+        """Build from ``BCD_SLIDES_RATE_LIMIT`` / ``_BURST``; None when unset."""
+        if env is None:
+            env = os.environ
+        spec = env.get("BCD_SLIDES_RATE_LIMIT", "").strip()
+        if not spec:
+            return None
+        burst = env.get("BCD_SLIDES_RATE_BURST")
+        return cls(
+            parse_rates(spec),
+            state_dir=default_cache_dir(env) / "ratelimit",
+            burst=float(burst) if burst else None,
+        )
+
+    # ----- private --------------------------------------------------------- #
+
+    def _capacity(self, api: str) -> float:
+        if self._burst is not None:
+            return max(1.0, self._burst)
+        return max(1.0, self._rates[api])
+
+    @contextmanager
+    def _locked_state(self, api: str) -> Iterator[dict[str, float]]:
+        """Yield the mutable bucket state for ``api`` under a lock."""
+        with self._local_lock:
+            if self._state_dir is None or fcntl is None:
+                yield self._memory.setdefault(api, {})
+                return
+            self._state_dir.mkdir(parents=True, exist_ok=True)
+            lock_path = self._state_dir / f"{api}.lock"
+            state_path = self._state_dir / f"{api}.json"
+            with open(lock_path, "a+") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    try:
+                        state = json.loads(state_path.read_text(encoding="utf-8"))
+                    except (OSError, ValueError):
+                        state = {}
+                    yield state
+                    tmp_path = state_path.with_suffix(f".{os.getpid()}.tmp")
+                    tmp_path.write_text(json.dumps(state), encoding="utf-8")
+                    os.replace(tmp_path, state_path)
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _try_take(self, api: str) -> float:
+        """Take one token if available. Returns 0, or seconds until one is."""
+        rate = self._rates[api]
+        capacity = self._capacity(api)
+        with self._locked_state(api) as state:
+            now = self._clock()
+            tokens = float(state.get("tokens", capacity))
+            updated = float(state.get("updated", now))
+            tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+            state["updated"] = now
+            if tokens >= 1.0:
+                state["tokens"] = tokens - 1.0
+                return 0.0
+            state["tokens"] = tokens
+            return (1.0 - tokens) / rate
+
+    # ----- public ---------------------------------------------------------- #
+
+    @staticmethod
+    def api_for(method: str) -> str:
+        """``drive.files.list`` → ``drive``."""
+        return method.split(".", 1)[0]
+
+    def acquire(self, method: str) -> float:
+        """Block until the bucket for ``method``'s API has a token.
+
+        ``method`` is a ``googleapiclient`` method id or a bare API name.
+        Returns the seconds spent waiting (0 when unthrottled).
+        """
+        api = self.api_for(method)
+        if api not in self._rates:
+            return 0.0
+        waited = 0.0
+        while True:
+            wait = self._try_take(api)
+            if wait <= 0:
+                return waited
+            self._sleep(wait)
+            waited += wait
@@ -0,0 +1,303 @@
+"""Retry policy for Google API calls made by the Slides + Drive runner.
+
+Every ``request.execute()`` in :mod:`slides.runner` and :mod:`slides.cli`
+goes through :meth:`RetryPolicy.execute` (or :meth:`RetryPolicy.call` for
+non-``execute`` calls such as resumable-upload chunks). The policy retries
+transient failures — 408/429/5xx, 403 ``rateLimitExceeded`` /
+``userRateLimitExceeded`` and dropped connections — with capped exponential
+backoff and full jitter, and honours a ``Retry-After`` header when Drive
+sends one.
+
+Creates are not idempotent: blindly retrying a ``files.create`` whose first
+attempt reached Drive leaves a duplicate. Callers mark such calls
+``idempotent=False`` and may pass a ``recover`` callable that looks for the
+object the failed attempt may have created; if it finds one, that becomes
+the result instead of a second create. Without ``recover``, a
+non-idempotent call is only retried on rate-limit rejections, which Google
+returns before doing any work.
+
+Configuration comes from the caller or, for the CLI, from env vars via
+:meth:`RetryPolicy.from_env`:
+
+* ``BCD_SLIDES_RETRY_MAX_ATTEMPTS`` (default 5; ``1`` disables retries)
+* ``BCD_SLIDES_RETRY_BASE_DELAY`` seconds (default 1.0)
+* ``BCD_SLIDES_RETRY_MAX_DELAY`` seconds (default 32.0)
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import partial
+from typing import Any, Callable, Optional
+
+from slides.tracing import Tracer, describe_request
+
+
+#: HTTP statuses that are always worth another attempt.
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+#: 403 reasons Google uses for quota throttling (as opposed to permissions).
+RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+#: Upper bound on a server-supplied ``Retry-After`` we are willing to honour.
+MAX_RETRY_AFTER = 120.0
+
+
+def _status(exc: BaseException) -> Optional[int]:
+    return getattr(getattr(exc, "resp", None), "status", None)
+
+
+def _error_text(exc: BaseException) -> str:
+    content = getattr(exc, "content", b"") or b""
+    if isinstance(content, bytes):
+        content = content.decode("utf-8", "replace")
+    return f"{exc} {content}"
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """429, or a 403 whose reason is one of :data:`RATE_LIMIT_REASONS`."""
+    status = _status(exc)
+    if status == 429:
+        return True
+    if status == 403:
+        text = _error_text(exc)
+        return any(reason in text for reason in RATE_LIMIT_REASONS)
+    return False
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether ``exc`` is worth retrying at all."""
+    if isinstance(exc, (ConnectionError, TimeoutError)):
+        return True
+    return _status(exc) in RETRYABLE_STATUSES or is_rate_limited(exc)
+
+
+def method_id(request: Any) -> str:
+    """``googleapiclient`` requests carry e.g. ``drive.files.create``."""
+    value = getattr(request, "methodId", None)
+    return value if isinstance(value, str) else "unknown"
+
+
+class RetryPolicy:
+    """Capped exponential backoff with full jitter.
+
+    Parameters
+    ----------
+    max_attempts:
+        Total tries per call, including the first. ``1`` disables retries.
+    base_delay, max_delay:
+        Attempt ``n`` (0-based) sleeps ``uniform(0, min(max_delay,
+        base_delay * 2**n))`` seconds unless ``Retry-After`` says otherwise.
+    throttle:
+        Optional hook called with the method id before *every* attempt —
+        e.g. :meth:`slides.ratelimit.TokenBucketLimiter.acquire`.
+    sleep, rand:
+        Injection points for tests.
+
+    Every call that needed more than one attempt is appended to
+    :attr:`log`; the CLI drains it into each command's JSON output. When
+    :attr:`tracer` is set (a :class:`slides.tracing.Tracer`), every attempt
+    is also recorded as a span.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 32.0,
+        *,
+        throttle: Optional[Callable[[str], Any]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rand: Callable[[], float] = random.random,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._rand = rand
+        self.throttle = throttle
+        self.log: list[dict[str, Any]] = []
+        self.tracer: Optional[Tracer] = None
+
+    @classmethod
+    def from_env(
+        cls,
+        env: dict | None = None,
+        *,
+        throttle: Optional[Callable[[str], Any]] = None,
+    ) -> "RetryPolicy":
+        """Build a policy from the ``BCD_SLIDES_RETRY_*`` env vars."""
+        if env is None:
+            env = os.environ
+        return cls(
+            throttle=throttle,
+            max_attempts=int(env.get("BCD_SLIDES_RETRY_MAX_ATTEMPTS") or 5),
+            base_delay=float(env.get("BCD_SLIDES_RETRY_BASE_DELAY") or 1.0),
+            max_delay=float(env.get("BCD_SLIDES_RETRY_MAX_DELAY") or 32.0),
+        )
+
+    def copy(self) -> "RetryPolicy":
+        """Same settings, with its own empty :attr:`log` and no tracer."""
+        twin = copy.copy(self)
+        twin.log = []
+        twin.tracer = None
+        return twin
+
+    # ----- private --------------------------------------------------------- #
+
+    @staticmethod
+    def _retry_after(exc: BaseException) -> Optional[float]:
+        resp = getattr(exc, "resp", None)
+        getter = getattr(resp, "get", None)
+        raw = getter("retry-after") if callable(getter) else None
+        if not raw:
+            return None
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(raw)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def _start_span(self, method: str, attempt: int, detail: Optional[dict]):
+        if self.tracer is None:
+            return None
+        return self.tracer.start(method, attempt=attempt, **(detail or {}))
+
+    def _record(self, method: str, attempts: int, outcome: str) -> None:
+        if attempts > 1:
+            self.log.append(
+                {"method": method, "retries": attempts - 1, "outcome": outcome}
+            )
+
+    # ----- public ---------------------------------------------------------- #
+
+    def delay_for(self, attempt: int, exc: BaseException) -> float:
+        """Seconds to wait before retry number ``attempt + 1``."""
+        retry_after = self._retry_after(exc)
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_AFTER)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return self._rand() * ceiling
+
+    def call(
+        self,
+        fn: Callable[[], Any],
+        *,
+        method: str = "unknown",
+        idempotent: bool = True,
+        recover: Optional[Callable[[], Any]] = None,
+        detail: Optional[dict] = None,
+    ) -> Any:
+        """Run ``fn()`` under this policy and return its result.
+
+        ``recover`` (non-idempotent calls only) runs before each retry; a
+        non-``None`` return value is used as the result and stops retrying.
+        ``detail`` is extra span data for :attr:`tracer`.
+        """
+        attempts = 0
+        while True:
+            attempts += 1
+            if self.throttle is not None:
+                self.throttle(method)
+            span = self._start_span(method, attempts, detail)
+            try:
+                result = fn()
+            except Exception as exc:  # noqa: BLE001 — classified below
+                if span is not None:
+                    span.end(error=exc)
+                retryable = is_transient(exc)
+                if not idempotent and recover is None:
+                    retryable = is_rate_limited(exc)
+                if not retryable or attempts >= self.max_attempts:
+                    self._record(method, attempts, "failed")
+                    raise
+                self._sleep(self.delay_for(attempts - 1, exc))
+                if not idempotent and recover is not None:
+                    recovered = recover()
+                    if recovered is not None:
+                        self._record(method, attempts + 1, "recovered")
+                        return recovered
+                continue
+            if span is not None:
+                span.end(result=result)
+            self._record(method, attempts, "ok")
+            return result
+
+    async def acall(
+        self,
+        fn: Callable[[], Any],
+        *,
+        method: str = "unknown",
+        idempotent: bool = True,
+        recover: Optional[Callable[[], Any]] = None,
+        detail: Optional[dict] = None,
+    ) -> Any:
+        """Coroutine twin of :meth:`call` for :mod:`slides.aio`.
+
+        ``fn`` and ``recover`` return awaitables. Backoff uses
+        ``asyncio.sleep``; the (blocking) ``throttle`` hook runs in a worker
+        thread so one throttled call does not stall the event loop.
+        """
+        import asyncio
+
+        attempts = 0
+        while True:
+            attempts += 1
+            if self.throttle is not None:
+                await asyncio.to_thread(self.throttle, method)
+            span = self._start_span(method, attempts, detail)
+            try:
+                result = await fn()
+            except Exception as exc:  # noqa: BLE001 — classified below
+                if span is not None:
+                    span.end(error=exc)
+                retryable = is_transient(exc)
+                if not idempotent and recover is None:
+                    retryable = is_rate_limited(exc)
+                if not retryable or attempts >= self.max_attempts:
+                    self._record(method, attempts, "failed")
+                    raise
+                await asyncio.sleep(self.delay_for(attempts - 1, exc))
+                if not idempotent and recover is not None:
+                    recovered = await recover()
+                    if recovered is not None:
+                        self._record(method, attempts + 1, "recovered")
+                        return recovered
+                continue
+            if span is not None:
+                span.end(result=result)
+            self._record(method, attempts, "ok")
+            return result
+
+    def execute(self, request: Any, *, http: Any = None, **kwargs: Any) -> Any:
+        """``request.execute()`` under this policy. See :meth:`call`.
+
+        ``http`` overrides the transport for this call, as
+        ``request.execute(http=...)`` does; worker threads pass their own.
+        """
+        kwargs.setdefault("method", method_id(request))
+        if self.tracer is not None:
+            kwargs.setdefault("detail", describe_request(request))
+        fn = request.execute if http is None else partial(request.execute, http=http)
+        return self.call(fn, **kwargs)
+
+    def take_log(self) -> list[dict[str, Any]]:
+        """Return and clear the per-call retry log."""
+        log, self.log = self.log, []
+        return log
+
+
+#: Shared single-attempt policy — the default when no policy is supplied, so
+#: library callers keep exactly-once semantics unless they opt in.
+NO_RETRY = RetryPolicy(max_attempts=1)
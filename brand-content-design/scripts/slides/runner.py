@@ -13,16 +13,31 @@ where ``{root}`` is the Drive folder id given in
 ``BRAND_CONTENT_DRIVE_ROOT_ID`` if set, else the user's "My Drive" root.
 The :class:`DriveFolderMirror` helper creates and discovers folders along
 this chain idempotently — every level uses a list-then-create pattern so a
-re-run on the same brand never duplicates the intermediates.
+re-run on the same brand never duplicates the intermediates. An optional
+:class:`slides.cache.FolderIdCache` short-circuits the list step for levels
+resolved on a previous run.
 """
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Hashable,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+)
+
+from slides.cache import FolderIdCache
+from slides.retry import NO_RETRY, RetryPolicy, is_transient, method_id
 
 
 #: The single tool-owned root folder under whatever ``root_id`` the caller
@@ -42,6 +57,163 @@ POINTER_SUFFIX = ".slides.url"
 #: ``product-launch``. Folders without a date prefix are used verbatim.
 _DATE_PREFIX_RE = re.compile(r"^\d{4}-\d{2}-\d{2}-")
 
+#: Per-call bounds for chunked ``presentations.batchUpdate``. Well under the
+#: API's request-size ceiling so one oversized deck never fails as a unit.
+DEFAULT_BATCH_MAX_REQUESTS = 500
+DEFAULT_BATCH_MAX_BYTES = 2_000_000
+
+
+# --------------------------------------------------------------------------- #
+# batchUpdate chunking                                                        #
+# --------------------------------------------------------------------------- #
+
+
+class BatchUpdateChunkError(RuntimeError):
+    """A chunk of a chunked ``batchUpdate`` failed.
+
+    Earlier chunks were already applied to the deck. ``applied`` is how many
+    leading requests succeeded and ``replies`` their merged replies. The
+    underlying HttpError's ``resp`` is kept so callers still see its status.
+    """
+
+    def __init__(self, applied: int, replies: list[dict], cause: BaseException):
+        super().__init__(
+            f"batchUpdate chunk failed after {applied} request(s) were "
+            f"applied: {cause}"
+        )
+        self.applied = applied
+        self.replies = replies
+        self.resp = getattr(cause, "resp", None)
+
+
+def _referenced_object_ids(node: Any, found: set[str]) -> set[str]:
+    """Collect every ``*objectId`` / ``*objectIds`` value inside a request."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            lowered = key.lower()
+            if lowered.endswith("objectid") and isinstance(value, str):
+                found.add(value)
+            elif lowered.endswith("objectids") and isinstance(value, list):
+                found.update(v for v in value if isinstance(v, str))
+            elif lowered.endswith("objectids") and isinstance(value, dict):
+                # duplicateObject: {"objectIds": {old_id: new_id}}
+                found.update(v for v in value.values() if isinstance(v, str))
+            else:
+                _referenced_object_ids(value, found)
+    elif isinstance(node, list):
+        for item in node:
+            _referenced_object_ids(item, found)
+    return found
+
+
+def _created_object_ids(request: dict) -> set[str]:
+    """Object ids a ``create*`` / ``duplicateObject`` request brings into being."""
+    created: set[str] = set()
+    for kind, body in request.items():
+        if not isinstance(body, dict):
+            continue
+        if kind.startswith("create") and isinstance(body.get("objectId"), str):
+            created.add(body["objectId"])
+        elif kind == "duplicateObject":
+            created.update(
+                v for v in (body.get("objectIds") or {}).values()
+                if isinstance(v, str)
+            )
+    return created
+
+
+def chunk_batch_requests(
+    requests: Iterable[dict],
+    *,
+    max_requests: int = DEFAULT_BATCH_MAX_REQUESTS,
+    max_bytes: int = DEFAULT_BATCH_MAX_BYTES,
+) -> Iterator[list[dict]]:
+    """Split ``requests`` into in-order chunks bounded by count and JSON size.
+
+    Cuts prefer dependency boundaries: a chunk is only split before a request
+    that references no object created earlier in the same chunk, so a
+    ``createShape`` normally travels with the ``insertText`` /
+    ``updateShapeProperties`` calls that target it. When a dependent run is
+    itself larger than one chunk it is split anyway — chunks are submitted in
+    order, so later chunks still see the objects earlier ones created.
+
+    Consumes ``requests`` lazily and holds at most one chunk in memory. A
+    single request larger than ``max_bytes`` becomes a chunk of its own.
+    """
+    if max_requests < 1 or max_bytes < 1:
+        raise ValueError("max_requests and max_bytes must be positive")
+
+    # Each pending entry is (request, encoded_size, created_ids).
+    pending: list[tuple[dict, int, set[str]]] = []
+    pending_bytes = 0
+    created: set[str] = set()
+    last_safe_cut = 0  # index into ``pending`` where a cut is clean
+
+    def _reset(entries):
+        nonlocal pending, pending_bytes, created, last_safe_cut
+        pending = list(entries)
+        pending_bytes = sum(size for _, size, _ in pending)
+        created = set().union(*(ids for _, _, ids in pending))
+        last_safe_cut = 0
+
+    for request in requests:
+        size = len(json.dumps(request, separators=(",", ":"))) + 1
+        if pending and not (_referenced_object_ids(request, set()) & created):
+            last_safe_cut = len(pending)
+        while pending and (
+            len(pending) + 1 > max_requests or pending_bytes + size > max_bytes
+        ):
+            cut = last_safe_cut or len(pending)
+            yield [entry[0] for entry in pending[:cut]]
+            _reset(pending[cut:])
+        pending.append((request, size, _created_object_ids(request)))
+        pending_bytes += size
+        created |= pending[-1][2]
+    if pending:
+        yield [entry[0] for entry in pending]
+
+
+def _chunks_reporting_progress(
+    requests: Iterable[dict], replies: list[dict], **limits: int
+) -> Iterator[list[dict]]:
+    """:func:`chunk_batch_requests`, with input errors carrying the progress.
+
+    ``requests`` may be a lazy source such as :func:`iter_requests_file` that
+    fails part-way, after earlier chunks were sent. Such a failure is raised
+    as :class:`BatchUpdateChunkError` over ``replies``, the caller's merged
+    replies so far.
+    """
+    chunks = chunk_batch_requests(requests, **limits)
+    while True:
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            return
+        except Exception as exc:  # noqa: BLE001 — re-raised with progress
+            raise BatchUpdateChunkError(len(replies), replies, exc) from exc
+        yield chunk
+
+
+def iter_requests_file(path: Path) -> Iterator[dict]:
+    """Yield the Slides requests in a JSON Lines file, one per line.
+
+    The file is read a line at a time, so feeding this to
+    :func:`chunk_batch_requests` keeps memory bounded by one chunk however
+    many requests the file holds. Blank lines are skipped. Raises
+    :class:`ValueError` naming the line for invalid JSON or a non-object.
+    """
+    with open(path, encoding="utf-8") as fh:
+        for number, line in enumerate(fh, 1):
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{number}: invalid JSON ({exc})") from None
+            if not isinstance(request, dict):
+                raise ValueError(f"{path}:{number}: request must be a JSON object")
+            yield request
+
 
 class SlidesRunner:
     """Execute Slides + Drive operations against authenticated services.
@@ -52,37 +224,133 @@ class SlidesRunner:
         An authenticated ``googleapiclient`` ``slides v1`` resource.
     drive_service:
         An authenticated ``googleapiclient`` ``drive v3`` resource.
+    retry:
+        :class:`~slides.retry.RetryPolicy` applied to every API call.
+        Defaults to a single attempt.
     """
 
-    def __init__(self, slides_service, drive_service):
+    def __init__(
+        self,
+        slides_service,
+        drive_service,
+        retry: Optional[RetryPolicy] = None,
+    ):
         self._slides = slides_service
         self._drive = drive_service
+        self._retry = retry or NO_RETRY
+
+    @property
+    def retry(self) -> RetryPolicy:
+        """The retry policy shared with helpers built from this runner."""
+        return self._retry
 
     # ----------------------------------------------------------------- Slides
 
     def create_deck(self, title: str) -> str:
-        """Create a blank Slides deck and return its presentation id."""
-        response = (
-            self._slides.presentations()
-            .create(body={"title": title})
-            .execute()
+        """Create a blank Slides deck and return its presentation id.
+
+        Not idempotent — only rate-limit rejections are retried, since a
+        deck title is no key to look up a create that already landed.
+        """
+        response = self._retry.execute(
+            self._slides.presentations().create(body={"title": title}),
+            idempotent=False,
         )
         return response["presentationId"]
 
     def apply_batch_update(
-        self, deck_id: str, requests: list[dict]
+        self,
+        deck_id: str,
+        requests: list[dict],
+        *,
+        chunked: bool = False,
+        max_requests: int = DEFAULT_BATCH_MAX_REQUESTS,
+        max_bytes: int = DEFAULT_BATCH_MAX_BYTES,
     ) -> dict[str, Any]:
         """Execute a ``presentations.batchUpdate`` and return the raw response.
 
         ``requests`` is a list of Slides API request objects. This runner does
         not author or validate them — the caller owns that.
+
+        With ``chunked=True`` the list is split by :func:`chunk_batch_requests`
+        and handed to :meth:`apply_batch_update_chunked`.
         """
-        return (
-            self._slides.presentations()
-            .batchUpdate(presentationId=deck_id, body={"requests": requests})
-            .execute()
+        if chunked:
+            return self.apply_batch_update_chunked(
+                deck_id,
+                requests,
+                max_requests=max_requests,
+                max_bytes=max_bytes,
+            )
+        # Replaying a batch that already landed would duplicate its edits.
+        return self._retry.execute(
+            self._slides.presentations().batchUpdate(
+                presentationId=deck_id, body={"requests": requests}
+            ),
+            idempotent=False,
         )
 
+    def apply_batch_update_chunked(
+        self,
+        deck_id: str,
+        requests: Iterable[dict],
+        *,
+        max_requests: int = DEFAULT_BATCH_MAX_REQUESTS,
+        max_bytes: int = DEFAULT_BATCH_MAX_BYTES,
+        required_revision_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Submit ``requests`` as several ordered ``batchUpdate`` calls.
+
+        Each chunk carries ``writeControl.requiredRevisionId`` from the
+        previous response, so a concurrent edit to the deck between chunks
+        fails loudly instead of interleaving. ``required_revision_id`` pins
+        the first chunk too.
+
+        A revision-pinned chunk is safe to retry: if the first attempt landed,
+        the replay fails the revision check instead of applying twice.
+
+        Returns one response shaped like a single ``batchUpdate``: ``replies``
+        line up index-for-index with ``requests``; ``writeControl`` is the
+        last chunk's. ``batchCount`` records how many calls were made. Raises
+        :class:`BatchUpdateChunkError` if a chunk fails, or if ``requests``
+        itself raises (e.g. a bad line in a requests file) part-way through.
+        """
+        replies: list[dict] = []
+        write_control: Optional[dict] = None
+        revision = required_revision_id
+        batch_count = 0
+        for chunk in _chunks_reporting_progress(
+            requests, replies, max_requests=max_requests, max_bytes=max_bytes
+        ):
+            body: dict[str, Any] = {"requests": chunk}
+            if revision:
+                body["writeControl"] = {"requiredRevisionId": revision}
+            try:
+                response = self._retry.execute(
+                    self._slides.presentations().batchUpdate(
+                        presentationId=deck_id, body=body
+                    ),
+                    idempotent=bool(revision),
+                )
+            except Exception as exc:  # noqa: BLE001 — re-raised with progress
+                raise BatchUpdateChunkError(len(replies), replies, exc) from exc
+            batch_count += 1
+            chunk_replies = list(response.get("replies", []))
+            # The API returns one reply per request; pad defensively so the
+            # merged indices never drift.
+            chunk_replies += [{}] * (len(chunk) - len(chunk_replies))
+            replies.extend(chunk_replies)
+            write_control = response.get("writeControl") or write_control
+            revision = (write_control or {}).get("requiredRevisionId")
+        merged: dict[str, Any] = {
+            "presentationId": deck_id,
+            "replies": replies,
+            "batchCount": batch_count,
+        }
+        if write_control is not None:
+            merged["writeControl"] = write_control
+        return merged
+
     # ------------------------------------------------------------------ Drive
 
     def move_to_folder(self, deck_id: str, folder_id: str) -> None:
@@ -92,21 +360,17 @@ class SlidesRunner:
         target folder as the new parent. No-op vs. the destination folder is
         not checked — caller is responsible for that.
         """
-        file_metadata = (
-            self._drive.files()
-            .get(fileId=deck_id, fields="parents")
-            .execute()
+        file_metadata = self._retry.execute(
+            self._drive.files().get(fileId=deck_id, fields="parents")
         )
         previous_parents = ",".join(file_metadata.get("parents", []))
-        (
-            self._drive.files()
-            .update(
+        self._retry.execute(
+            self._drive.files().update(
                 fileId=deck_id,
                 addParents=folder_id,
                 removeParents=previous_parents,
                 fields="id, parents",
             )
-            .execute()
         )
 
     # ------------------------------------------------------------------- Pure
@@ -122,6 +386,147 @@ class SlidesRunner:
 # --------------------------------------------------------------------------- #
 
 
+class StaleFolderError(RuntimeError):
+    """A cached Drive folder id turned out to be deleted (404) or trashed.
+
+    Raised after the stale id (and its cached descendants) has already been
+    dropped from the :class:`~slides.cache.FolderIdCache`, so re-resolving
+    the chain once is enough to recover.
+    """
+
+    def __init__(self, folder_id: str):
+        super().__init__(f"Cached Drive folder {folder_id} is gone or trashed")
+        self.folder_id = folder_id
+
+
+def _http_status(exc: BaseException) -> Optional[int]:
+    """``googleapiclient.errors.HttpError`` carries ``.resp.status``."""
+    return getattr(getattr(exc, "resp", None), "status", None)
+
+
+#: ``files.list`` page size for listings; Drive caps it at 1000.
+LIST_PAGE_SIZE = 1000
+
+#: Drive accepts at most 100 calls in one batch request.
+MAX_BATCH_CALLS = 100
+
+
+class _BatchPartsFailed(Exception):
+    """Some calls in a batch failed transiently; carries the first one's
+    ``resp`` so :class:`~slides.retry.RetryPolicy` backs off as usual."""
+
+    def __init__(self, first: BaseException):
+        super().__init__(str(first))
+        self.resp = getattr(first, "resp", None)
+        self.content = getattr(first, "content", b"")
+        self.first = first
+
+
+def run_drive_batch(
+    drive_service,
+    calls: dict[Hashable, Callable[[], Any]],
+    retry: RetryPolicy = NO_RETRY,
+) -> dict[Hashable, Any]:
+    """Send independent Drive calls as multipart batch requests.
+
+    ``calls`` maps a caller-chosen key to a zero-argument factory returning
+    an unexecuted ``googleapiclient`` request (e.g.
+    ``lambda: drive.files().list(q=...)``). Everything goes out through
+    ``new_batch_http_request`` in groups of :data:`MAX_BATCH_CALLS`, so N
+    lookups cost ``ceil(N / 100)`` round trips instead of N.
+
+    Returns ``{key: response_dict_or_exception}``. Only idempotent calls
+    belong here: calls that fail transiently are re-sent in a follow-up
+    batch under ``retry``; other per-call errors are returned, not raised.
+    """
+    results: dict[Hashable, Any] = {}
+    pending = list(calls)
+
+    def _send() -> None:
+        nonlocal pending
+        for start in range(0, len(pending), MAX_BATCH_CALLS):
+            keys = pending[start : start + MAX_BATCH_CALLS]
+            by_id = {str(index): key for index, key in enumerate(keys)}
+
+            def _collect(request_id, response, exception, by_id=by_id):
+                results[by_id[request_id]] = (
+                    exception if exception is not None else response
+                )
+
+            batch = drive_service.new_batch_http_request(callback=_collect)
+            for request_id, key in by_id.items():
+                request = calls[key]()
+                # The limiter sees each inner call; RetryPolicy adds one for
+                # the batch envelope itself.
+                if retry.throttle is not None and request_id != "0":
+                    retry.throttle(method_id(request))
+                batch.add(request, request_id=request_id)
+            batch.execute()
+        pending = [
+            key
+            for key in pending
+            if isinstance(results.get(key), Exception) and is_transient(results[key])
+        ]
+        if pending:
+            raise _BatchPartsFailed(results[pending[0]])
+
+    try:
+        retry.call(_send, method="drive.batch", detail={"calls": len(pending)})
+    except _BatchPartsFailed:
+        pass  # per-call errors stay in ``results``
+    return results
+
+
+def _walk_path(
+    names: Iterable[str], root_id: str, cache: Optional[FolderIdCache]
+) -> Generator[tuple[str, str, bool], tuple[Optional[str], bool], tuple]:
+    """I/O-free core of ``resolve_path``, shared by the sync and async mirrors.
+
+    Skips the deepest prefix of ``names`` already in ``cache``, then yields
+    ``(name, parent_id, parent_is_new)`` for each remaining level. The caller
+    looks the level up (or creates it) and sends back ``(folder_id,
+    created)``; a None id ends the walk. Returns every level's id, padded
+    with None below the first missing one.
+    """
+    names = tuple(names)
+    ids: list[str] = []
+    parent_id = root_id
+    if cache is not None:
+        for name in names:
+            cached = cache.get(parent_id, name)
+            if cached is None:
+                break
+            ids.append(cached)
+            parent_id = cached
+    parent_is_new = False
+    for name in names[len(ids) :]:
+        folder_id, parent_is_new = yield name, parent_id, parent_is_new
+        if folder_id is None:
+            break
+        ids.append(folder_id)
+        parent_id = folder_id
+    return tuple(ids) + (None,) * (len(names) - len(ids))
+
+
+def _revalidate_stale(method):
+    """Re-run a mirror method once after a :class:`StaleFolderError`.
+
+    The first attempt has already evicted the stale cache entries, so the
+    retry walks Drive from the deepest still-trusted ancestor.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except StaleFolderError:
+            if self._cache is None:
+                raise
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class DriveFolderMirror:
     """Idempotent create/find/trash for the brand-content Drive convention.
 
@@ -139,25 +544,54 @@ class DriveFolderMirror:
         Drive folder id that ``brand-content/`` lives under. Pass the value
         of ``BRAND_CONTENT_DRIVE_ROOT_ID`` from environment, or ``None`` /
         ``"root"`` to use the user's My Drive root.
+    cache:
+        Optional :class:`~slides.cache.FolderIdCache` consulted before every
+        ``files.list``. Cached ids are trusted until Drive reports them as
+        deleted or trashed, at which point they are evicted and the chain is
+        re-resolved once.
+    retry:
+        :class:`~slides.retry.RetryPolicy` applied to every Drive call —
+        normally the owning :class:`SlidesRunner`'s. Defaults to a single
+        attempt.
     """
 
     FOLDER_MIME = "application/vnd.google-apps.folder"
 
-    def __init__(self, drive_service, root_id: Optional[str] = None):
+    def __init__(
+        self,
+        drive_service,
+        root_id: Optional[str] = None,
+        cache: Optional[FolderIdCache] = None,
+        retry: Optional[RetryPolicy] = None,
+    ):
         self._drive = drive_service
         self._root_id = root_id or "root"
+        self._cache = cache
+        self._retry = retry or NO_RETRY
 
     # ----- private --------------------------------------------------------- #
 
-    def _find_or_create_folder(self, name: str, parent_id: str) -> str:
-        """Return the folder id of ``name`` under ``parent_id``, creating it
-        if absent.
+    def _stale(self, folder_id: str) -> None:
+        """Evict ``folder_id`` from the cache and raise :class:`StaleFolderError`."""
+        if self._cache is not None:
+            self._cache.invalidate(folder_id)
+        raise StaleFolderError(folder_id)
 
-        IDEMPOTENT by design: ``files.list`` is the only safe way to avoid
-        accumulating duplicate intermediate folders across runs, since the
-        Drive API has no native ``upsert``. Single-quote escaping handles
-        slugs that happen to contain apostrophes.
+    def _lookup_folder(self, name: str, parent_id: str) -> Optional[str]:
+        """Return the id of folder ``name`` under ``parent_id`` or None.
+
+        Cache first, then one ``files.list``. Hits from Drive are written back
+        to the cache; misses are not cached.
         """
+        if self._cache is not None:
+            cached = self._cache.get(parent_id, name)
+            if cached is not None:
+                return cached
+        response = self._retry.execute(self._list_folder_request(name, parent_id))
+        return self._remember(name, parent_id, response)
+
+    def _list_folder_request(self, name: str, parent_id: str):
+        """Unexecuted ``files.list`` for folder ``name`` under ``parent_id``."""
         escaped = name.replace("'", r"\'")
         query = (
             f"name = '{escaped}' "
@@ -165,51 +599,169 @@ class DriveFolderMirror:
             f"and mimeType = '{self.FOLDER_MIME}' "
             f"and trashed = false"
         )
-        response = (
-            self._drive.files()
-            .list(q=query, fields="files(id, name)", pageSize=1)
-            .execute()
+        return self._drive.files().list(
+            q=query, fields="files(id, name)", pageSize=1
         )
+
+    def _remember(self, name: str, parent_id: str, response: dict) -> Optional[str]:
+        """First folder id in a ``files.list`` response, written to the cache."""
         files = response.get("files", [])
-        if files:
-            return files[0]["id"]
-        created = (
-            self._drive.files()
-            .create(
-                body={
-                    "name": name,
-                    "mimeType": self.FOLDER_MIME,
-                    "parents": [parent_id],
-                },
-                fields="id",
+        if not files:
+            return None
+        folder_id = files[0]["id"]
+        if self._cache is not None:
+            self._cache.put(parent_id, name, folder_id)
+        return folder_id
+
+    def _lookup_folders(
+        self, pairs: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], Optional[str]]:
+        """Batch form of :meth:`_lookup_folder` for independent lookups.
+
+        ``pairs`` are ``(name, parent_id)``. Cache hits cost nothing; all
+        misses share one batch request. Raises the first per-call error.
+        """
+        found: dict[tuple[str, str], Optional[str]] = {}
+        misses: dict[Hashable, Callable[[], Any]] = {}
+        for name, parent_id in pairs:
+            cached = (
+                self._cache.get(parent_id, name) if self._cache is not None else None
             )
-            .execute()
-        )
+            if cached is not None:
+                found[(name, parent_id)] = cached
+            else:
+                misses[(name, parent_id)] = functools.partial(
+                    self._list_folder_request, name, parent_id
+                )
+        for key, response in run_drive_batch(self._drive, misses, self._retry).items():
+            if isinstance(response, Exception):
+                raise response
+            found[key] = self._remember(key[0], key[1], response)
+        return found
+
+    def _find_or_create_folder(self, name: str, parent_id: str) -> str:
+        """Return the folder id of ``name`` under ``parent_id``, creating it
+        if absent.
+
+        IDEMPOTENT by design: ``files.list`` is the only safe way to avoid
+        accumulating duplicate intermediate folders across runs, since the
+        Drive API has no native ``upsert``. Single-quote escaping handles
+        slugs that happen to contain apostrophes.
+
+        A create that 404s or lands in the trash means ``parent_id`` came
+        from a stale cache entry; that raises :class:`StaleFolderError`.
+
+        The create is retried only after re-listing: if a failed attempt
+        actually created the folder, that folder is returned instead.
+        """
+        existing = self._lookup_folder(name, parent_id)
+        if existing is not None:
+            return existing
+        return self._create_folder(name, parent_id)
+
+    def _create_folder(self, name: str, parent_id: str) -> str:
+        """Create folder ``name`` under ``parent_id`` without looking first.
+
+        Only for parents this process has just created (nothing can be in
+        them yet) or after a lookup missed. Stale parents and retries are
+        handled as in :meth:`_find_or_create_folder`.
+        """
+
+        def _recover() -> Optional[dict]:
+            found = self._lookup_folder(name, parent_id)
+            return {"id": found} if found is not None else None
+
+        try:
+            created = self._retry.execute(
+                self._drive.files().create(
+                    body={
+                        "name": name,
+                        "mimeType": self.FOLDER_MIME,
+                        "parents": [parent_id],
+                    },
+                    fields="id, trashed",
+                ),
+                idempotent=False,
+                recover=_recover,
+            )
+        except Exception as exc:  # noqa: BLE001 — match cli.py error handling
+            if _http_status(exc) == 404:
+                self._stale(parent_id)
+            raise
+        if created.get("trashed") is True:
+            self._stale(parent_id)
+        if self._cache is not None:
+            self._cache.put(parent_id, name, created["id"])
         return created["id"]
 
+    @staticmethod
+    def _kind_subfolder(kind: str) -> str:
+        if kind == "presentations":
+            return PRESENTATIONS_SUBFOLDER
+        if kind == "templates":
+            return TEMPLATES_SUBFOLDER
+        raise ValueError(
+            f"kind must be 'presentations' or 'templates', got {kind!r}"
+        )
+
+    def _find_kind_folder(self, brand_name: str, kind: str) -> Optional[str]:
+        return self.resolve_path(
+            (BRAND_CONTENT_ROOT_NAME, brand_name, self._kind_subfolder(kind))
+        )[-1]
+
     # ----- public: brand chain -------------------------------------------- #
 
+    @_revalidate_stale
+    def resolve_path(
+        self, names: Iterable[str], *, create: bool = False
+    ) -> tuple[Optional[str], ...]:
+        """Resolve ``{root}/names[0]/names[1]/…`` in one pass.
+
+        Returns the folder id of every level, in order, so callers can keep
+        them. The walk starts below the deepest prefix already in the cache
+        and looks each remaining level up once. With ``create``, missing
+        levels are created. A folder's children are created without a lookup
+        when the folder itself was just created, since it cannot have any.
+        Without ``create`` the walk stops at the first missing level, and
+        that level and everything below it are None.
+        """
+        walk = _walk_path(names, self._root_id, self._cache)
+        reply = None
+        while True:
+            try:
+                name, parent_id, parent_is_new = walk.send(reply)
+            except StopIteration as done:
+                return done.value
+            folder_id = None if parent_is_new else self._lookup_folder(name, parent_id)
+            if folder_id is None and create:
+                reply = (self._create_folder(name, parent_id), True)
+            else:
+                reply = (folder_id, False)
+
     def ensure_brand_folder(self, brand_name: str) -> str:
         """Create or find ``{root}/brand-content/{brand_name}/``. Returns id.
 
-        Walks the chain in two steps (root → brand-content → brand) so each
-        intermediate is found-or-created independently. Re-running for the
-        same brand never duplicates.
+        Each level of the chain (root → brand-content → brand) is
+        found-or-created independently, so re-running for the same brand
+        never duplicates.
         """
-        brand_content_id = self._find_or_create_folder(
-            BRAND_CONTENT_ROOT_NAME, self._root_id
-        )
-        return self._find_or_create_folder(brand_name, brand_content_id)
+        return self.resolve_path(
+            (BRAND_CONTENT_ROOT_NAME, brand_name), create=True
+        )[-1]
 
     def ensure_presentations_folder(self, brand_name: str) -> str:
         """Create or find ``brand-content/{brand}/presentations/``."""
-        brand_id = self.ensure_brand_folder(brand_name)
-        return self._find_or_create_folder(PRESENTATIONS_SUBFOLDER, brand_id)
+        return self.resolve_path(
+            (BRAND_CONTENT_ROOT_NAME, brand_name, PRESENTATIONS_SUBFOLDER),
+            create=True,
+        )[-1]
 
     def ensure_templates_folder(self, brand_name: str) -> str:
         """Create or find ``brand-content/{brand}/templates/``."""
-        brand_id = self.ensure_brand_folder(brand_name)
-        return self._find_or_create_folder(TEMPLATES_SUBFOLDER, brand_id)
+        return self.resolve_path(
+            (BRAND_CONTENT_ROOT_NAME, brand_name, TEMPLATES_SUBFOLDER),
+            create=True,
+        )[-1]
 
     def ensure_render_folder(
         self,
@@ -218,15 +770,15 @@ class DriveFolderMirror:
         render_slug: str,
     ) -> str:
         """Create or find ``brand-content/{brand}/{kind}/{render_slug}/``."""
-        if kind == "presentations":
-            parent = self.ensure_presentations_folder(brand_name)
-        elif kind == "templates":
-            parent = self.ensure_templates_folder(brand_name)
-        else:
-            raise ValueError(
-                f"kind must be 'presentations' or 'templates', got {kind!r}"
-            )
-        return self._find_or_create_folder(render_slug, parent)
+        return self.resolve_path(
+            (
+                BRAND_CONTENT_ROOT_NAME,
+                brand_name,
+                self._kind_subfolder(kind),
+                render_slug,
+            ),
+            create=True,
+        )[-1]
 
     def find_render_folder(
         self,
@@ -239,61 +791,133 @@ class DriveFolderMirror:
         Unlike ``ensure_render_folder`` this never creates intermediates —
         if the brand or kind subfolder is missing, we short-circuit to None.
         """
-        if kind not in ("presentations", "templates"):
-            raise ValueError(
-                f"kind must be 'presentations' or 'templates', got {kind!r}"
+        return self.resolve_path(
+            (
+                BRAND_CONTENT_ROOT_NAME,
+                brand_name,
+                self._kind_subfolder(kind),
+                render_slug,
             )
+        )[-1]
 
-        def _lookup(name: str, parent_id: str) -> Optional[str]:
-            escaped = name.replace("'", r"\'")
-            query = (
-                f"name = '{escaped}' "
-                f"and '{parent_id}' in parents "
-                f"and mimeType = '{self.FOLDER_MIME}' "
-                f"and trashed = false"
-            )
-            res = (
-                self._drive.files()
-                .list(q=query, fields="files(id)", pageSize=1)
-                .execute()
+    def find_render_folders(
+        self, brand_name: str, kind: str, render_slugs: Iterable[str]
+    ) -> dict[str, Optional[str]]:
+        """Batch :meth:`find_render_folder` for several slugs of one kind.
+
+        The shared chain is walked once; the slugs are looked up together in
+        one batch request. Slugs that do not exist map to None.
+        """
+        slugs = list(render_slugs)
+        kind_id = self._find_kind_folder(brand_name, kind)
+        if not kind_id:
+            return {slug: None for slug in slugs}
+        found = self._lookup_folders((slug, kind_id) for slug in slugs)
+        return {slug: found[(slug, kind_id)] for slug in slugs}
+
+    def list_render_folder_names(
+        self, brand_name: str, kind: str, name_contains: str
+    ) -> list[str]:
+        """Names of the kind folder's live subfolders matching ``name_contains``.
+
+        One paginated ``files.list`` (``name contains``) instead of a lookup
+        per name. Drive's ``contains`` is a token/prefix match, so callers
+        should filter the names they get back. Empty if the kind folder does
+        not exist.
+        """
+        kind_id = self._find_kind_folder(brand_name, kind)
+        if not kind_id:
+            return []
+        escaped = name_contains.replace("'", r"\'")
+        query = (
+            f"name contains '{escaped}' "
+            f"and '{kind_id}' in parents "
+            f"and mimeType = '{self.FOLDER_MIME}' "
+            f"and trashed = false"
+        )
+        names: list[str] = []
+        page_token: Optional[str] = None
+        while True:
+            response = self._retry.execute(
+                self._drive.files().list(
+                    q=query,
+                    fields="nextPageToken, files(name)",
+                    pageSize=LIST_PAGE_SIZE,
+                    pageToken=page_token,
+                )
             )
-            files = res.get("files", [])
-            return files[0]["id"] if files else None
+            names.extend(f["name"] for f in response.get("files", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return names
 
-        brand_content_id = _lookup(BRAND_CONTENT_ROOT_NAME, self._root_id)
-        if not brand_content_id:
-            return None
-        brand_id = _lookup(brand_name, brand_content_id)
-        if not brand_id:
-            return None
-        kind_subfolder = (
-            PRESENTATIONS_SUBFOLDER
-            if kind == "presentations"
-            else TEMPLATES_SUBFOLDER
+    def trash_render_folders(self, folder_ids: Iterable[str]) -> None:
+        """Batch :meth:`trash_render_folder`: one request for all ids.
+
+        Same semantics per folder — cache evicted, a 404 is ignored. The
+        first other error is raised after the whole batch has run.
+        """
+        ids = list(dict.fromkeys(folder_ids))
+        if self._cache is not None:
+            for folder_id in ids:
+                self._cache.invalidate(folder_id)
+        results = run_drive_batch(
+            self._drive,
+            {
+                folder_id: functools.partial(
+                    self._drive.files().update,
+                    fileId=folder_id,
+                    body={"trashed": True},
+                )
+                for folder_id in ids
+            },
+            self._retry,
         )
-        kind_id = _lookup(kind_subfolder, brand_id)
-        if not kind_id:
-            return None
-        return _lookup(render_slug, kind_id)
+        for result in results.values():
+            if isinstance(result, Exception) and _http_status(result) != 404:
+                raise result
 
     def trash_render_folder(self, folder_id: str) -> None:
         """Soft-delete a render folder. Drive cascades to its contents.
 
         Idempotent: a 404 (folder already gone) is swallowed. Drive retains
         trashed items for 30 days, so this is reversible from the Drive UI.
+        The folder and anything cached beneath it are evicted from the cache.
         """
+        if self._cache is not None:
+            self._cache.invalidate(folder_id)
         try:
-            (
-                self._drive.files()
-                .update(fileId=folder_id, body={"trashed": True})
-                .execute()
+            self._retry.execute(
+                self._drive.files().update(
+                    fileId=folder_id, body={"trashed": True}
+                )
             )
         except Exception as exc:  # noqa: BLE001 — match cli.py error handling
-            status = getattr(getattr(exc, "resp", None), "status", None)
-            if status == 404:
+            if _http_status(exc) == 404:
                 return
             raise
 
+    def invalidate_cache(self, folder_id: Optional[str] = None) -> int:
+        """Evict ``folder_id`` and its cached descendants (all when None).
+
+        Returns the number of cache entries removed; 0 without a cache.
+        """
+        if self._cache is None:
+            return 0
+        return self._cache.invalidate(folder_id)
+
+    def cached_brand_folder(self, brand_name: str) -> Optional[str]:
+        """Return the cached id of ``brand-content/{brand_name}/`` or None.
+
+        Pure cache read — never calls Drive.
+        """
+        if self._cache is None:
+            return None
+        brand_content_id = self._cache.get(self._root_id, BRAND_CONTENT_ROOT_NAME)
+        if brand_content_id is None:
+            return None
+        return self._cache.get(brand_content_id, brand_name)
+
     # ----- public: pure ---------------------------------------------------- #
 
     @staticmethod
@@ -327,6 +951,7 @@ def write_slides_url_file(
     local_dir: Path,
     deck_id: str,
     folder_id: str,
+    artifacts: Optional[dict[str, dict[str, Any]]] = None,
 ) -> Path:
     """Write a JSON pointer file with deck + folder ids/urls.
 
@@ -337,16 +962,25 @@ def write_slides_url_file(
             "folder_id": "...",
             "deck_url": "...",
             "folder_url": "...",
-            "written_at": "2026-05-27T12:34:56+00:00"
+            "written_at": "2026-05-27T12:34:56+00:00",
+            "artifacts": {
+                "deck": {"file_id": "...", "md5": "..."},
+                "pdf": {"file_id": "...", "md5": "..."}
+            }
         }
+
+    ``artifacts`` (Drive file id + local MD5 per mirrored file) is only
+    written when given; incremental re-mirrors compare against it.
     """
-    payload = {
+    payload: dict[str, Any] = {
         "deck_id": deck_id,
         "folder_id": folder_id,
         "deck_url": SlidesRunner.deck_url(deck_id),
         "folder_url": DriveFolderMirror.folder_url(folder_id),
         "written_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
     }
+    if artifacts is not None:
+        payload["artifacts"] = artifacts
     path = pointer_file_path(local_dir)
     path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
     return path
@@ -0,0 +1,17 @@
+"""Shared fixtures for the slides test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    """Point every on-disk cache at a per-test temp dir.
+
+    Keeps the unit tests from reading or writing the developer's real
+    ``~/.cache/brand-content-design/slides``.
+    """
+    cache_dir = tmp_path / "bcd-slides-cache"
+    monkeypatch.setenv("BCD_SLIDES_CACHE_DIR", str(cache_dir))
+    return cache_dir
@@ -0,0 +1,273 @@
+"""Unit tests for slides.aio — httpx MockTransport, no network."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from slides import cli  # noqa: E402
+from slides.aio import (  # noqa: E402
+    AsyncDriveFolderMirror,
+    AsyncGoogleClient,
+    AsyncHttpError,
+    AsyncSlidesRunner,
+)
+from slides.cache import FolderIdCache  # noqa: E402
+from slides.retry import RetryPolicy  # noqa: E402
+
+
+class FakeCreds:
+    valid = True
+
+    def apply(self, headers):
+        headers["authorization"] = "Bearer test"
+
+
+class FakeDrive:
+    """Tiny in-memory Drive: folders by (parent, name), plus a call log."""
+
+    def __init__(self):
+        self.folders: dict[tuple[str, str], str] = {}
+        self.calls: list[tuple[str, str]] = []
+        self.fail_next: list[int] = []
+        self.trashed: set[str] = set()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, request.url.path))
+        assert request.headers["authorization"] == "Bearer test"
+        if self.fail_next:
+            return httpx.Response(self.fail_next.pop(0), json={"error": {}})
+        if request.method == "GET" and "contains" in request.url.params.get("q", ""):
+            query = request.url.params["q"]
+            part = query.split("name contains '", 1)[1].split("'", 1)[0]
+            parent = query.split("and '", 1)[1].split("'", 1)[0]
+            names = [n for (p, n) in self.folders if p == parent and part in n]
+            return httpx.Response(200, json={"files": [{"name": n} for n in names]})
+        if request.method == "GET" and request.url.path.endswith("/files"):
+            query = request.url.params["q"]
+            name = query.split("name = '", 1)[1].split("'", 1)[0]
+            parent = query.split("and '", 1)[1].split("'", 1)[0]
+            folder_id = self.folders.get((parent, name))
+            return httpx.Response(
+                200, json={"files": [{"id": folder_id}] if folder_id else []}
+            )
+        if request.method == "POST" and request.url.path.endswith("/files"):
+            body = json.loads(request.content)
+            if body["parents"][0] not in {"root", *self.folders.values()}:
+                return httpx.Response(404, json={"error": {"code": 404}})
+            folder_id = f"f{len(self.folders) + 1}"
+            self.folders[(body["parents"][0], body["name"])] = folder_id
+            return httpx.Response(200, json={"id": folder_id, "trashed": False})
+        folder_id = request.url.path.rsplit("/", 1)[-1]
+        if request.method == "PATCH" and folder_id in self.folders.values():
+            self.trashed.add(folder_id)
+            return httpx.Response(200, json={"id": folder_id})
+        return httpx.Response(404, json={"error": {"code": 404}})
+
+
+def _client(handler, **kwargs):
+    transport = httpx.MockTransport(handler)
+    return AsyncGoogleClient(
+        FakeCreds(),
+        http_client=httpx.AsyncClient(transport=transport),
+        **kwargs,
+    )
+
+
+def test_concurrent_renders_share_intermediate_folders():
+    drive = FakeDrive()
+
+    async def _main():
+        mirror = AsyncDriveFolderMirror(_client(drive))
+        folder_ids = await asyncio.gather(
+            *(
+                mirror.ensure_render_folder("acme", "presentations", slug)
+                for slug in ("a", "b", "c")
+            )
+        )
+        return folder_ids, mirror._locks
+
+    folder_ids, locks = asyncio.run(_main())
+
+    assert len(set(folder_ids)) == 3
+    assert locks == {}  # per-folder locks are dropped once resolved
+    # brand-content, acme, presentations once each + three renders.
+    creates = [c for c in drive.calls if c[0] == "POST"]
+    assert len(creates) == 6
+
+
+def test_stale_cached_folder_is_revalidated_once_per_call():
+    drive = FakeDrive()
+    drive.folders[("root", "brand-content")] = "bc"
+    cache = FolderIdCache()
+    cache.put("root", "brand-content", "bc")
+    cache.put("bc", "acme", "deleted")
+
+    async def _main():
+        mirror = AsyncDriveFolderMirror(_client(drive), cache=cache)
+        return await mirror.ensure_render_folder("acme", "presentations", "x")
+
+    folder_id = asyncio.run(_main())
+
+    assert folder_id == "f4"
+    assert drive.folders[("bc", "acme")] == "f2"
+    # presentations under the stale id: list + create (404). Then, once:
+    # list acme under bc, and create acme/presentations/x without lookups.
+    assert [c[0] for c in drive.calls] == ["GET", "POST", "GET"] + ["POST"] * 3
+
+
+def test_batch_lookup_listing_and_trash_match_the_sync_mirror():
+    drive = FakeDrive()
+
+    async def _main():
+        mirror = AsyncDriveFolderMirror(_client(drive))
+        for slug in ("launch", "launch-2", "recap"):
+            await mirror.ensure_render_folder("acme", "presentations", slug)
+        found = await mirror.find_render_folders(
+            "acme", "presentations", ["launch", "missing"]
+        )
+        names = await mirror.list_render_folder_names(
+            "acme", "presentations", "launch"
+        )
+        await mirror.trash_render_folders([found["launch"], "gone"])
+        return found, names, mirror.cached_brand_folder("acme")
+
+    found, names, brand_id = asyncio.run(_main())
+
+    assert found == {"launch": "f4", "missing": None}
+    assert sorted(names) == ["launch", "launch-2"]
+    assert drive.trashed == {found["launch"]}
+    assert brand_id == "f2"
+
+
+def test_transient_errors_are_retried_and_http_errors_keep_their_status():
+    drive = FakeDrive()
+    drive.fail_next = [503]
+    retry = RetryPolicy(max_attempts=3, base_delay=0.0)
+
+    async def _main():
+        mirror = AsyncDriveFolderMirror(_client(drive, retry=retry))
+        found = await mirror.find_render_folder("acme", "presentations", "x")
+        with pytest.raises(AsyncHttpError) as info:
+            await AsyncSlidesRunner(_client(drive)).move_to_folder("deck", "f1")
+        return found, info.value
+
+    found, error = asyncio.run(_main())
+
+    assert found is None
+    assert retry.take_log() == [
+        {"method": "drive.files.list", "retries": 1, "outcome": "ok"}
+    ]
+    assert cli._error_payload(error)["error"]["status"] == 404
+
+
+def test_chunked_batch_update_chains_revisions():
+    bodies = []
+
+    def _slides(request):
+        body = json.loads(request.content)
+        bodies.append(body)
+        return httpx.Response(
+            200,
+            json={
+                "replies": [{} for _ in body["requests"]],
+                "writeControl": {"requiredRevisionId": f"rev-{len(bodies)}"},
+            },
+        )
+
+    requests = [{"deleteObject": {"objectId": f"o{i}"}} for i in range(5)]
+    result = asyncio.run(
+        AsyncSlidesRunner(_client(_slides)).apply_batch_update(
+            "deck", requests, chunked=True, max_requests=2
+        )
+    )
+
+    assert result["batchCount"] == 3
+    assert len(result["replies"]) == 5
+    assert "writeControl" not in bodies[0]
+    assert bodies[2]["writeControl"] == {"requiredRevisionId": "rev-2"}
+
+
+def test_upload_file_sends_multipart_with_conversion(tmp_path):
+    pptx = tmp_path / "launch.pptx"
+    pptx.write_bytes(b"PPTX-BYTES")
+    seen = {}
+
+    def _upload(request):
+        seen["params"] = dict(request.url.params)
+        seen["type"] = request.headers["content-type"]
+        seen["body"] = request.content
+        return httpx.Response(200, json={"id": "deck-1", "trashed": False})
+
+    deck_id = asyncio.run(
+        AsyncSlidesRunner(_client(_upload)).upload_file(
+            "f1",
+            str(pptx),
+            cli.PPTX_MIMETYPE,
+            name="Launch",
+            convert_to=cli.GOOGLE_SLIDES_MIMETYPE,
+        )
+    )
+
+    assert deck_id == "deck-1"
+    assert seen["params"]["uploadType"] == "multipart"
+    assert seen["type"].startswith("multipart/related; boundary=")
+    assert b'"mimeType": "application/vnd.google-apps.presentation"' in seen["body"]
+    assert b"PPTX-BYTES" in seen["body"]
+
+
+def test_large_upload_goes_resumable_and_resyncs_after_a_failed_chunk(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setenv("BCD_SLIDES_RESUMABLE_THRESHOLD_MB", "0.25")
+    monkeypatch.setenv("BCD_SLIDES_UPLOAD_CHUNK_MB", "0.25")
+    pptx = tmp_path / "launch.pptx"
+    big = bytes(range(256)) * 3072  # 768 KiB → three chunks
+    pptx.write_bytes(big)
+    received = bytearray()
+    ranges = []
+
+    def _drive(request):
+        if request.method == "POST":
+            assert request.url.params["uploadType"] == "resumable"
+            assert request.headers["x-upload-content-length"] == str(len(big))
+            assert json.loads(request.content)["mimeType"] == (
+                cli.GOOGLE_SLIDES_MIMETYPE
+            )
+            return httpx.Response(
+                200, headers={"Location": "https://www.googleapis.com/up/s1"}
+            )
+        ranges.append(request.headers["content-range"])
+        if request.content:
+            received.extend(request.content)
+            if len(ranges) == 2:
+                # Drive stored the second chunk but the response was lost.
+                return httpx.Response(503, json={"error": {}})
+        if len(received) < len(big):
+            return httpx.Response(
+                308, headers={"Range": f"bytes=0-{len(received) - 1}"}
+            )
+        return httpx.Response(200, json={"id": "deck-1", "trashed": False})
+
+    retry = RetryPolicy(max_attempts=3, base_delay=0.0)
+    deck_id = asyncio.run(
+        AsyncSlidesRunner(_client(_drive, retry=retry)).upload_file(
+            "f1",
+            str(pptx),
+            cli.PPTX_MIMETYPE,
+            convert_to=cli.GOOGLE_SLIDES_MIMETYPE,
+        )
+    )
+
+    assert deck_id == "deck-1"
+    assert bytes(received) == big
+    assert ranges == [
+        "bytes 0-262143/786432",
+        "bytes 262144-524287/786432",
+        "bytes */786432",  # after the 503: ask what landed, then carry on
+        "bytes 524288-786431/786432",
+    ]
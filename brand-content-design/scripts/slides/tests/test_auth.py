@@ -67,7 +67,9 @@ def test_build_services_oauth_path_calls_credentials_and_build():
     fake_drive = MagicMock(name="drive_service")
 
     with patch.object(auth, "OAuthCredentials", return_value=fake_creds) as ctor, \
-         patch.object(auth, "build", side_effect=[fake_slides, fake_drive]) as build_mock:
+         patch.object(
+             auth, "build_from_document", side_effect=[fake_slides, fake_drive]
+         ) as build_mock:
         slides_svc, drive_svc = auth.build_services(env)
 
     assert slides_svc is fake_slides
@@ -79,12 +81,11 @@ def test_build_services_oauth_path_calls_credentials_and_build():
     assert kwargs["client_secret"] == "sec"
     assert kwargs["token_uri"] == "https://oauth2.googleapis.com/token"
     assert kwargs["scopes"] == auth.SCOPES
-    # build() called twice with right service names
-    assert build_mock.call_args_list[0].args[0] == "slides"
-    assert build_mock.call_args_list[1].args[0] == "drive"
+    # build_from_document() called twice with the packaged discovery docs
+    assert build_mock.call_args_list[0].args[0]["name"] == "slides"
+    assert build_mock.call_args_list[1].args[0]["name"] == "drive"
     for call in build_mock.call_args_list:
         assert call.kwargs["credentials"] is fake_creds
-        assert call.kwargs["cache_discovery"] is False
 
 
 def test_build_services_service_account_path():
@@ -96,10 +97,54 @@ def test_build_services_service_account_path():
     with patch.object(
         auth.SACredentials, "from_service_account_file", return_value=fake_creds
     ) as sa_ctor, patch.object(
-        auth, "build", side_effect=[fake_slides, fake_drive]
+        auth, "build_from_document", side_effect=[fake_slides, fake_drive]
     ):
         slides_svc, drive_svc = auth.build_services(env)
 
     assert slides_svc is fake_slides
     assert drive_svc is fake_drive
     sa_ctor.assert_called_once_with("/tmp/key.json", scopes=auth.SCOPES)
+
+
+# ---------------------------------------------------------------- discovery
+
+
+def test_discovery_document_is_packaged_and_parsed_once():
+    auth.discovery_document.cache_clear()
+    with patch.object(auth, "get_static_doc", wraps=auth.get_static_doc) as read:
+        first = auth.discovery_document("drive", "v3")
+        second = auth.discovery_document("drive", "v3")
+
+    assert first is second
+    assert first["version"] == "v3"
+    read.assert_called_once_with("drive", "v3")
+
+
+def test_discovery_document_missing_raises():
+    with patch.object(auth, "get_static_doc", return_value=None):
+        with pytest.raises(RuntimeError, match="no discovery document"):
+            auth.discovery_document("nosuchapi", "v0")
+
+
+# ---------------------------------------------------------------- endpoint
+
+
+def test_build_services_api_endpoint_moves_every_url_and_skips_credentials():
+    env = {
+        "BCD_SLIDES_API_ENDPOINT": "http://127.0.0.1:8089/",
+        "BCD_SLIDES_SA_KEY_FILE": "/tmp/key.json",
+    }
+
+    with patch.object(auth.SACredentials, "from_service_account_file") as sa_ctor:
+        slides_svc, drive_svc = auth.build_services(env)
+
+    sa_ctor.assert_not_called()
+    assert slides_svc._baseUrl == "http://127.0.0.1:8089/"
+    assert drive_svc._baseUrl == "http://127.0.0.1:8089/drive/v3/"
+    assert drive_svc.new_batch_http_request()._batch_uri == (
+        "http://127.0.0.1:8089/batch/drive/v3"
+    )
+    # The shared, memoized document is not modified.
+    assert auth.discovery_document("drive", "v3")["rootUrl"] == (
+        "https://www.googleapis.com/"
+    )
@@ -0,0 +1,24 @@
+"""Round-trip regression gate for :mod:`slides.benchmarks` (no latency)."""
+
+from __future__ import annotations
+
+from slides import benchmarks
+
+
+def test_no_scenario_needs_more_round_trips_than_its_baseline():
+    results = benchmarks.run_all(latency=0.0)
+
+    assert benchmarks.regressions(results, benchmarks.load_baseline()) == []
+
+
+def test_regressions_flags_extra_round_trips_and_missing_baselines():
+    results = {
+        "a": {"round_trips": 3, "api_calls": 3},
+        "b": {"round_trips": 1, "api_calls": 1},
+    }
+    baseline = {"a": {"round_trips": 2, "api_calls": 3}}
+
+    assert benchmarks.regressions(results, baseline) == [
+        "a: round_trips 3 > baseline 2",
+        "b: no baseline (run with --update-baseline)",
+    ]
@@ -0,0 +1,493 @@
+"""Unit tests for ``slides.cli`` plumbing — mocked services, no network.
+
+PPTX-import specifics live in ``test_pptx_import_cli.py``; this file covers
+the command table, the folder-cache wiring and the process-level modes.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from slides import cli
+from slides.cache import FolderIdCache
+from slides.runner import (
+    BRAND_CONTENT_ROOT_NAME,
+    SlidesRunner,
+    read_slides_url_file,
+    write_slides_url_file,
+)
+from slides.uploads import file_md5
+
+
+def _seed_cache(root_id=None):
+    cache = FolderIdCache.for_root(root_id)
+    cache.put("root", BRAND_CONTENT_ROOT_NAME, "bc")
+    cache.put("bc", "acme", "brand")
+    cache.put("brand", "presentations", "pres")
+    cache.put("pres", "launch", "render-stale")
+    return cache
+
+
+def test_make_mirror_uses_persistent_cache_by_default(monkeypatch):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    _seed_cache()
+    drive = MagicMock()
+
+    mirror = cli._make_mirror(drive)
+
+    assert mirror.find_render_folder("acme", "presentations", "launch") == (
+        "render-stale"
+    )
+    drive.files.return_value.list.assert_not_called()
+
+
+def test_make_mirror_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("BCD_SLIDES_FOLDER_CACHE", "0")
+    _seed_cache()
+
+    assert cli._make_mirror(MagicMock()).invalidate_cache() == 0
+
+
+def test_invalidate_folder_cache_by_brand_and_all(monkeypatch):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    _seed_cache()
+    runner = SlidesRunner(MagicMock(), MagicMock())
+
+    assert cli._cmd_invalidate_folder_cache(runner, {"brand": "globex"}) == {
+        "invalidated": 0
+    }
+    assert cli._cmd_invalidate_folder_cache(runner, {"brand": "acme"}) == {
+        "invalidated": 3
+    }
+    assert cli._cmd_invalidate_folder_cache(runner, {}) == {"invalidated": 1}
+
+
+def test_mirror_revalidates_render_folder_when_upload_lands_in_trash(
+    tmp_path, monkeypatch
+):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    _seed_cache()
+    drive = MagicMock()
+    # Cached render folder was trashed in the Drive UI: the first upload
+    # comes back trashed, the re-resolved folder is created fresh.
+    drive.files.return_value.list.return_value.execute.return_value = {"files": []}
+    created = iter([
+        {"id": "orphan-deck", "trashed": True},
+        {"id": "render-fresh"},
+        {"id": "deck-ok"},
+    ])
+    drive.files.return_value.create.return_value.execute.side_effect = (
+        lambda: next(created)
+    )
+    pptx = tmp_path / "launch.pptx"
+    pptx.write_bytes(b"fake")
+
+    with patch.object(cli, "MediaFileUpload", autospec=True):
+        result = cli._cmd_mirror_presentation(
+            SlidesRunner(MagicMock(), drive),
+            {
+                "brand": "acme",
+                "render_slug": "launch",
+                "local_dir": str(tmp_path),
+                "pptx_path": str(pptx),
+            },
+        )
+
+    assert result["folder_id"] == "render-fresh"
+    assert result["deck_id"] == "deck-ok"
+    assert FolderIdCache.for_root(None).get("pres", "launch") == "render-fresh"
+
+
+def _mirror_with_pdf_and_outline(tmp_path, drive):
+    for name in ("launch.pptx", "launch.pdf", "outline.md"):
+        (tmp_path / name).write_bytes(b"fake")
+    with patch.object(cli, "MediaFileUpload", autospec=True), patch.object(
+        cli, "_worker_http", side_effect=lambda _drive: object()
+    ):
+        return cli._cmd_mirror_presentation(
+            SlidesRunner(MagicMock(), drive),
+            {
+                "brand": "acme",
+                "render_slug": "launch",
+                "local_dir": str(tmp_path),
+                "pptx_path": str(tmp_path / "launch.pptx"),
+                "pdf_path": str(tmp_path / "launch.pdf"),
+                "outline_path": str(tmp_path / "outline.md"),
+            },
+        )
+
+
+def test_mirror_uploads_deck_pdf_and_outline_concurrently(tmp_path, monkeypatch):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    _seed_cache()
+    drive = MagicMock()
+    # All three uploads must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(3, timeout=5)
+    transports = set()
+
+    def _execute(http=None):
+        transports.add(id(http))
+        barrier.wait()
+        return {"id": f"file-{threading.get_ident()}"}
+
+    drive.files.return_value.create.return_value.execute.side_effect = _execute
+
+    result = _mirror_with_pdf_and_outline(tmp_path, drive)
+
+    assert len(transports) == 3  # one transport per worker
+    ids = {result["deck_id"], result["pdf_file_id"], result["outline_file_id"]}
+    assert len(ids) == 3
+    assert "upload_errors" not in result
+
+
+def test_mirror_reports_pdf_failure_per_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    _seed_cache()
+    drive = MagicMock()
+    create = drive.files.return_value.create
+
+    def _create(body, **_kwargs):
+        request = MagicMock()
+        if body["name"] == "launch.pdf":
+            request.execute.side_effect = ValueError("pdf rejected")
+        else:
+            request.execute.return_value = {"id": f"id-{body['name']}"}
+        return request
+
+    create.side_effect = _create
+
+    result = _mirror_with_pdf_and_outline(tmp_path, drive)
+
+    assert result["deck_id"] == "id-launch"
+    assert result["outline_file_id"] == "id-outline.md"
+    assert result["pdf_file_id"] is None
+    assert result["upload_errors"] == {
+        "pdf": {"type": "ValueError", "message": "pdf rejected", "status": None}
+    }
+
+
+def test_mirror_trashes_created_siblings_when_deck_fails(tmp_path, monkeypatch):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    _seed_cache()
+    drive = MagicMock()
+
+    def _create(body, **_kwargs):
+        request = MagicMock()
+        if body["name"] == "launch":
+            request.execute.side_effect = ValueError("deck rejected")
+        else:
+            request.execute.return_value = {"id": f"id-{body['name']}"}
+        return request
+
+    drive.files.return_value.create.side_effect = _create
+
+    with pytest.raises(ValueError, match="deck rejected"):
+        _mirror_with_pdf_and_outline(tmp_path, drive)
+
+    trashed = {
+        call.kwargs["fileId"]
+        for call in drive.files.return_value.update.call_args_list
+        if call.kwargs.get("body") == {"trashed": True}
+    }
+    assert trashed == {"id-launch.pdf", "id-outline.md"}
+    assert read_slides_url_file(tmp_path) is None
+
+
+def test_replace_render_incremental_only_touches_changed_files(
+    tmp_path, monkeypatch
+):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    _seed_cache()
+    for name in ("launch.pptx", "launch.pdf", "outline.md"):
+        (tmp_path / name).write_bytes(name.encode())
+    deck_md5 = file_md5(str(tmp_path / "launch.pptx"))
+    write_slides_url_file(
+        tmp_path,
+        "deck-1",
+        "render-stale",
+        artifacts={
+            "deck": {"file_id": "deck-1", "md5": deck_md5},
+            "pdf": {"file_id": "pdf-1", "md5": "old"},
+        },
+    )
+    drive = MagicMock()
+    remote = {
+        "deck-1": {"appProperties": {"bcdSourceMd5": deck_md5}},
+        "pdf-1": {"md5Checksum": "old"},
+    }
+
+    def _get(fileId, **_kwargs):
+        request = MagicMock()
+        request.execute.return_value = dict(
+            remote[fileId], id=fileId, parents=["render-stale"]
+        )
+        return request
+
+    drive.files.return_value.get.side_effect = _get
+    drive.files.return_value.create.return_value.execute.return_value = {
+        "id": "outline-new"
+    }
+
+    with patch.object(cli, "MediaFileUpload", autospec=True):
+        result = cli._cmd_replace_render(
+            SlidesRunner(MagicMock(), drive),
+            {
+                "strategy": "incremental",
+                "brand": "acme",
+                "render_slug": "launch",
+                "local_dir": str(tmp_path),
+                "pptx_path": str(tmp_path / "launch.pptx"),
+                "pdf_path": str(tmp_path / "launch.pdf"),
+                "outline_path": str(tmp_path / "outline.md"),
+            },
+        )
+
+    assert result["strategy_used"] == "incremental"
+    assert result["artifact_actions"] == {
+        "deck": "unchanged",
+        "pdf": "updated",
+        "outline": "created",
+    }
+    update = drive.files.return_value.update
+    assert update.call_count == 1  # no trash, one in-place content update
+    assert update.call_args.kwargs["fileId"] == "pdf-1"
+    pointer = read_slides_url_file(tmp_path)
+    assert pointer["deck_id"] == "deck-1"
+    assert pointer["artifacts"]["pdf"] == {
+        "file_id": "pdf-1",
+        "md5": file_md5(str(tmp_path / "launch.pdf")),
+    }
+    assert pointer["artifacts"]["outline"]["file_id"] == "outline-new"
+
+
+def test_replace_render_incremental_without_pointer_falls_back_to_trash(
+    tmp_path, monkeypatch
+):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    _seed_cache()
+    (tmp_path / "launch.pptx").write_bytes(b"fake")
+    drive = MagicMock()
+    drive.files.return_value.list.return_value.execute.return_value = {"files": []}
+    drive.files.return_value.create.return_value.execute.return_value = {
+        "id": "new-id"
+    }
+
+    with patch.object(cli, "MediaFileUpload", autospec=True):
+        result = cli._cmd_replace_render(
+            SlidesRunner(MagicMock(), drive),
+            {
+                "strategy": "incremental",
+                "brand": "acme",
+                "render_slug": "launch",
+                "local_dir": str(tmp_path),
+                "pptx_path": str(tmp_path / "launch.pptx"),
+            },
+        )
+
+    assert result["strategy_used"] == "trash"
+    drive.files.return_value.update.assert_called_once_with(
+        fileId="render-stale", body={"trashed": True}
+    )
+    assert read_slides_url_file(tmp_path)["artifacts"]["deck"]["md5"] == file_md5(
+        str(tmp_path / "launch.pptx")
+    )
+
+
+def test_main_forwards_to_daemon_when_enabled(monkeypatch, capsys):
+    monkeypatch.setenv("BCD_SLIDES_DAEMON", "1")
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"title": "x"}'))
+
+    with patch("slides.daemon.call", return_value=(0, {"deck_id": "d"})) as call, \
+         patch.object(cli, "build_services") as build:
+        code = cli.main(["create_deck"])
+
+    assert code == 0
+    call.assert_called_once_with("create_deck", {"title": "x"})
+    build.assert_not_called()
+    assert json.loads(capsys.readouterr().out) == {"deck_id": "d"}
+
+
+def test_main_usage_lists_serve_mode(capsys):
+    assert cli.main(["bogus"]) == 1
+    assert "serve" in capsys.readouterr().err
+
+
+def test_main_reports_non_object_payload_as_json(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO("[1]"))
+    runner = SlidesRunner(MagicMock(), MagicMock())
+
+    with patch.object(
+        cli, "build_services", return_value=(runner._slides, runner._drive)
+    ):
+        code = cli.main(["create_deck"])
+
+    assert code == 1
+    error = json.loads(capsys.readouterr().out)["error"]
+    assert error["type"] == "ValueError"
+    assert "JSON object" in error["message"]
+
+
+# ------------------------------------------------------------------- batch
+
+
+def _batch(lines, runner):
+    out = io.StringIO()
+    with patch.object(
+        cli, "build_services", return_value=(runner._slides, runner._drive)
+    ) as build:
+        code = cli.run_batch(lines, out)
+    return code, [json.loads(line) for line in out.getvalue().splitlines()], build
+
+
+def test_run_batch_streams_one_line_per_record_and_builds_once():
+    slides = MagicMock(name="slides")
+    slides.presentations.return_value.create.return_value.execute.side_effect = [
+        {"presentationId": "d1"},
+        {"presentationId": "d2"},
+    ]
+    runner = SlidesRunner(slides, MagicMock(name="drive"))
+
+    code, lines, build = _batch(
+        [
+            '{"id": "a", "command": "create_deck", "payload": {"title": "one"}}\n',
+            "\n",
+            '{"command": "create_deck", "payload": {"title": "two"}}\n',
+        ],
+        runner,
+    )
+
+    assert code == 0
+    assert build.call_count == 1
+    assert lines[0] == {
+        "id": "a",
+        "command": "create_deck",
+        "result": {"deck_id": "d1", "deck_url": SlidesRunner.deck_url("d1")},
+    }
+    assert lines[1]["result"]["deck_id"] == "d2"
+
+
+def test_run_batch_reports_bad_records_and_keeps_going():
+    runner = SlidesRunner(MagicMock(), MagicMock())
+
+    code, lines, _ = _batch(
+        [
+            "{not json\n",
+            '{"command": "nope"}\n',
+            '{"command": "create_deck", "payload": {}}\n',
+            '{"command": "move_to_folder", '
+            '"payload": {"deck_id": "d", "folder_id": "f"}}\n',
+        ],
+        runner,
+    )
+
+    assert code == 1
+    assert [line.get("error", {}).get("type") for line in lines] == [
+        "JSONDecodeError",
+        "ValueError",
+        "KeyError",
+        None,
+    ]
+    assert lines[3]["result"] == {"deck_id": "d", "folder_id": "f"}
+
+
+def test_run_batch_resolves_the_folder_chain_once(monkeypatch):
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    drive = MagicMock(name="drive")
+    drive.files.return_value.list.return_value.execute.return_value = {
+        "files": [{"id": "f"}]
+    }
+    runner = SlidesRunner(MagicMock(), drive)
+    record = (
+        '{"command": "ensure_render_folder", "payload": '
+        '{"brand": "acme", "kind": "presentations", "render_slug": "s"}}\n'
+    )
+
+    code, lines, _ = _batch([record, record, record], runner)
+
+    assert code == 0
+    assert [line["result"]["folder_id"] for line in lines] == ["f", "f", "f"]
+    # root → brand-content → brand → presentations → slug, once in total.
+    assert drive.files.return_value.list.call_count == 4
+
+
+def test_next_versioned_slug_lists_once_and_takes_max_plus_one():
+    mirror = MagicMock()
+    mirror.list_render_folder_names.return_value = [
+        "deck-v2",
+        "deck-v40",
+        "deck-v7",
+        "deck-v9-old",
+        "other-deck-v99",
+    ]
+
+    slug = cli._next_versioned_slug(mirror, "acme", "presentations", "deck")
+
+    assert slug == "deck-v41"
+    mirror.list_render_folder_names.assert_called_once_with(
+        "acme", "presentations", "deck"
+    )
+    mirror.find_render_folders.assert_not_called()
+
+
+def test_next_versioned_slug_probes_logarithmically_when_listing_fails():
+    class FakeHttpError(Exception):
+        def __init__(self):
+            self.resp = type("R", (), {"status": 400})()
+            super().__init__("invalid query")
+
+    mirror = MagicMock()
+    mirror.list_render_folder_names.side_effect = FakeHttpError()
+    taken = {f"deck-v{n}" for n in range(2, 41)}
+    mirror.find_render_folders.side_effect = lambda brand, kind, slugs: {
+        slug: ("id" if slug in taken else None) for slug in slugs
+    }
+
+    slug = cli._next_versioned_slug(mirror, "acme", "presentations", "deck")
+
+    assert slug == "deck-v41"
+    assert mirror.find_render_folders.call_count <= 12
+
+
+def test_mirror_without_disk_cache_looks_each_level_up_once(monkeypatch):
+    monkeypatch.setenv("BCD_SLIDES_FOLDER_CACHE", "0")
+    monkeypatch.delenv("BRAND_CONTENT_DRIVE_ROOT_ID", raising=False)
+    drive = MagicMock()
+    drive.files.return_value.list.return_value.execute.return_value = {
+        "files": [{"id": "known"}]
+    }
+
+    for slug in ("a", "b"):
+        cli._make_mirror(drive).ensure_render_folder("acme", "presentations", slug)
+
+    # brand-content, acme, presentations once; then one per slug.
+    assert drive.files.return_value.list.call_count == 5
+
+
+def test_run_batch_keeps_going_after_non_object_payloads():
+    slides = MagicMock(name="slides")
+    slides.presentations.return_value.create.return_value.execute.return_value = {
+        "presentationId": "d1"
+    }
+    runner = SlidesRunner(slides, MagicMock(name="drive"))
+
+    code, lines, _ = _batch(
+        [
+            '{"command": "create_deck", "payload": [1]}\n',
+            '{"command": "create_deck", "payload": "title", "trace": true}\n',
+            '{"command": "create_deck", "payload": {"title": "ok"}}\n',
+        ],
+        runner,
+    )
+
+    assert code == 1
+    assert [line.get("error", {}).get("type") for line in lines] == [
+        "ValueError",
+        "ValueError",
+        None,
+    ]
+    assert lines[2]["result"]["deck_id"] == "d1"
@@ -0,0 +1,288 @@
+"""Unit tests for slides.daemon — real Unix socket, mocked Google services."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from slides import daemon
+from slides.runner import SlidesRunner
+
+
+@pytest.fixture
+def socket_path():
+    # pytest's tmp_path is too long for AF_UNIX (~100 byte limit).
+    short_dir = tempfile.mkdtemp(prefix="bcd-", dir="/tmp")
+    yield Path(short_dir) / "d.sock"
+    shutil.rmtree(short_dir, ignore_errors=True)
+
+
+def _runner():
+    slides = MagicMock(name="slides")
+    slides.presentations.return_value.create.return_value.execute.return_value = {
+        "presentationId": "deck-1"
+    }
+    return SlidesRunner(slides, MagicMock(name="drive"))
+
+
+def _start(socket_path, factory, idle_timeout=5.0):
+    server = daemon.SlidesDaemon(factory, socket_path, idle_timeout=idle_timeout)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if socket_path.exists():
+            break
+        threading.Event().wait(0.01)
+    return thread
+
+
+def test_handle_dispatches_command_and_builds_runner_once():
+    factory = MagicMock(side_effect=_runner)
+    server = daemon.SlidesDaemon(factory, Path("/unused"))
+
+    first = server.handle(
+        {"jsonrpc": "2.0", "id": 7, "method": "create_deck", "params": {"title": "x"}}
+    )
+    server.handle(
+        {"jsonrpc": "2.0", "id": 8, "method": "create_deck", "params": {"title": "y"}}
+    )
+
+    assert first["id"] == 7
+    assert first["result"]["deck_id"] == "deck-1"
+    assert factory.call_count == 1
+
+
+def test_handle_unknown_method_and_invalid_request():
+    server = daemon.SlidesDaemon(_runner, Path("/unused"))
+
+    unknown = server.handle({"jsonrpc": "2.0", "id": 1, "method": "nope"})
+    invalid = server.handle(["not", "an", "object"])
+
+    assert unknown["error"]["code"] == daemon.METHOD_NOT_FOUND
+    assert invalid["error"]["code"] == daemon.INVALID_REQUEST
+
+
+def test_handle_command_error_carries_cli_error_shape():
+    server = daemon.SlidesDaemon(_runner, Path("/unused"))
+
+    reply = server.handle(
+        {"jsonrpc": "2.0", "id": 1, "method": "create_deck", "params": {}}
+    )
+
+    assert reply["error"]["code"] == daemon.COMMAND_ERROR
+    assert reply["error"]["data"] == {
+        "type": "KeyError",
+        "message": "'title'",
+        "status": None,
+    }
+
+
+def test_handle_non_object_params_is_a_command_error():
+    server = daemon.SlidesDaemon(_runner, Path("/unused"))
+
+    reply = server.handle(
+        {"jsonrpc": "2.0", "id": 1, "method": "create_deck", "params": [1]}
+    )
+
+    assert reply["error"]["code"] == daemon.COMMAND_ERROR
+    assert reply["error"]["data"]["type"] == "ValueError"
+
+
+def test_runner_build_failure_is_reported_and_retried():
+    factory = MagicMock(
+        side_effect=[RuntimeError("No credentials found."), _runner()]
+    )
+    server = daemon.SlidesDaemon(factory, Path("/unused"))
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "create_deck",
+        "params": {"title": "x"},
+    }
+
+    assert server.handle(request)["error"]["data"]["type"] == "RuntimeError"
+    assert server.handle(request)["result"]["deck_id"] == "deck-1"
+
+
+def test_call_round_trips_over_socket_and_shutdown(socket_path):
+    thread = _start(socket_path, _runner)
+
+    code, output = daemon.call(
+        "create_deck", {"title": "x"}, socket_path=socket_path, spawn=False
+    )
+    error_code, error_output = daemon.call(
+        "create_deck", {}, socket_path=socket_path, spawn=False
+    )
+    daemon._rpc(daemon._connect(socket_path), "shutdown", {})
+    thread.join(timeout=5)
+
+    assert (code, output["deck_id"]) == (0, "deck-1")
+    assert error_code == 1
+    assert error_output["error"]["type"] == "KeyError"
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+
+
+def test_serve_exits_when_idle(socket_path):
+    thread = _start(socket_path, _runner, idle_timeout=0.1)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+
+
+def test_call_without_daemon_and_spawn_disabled_raises(socket_path):
+    with pytest.raises(daemon.DaemonUnavailable):
+        daemon.call("create_deck", {}, socket_path=socket_path, spawn=False)
+
+
+def test_call_spawns_daemon_subprocess(socket_path, monkeypatch):
+    for key in (
+        "BCD_SLIDES_SA_KEY_FILE",
+        "BCD_SLIDES_OAUTH_CLIENT_ID",
+        "BCD_SLIDES_OAUTH_CLIENT_SECRET",
+        "BCD_SLIDES_OAUTH_REFRESH_TOKEN",
+    ):
+        monkeypatch.delenv(key, raising=False)
+
+    code, output = daemon.call("create_deck", {"title": "x"}, socket_path=socket_path)
+    assert daemon._ping(socket_path)
+    daemon._rpc(daemon._connect(socket_path), "shutdown", {})
+
+    # No credentials in the environment: the spawned daemon answers with the
+    # same error the one-shot CLI would print.
+    assert code == 1
+    assert output["error"]["type"] == "RuntimeError"
+    assert "No credentials" in output["error"]["message"]
+
+
+def test_default_socket_path_depends_on_identity_env():
+    a = daemon.default_socket_path({"BCD_SLIDES_SA_KEY_FILE": "/a.json"})
+    b = daemon.default_socket_path({"BCD_SLIDES_SA_KEY_FILE": "/b.json"})
+    explicit = daemon.default_socket_path({"BCD_SLIDES_SOCKET": "/tmp/x.sock"})
+
+    assert a != b
+    assert a.name.startswith(f"bcd-slides-{os.getuid()}-")
+    assert explicit == Path("/tmp/x.sock")
+
+
+def test_client_resolves_relative_paths_and_sends_command_env(
+    tmp_path, monkeypatch
+):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("BCD_SLIDES_TRACE", "1")
+    monkeypatch.setenv("BCD_SLIDES_TRACE_FILE", "trace.jsonl")
+    monkeypatch.delenv("BCD_SLIDES_UPLOAD_CHUNK_MB", raising=False)
+
+    payload, env = daemon._client_request(
+        {
+            "local_dir": "renders/launch",
+            "pdf_path": "/abs/launch.pdf",
+            "requests_file": "reqs.jsonl",
+            "deck_title": "not/a/path",
+        }
+    )
+
+    assert payload == {
+        "local_dir": str(tmp_path / "renders/launch"),
+        "pdf_path": "/abs/launch.pdf",
+        "requests_file": str(tmp_path / "reqs.jsonl"),
+        "deck_title": "not/a/path",
+    }
+    assert env["BCD_SLIDES_TRACE"] == "1"
+    assert env["BCD_SLIDES_TRACE_FILE"] == str(tmp_path / "trace.jsonl")
+    assert env["BCD_SLIDES_UPLOAD_CHUNK_MB"] is None
+
+
+def test_handle_applies_request_env_for_that_request_only(monkeypatch):
+    from slides import cli
+
+    seen = []
+
+    def _run_command(runner, command, payload):
+        env = os.environ
+        seen.append((env.get("BCD_SLIDES_TRACE"), env.get("BCD_SLIDES_SA_KEY_FILE")))
+        return 0, {}
+
+    monkeypatch.setattr(cli, "run_command", _run_command)
+    monkeypatch.setenv("BCD_SLIDES_SA_KEY_FILE", "/daemon.json")
+    monkeypatch.setenv("BCD_SLIDES_UPLOAD_CHUNK_MB", "8")
+    server = daemon.SlidesDaemon(_runner, Path("/unused"))
+    request = {"jsonrpc": "2.0", "id": 1, "method": "create_deck", "params": {}}
+
+    server.handle(
+        {
+            **request,
+            "env": {
+                "BCD_SLIDES_TRACE": "1",
+                "BCD_SLIDES_SA_KEY_FILE": "/client.json",
+                "BCD_SLIDES_UPLOAD_CHUNK_MB": None,
+            },
+        }
+    )
+    server.handle(request)
+
+    # Identity vars are never taken from the client.
+    assert seen == [("1", "/daemon.json"), (None, "/daemon.json")]
+    assert os.environ.get("BCD_SLIDES_TRACE") is None
+    assert os.environ["BCD_SLIDES_UPLOAD_CHUNK_MB"] == "8"
+
+
+def test_default_socket_path_depends_on_runner_build_env():
+    a = daemon.default_socket_path({"BCD_SLIDES_RETRY_MAX_ATTEMPTS": "1"})
+    b = daemon.default_socket_path({"BCD_SLIDES_RETRY_MAX_ATTEMPTS": "5"})
+
+    assert a != b
+
+
+def test_stalled_client_does_not_block_the_daemon(socket_path, monkeypatch):
+    monkeypatch.setattr(daemon, "CONNECTION_TIMEOUT", 0.2)
+    thread = _start(socket_path, _runner)
+    stalled = daemon._connect(socket_path)  # connects, never sends
+
+    try:
+        code, output = daemon.call(
+            "create_deck", {"title": "x"}, socket_path=socket_path, spawn=False
+        )
+    finally:
+        stalled.close()
+        daemon._rpc(daemon._connect(socket_path), "shutdown", {})
+        thread.join(timeout=5)
+
+    assert (code, output["deck_id"]) == (0, "deck-1")
+
+
+def test_default_socket_without_runtime_dir_is_in_a_private_dir():
+    path = daemon.default_socket_path({"BCD_SLIDES_SA_KEY_FILE": "/a.json"})
+    runtime = daemon.default_socket_path({"XDG_RUNTIME_DIR": "/run/user/1"})
+
+    assert path.parent == Path(tempfile.gettempdir()) / f"bcd-slides-{os.getuid()}"
+    assert runtime.parent == Path("/run/user/1")
+
+
+def test_serve_creates_the_socket_dir_owner_only(socket_path):
+    nested = socket_path.parent / "private" / "d.sock"
+    thread = _start(nested, _runner)
+    mode = nested.parent.stat().st_mode & 0o777
+    daemon._rpc(daemon._connect(nested), "shutdown", {})
+    thread.join(timeout=5)
+
+    assert mode == 0o700
+
+
+def test_client_refuses_a_daemon_run_by_another_user(socket_path, monkeypatch):
+    thread = _start(socket_path, _runner)
+    real_uid = os.getuid()
+    try:
+        monkeypatch.setattr(daemon.os, "getuid", lambda: real_uid + 1)
+        with pytest.raises(daemon.DaemonUnavailable, match="belongs to uid"):
+            daemon.call("create_deck", {"title": "x"}, socket_path=socket_path)
+    finally:
+        monkeypatch.undo()
+        daemon._rpc(daemon._connect(socket_path), "shutdown", {})
+        thread.join(timeout=5)
@@ -6,11 +6,14 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from slides.cache import FolderIdCache
+from slides.retry import RetryPolicy
 from slides.runner import (
     BRAND_CONTENT_ROOT_NAME,
     PRESENTATIONS_SUBFOLDER,
     TEMPLATES_SUBFOLDER,
     DriveFolderMirror,
+    StaleFolderError,
 )
 
 
@@ -228,3 +231,328 @@ def test_root_id_defaults_to_my_drive_root_when_none():
 
     first_q = drive.files.return_value.list.call_args_list[0].kwargs["q"]
     assert "'root' in parents" in first_q
+
+
+# ------------------------------------------------------------- folder cache
+
+
+def _cache_with_chain():
+    """In-memory cache pre-seeded with the full acme/presentations chain."""
+    cache = FolderIdCache()
+    cache.put("root", BRAND_CONTENT_ROOT_NAME, "bc")
+    cache.put("bc", "acme", "brand")
+    cache.put("brand", PRESENTATIONS_SUBFOLDER, "pres")
+    return cache
+
+
+def test_find_or_create_populates_cache_and_skips_second_list():
+    drive = _drive_with_list_results([{"id": "existing-id"}])
+    cache = FolderIdCache()
+    mirror = DriveFolderMirror(drive, root_id="root", cache=cache)
+
+    assert mirror._find_or_create_folder("x", "parent-id") == "existing-id"
+    assert mirror._find_or_create_folder("x", "parent-id") == "existing-id"
+
+    assert drive.files.return_value.list.call_count == 1
+    assert cache.get("parent-id", "x") == "existing-id"
+
+
+def test_ensure_render_folder_with_warm_cache_lists_only_the_leaf():
+    drive = _drive_with_list_results([{"id": "render-id"}])
+    mirror = DriveFolderMirror(drive, root_id="root", cache=_cache_with_chain())
+
+    render_id = mirror.ensure_render_folder("acme", "presentations", "launch")
+
+    assert render_id == "render-id"
+    assert drive.files.return_value.list.call_count == 1
+    q = drive.files.return_value.list.call_args.kwargs["q"]
+    assert "'pres' in parents" in q
+
+
+def test_find_render_folder_uses_cache_for_every_level():
+    cache = _cache_with_chain()
+    cache.put("pres", "launch", "render-id")
+    drive = MagicMock()
+    mirror = DriveFolderMirror(drive, root_id="root", cache=cache)
+
+    assert mirror.find_render_folder("acme", "presentations", "launch") == "render-id"
+    drive.files.return_value.list.assert_not_called()
+
+
+def test_create_under_trashed_cached_parent_revalidates_chain():
+    # Leaf miss under the cached (but trashed) 'pres' id → create comes back
+    # trashed → cache for 'pres' evicted → re-walk finds a fresh 'pres'.
+    drive = _drive_with_list_results([], [{"id": "pres-2"}], [])
+    created = iter([
+        {"id": "orphan", "trashed": True},
+        {"id": "render-2", "trashed": False},
+    ])
+    drive.files.return_value.create.side_effect = None
+    drive.files.return_value.create.return_value.execute.side_effect = (
+        lambda: next(created)
+    )
+    cache = _cache_with_chain()
+    mirror = DriveFolderMirror(drive, root_id="root", cache=cache)
+
+    render_id = mirror.ensure_render_folder("acme", "presentations", "launch")
+
+    assert render_id == "render-2"
+    assert cache.get("brand", PRESENTATIONS_SUBFOLDER) == "pres-2"
+    assert cache.get("pres-2", "launch") == "render-2"
+
+
+def test_create_404_under_cached_parent_revalidates_chain():
+    class FakeHttpError(Exception):
+        def __init__(self):
+            self.resp = type("R", (), {"status": 404})()
+            super().__init__("not found")
+
+    drive = _drive_with_list_results([], [{"id": "pres-2"}], [])
+    results = iter([FakeHttpError(), {"id": "render-2"}])
+
+    def _execute():
+        item = next(results)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    drive.files.return_value.create.side_effect = None
+    drive.files.return_value.create.return_value.execute.side_effect = _execute
+    mirror = DriveFolderMirror(drive, root_id="root", cache=_cache_with_chain())
+
+    assert mirror.ensure_render_folder("acme", "presentations", "launch") == "render-2"
+
+
+def test_stale_error_propagates_without_cache():
+    drive = _drive_with_list_results([], [], [], [])
+    drive.files.return_value.create.side_effect = None
+    drive.files.return_value.create.return_value.execute.return_value = {
+        "id": "x",
+        "trashed": True,
+    }
+    mirror = DriveFolderMirror(drive, root_id="root")
+
+    with pytest.raises(StaleFolderError):
+        mirror.ensure_render_folder("acme", "presentations", "launch")
+
+
+def test_trash_render_folder_evicts_cached_subtree():
+    cache = _cache_with_chain()
+    cache.put("pres", "launch", "render-id")
+    drive = MagicMock()
+    mirror = DriveFolderMirror(drive, root_id="root", cache=cache)
+
+    mirror.trash_render_folder("render-id")
+
+    assert cache.get("pres", "launch") is None
+    assert cache.get("brand", PRESENTATIONS_SUBFOLDER) == "pres"
+
+
+def test_cached_brand_folder_and_invalidate_cache():
+    mirror = DriveFolderMirror(MagicMock(), root_id="root", cache=_cache_with_chain())
+
+    assert mirror.cached_brand_folder("acme") == "brand"
+    assert mirror.cached_brand_folder("globex") is None
+    assert mirror.invalidate_cache("brand") == 2
+    assert mirror.cached_brand_folder("acme") is None
+    assert DriveFolderMirror(MagicMock()).invalidate_cache() == 0
+
+
+# ---------------------------------------------------------------------------- #
+# Batched lookups and trashes
+# ---------------------------------------------------------------------------- #
+
+
+class _Status:
+    def __init__(self, status):
+        self.status = status
+
+
+class _BatchHttpError(Exception):
+    def __init__(self, status):
+        self.resp = _Status(status)
+        super().__init__(f"HTTP {status}")
+
+
+def _batching_drive(folders, failures=None):
+    """Mocked drive whose ``files().list``/``update`` return their kwargs and
+    whose batches answer list queries from ``folders[(parent, name)]``.
+
+    ``failures`` maps a folder name (or trashed id) to a list of statuses to
+    fail with, one per attempt. ``drive.batches`` records each batch's size.
+    """
+    drive = MagicMock(name="drive")
+    drive.batches = []
+    failures = failures or {}
+
+    def _request(kind):
+        def _build(**kwargs):
+            request = MagicMock(name=kind, methodId=f"drive.files.{kind}")
+            request.call = (kind, kwargs)
+            request.execute.side_effect = lambda: _answer(request.call)[0]
+            return request
+
+        return _build
+
+    drive.files.return_value.list.side_effect = _request("list")
+    drive.files.return_value.update.side_effect = _request("update")
+
+    def _answer(request):
+        kind, kwargs = request
+        if kind == "update":
+            key = kwargs["fileId"]
+        else:
+            q = kwargs["q"]
+            key = q.split("name = '", 1)[1].split("'", 1)[0]
+        if failures.get(key):
+            return None, _BatchHttpError(failures[key].pop(0))
+        if kind == "update":
+            return {"id": key, "trashed": True}, None
+        parent = q.split("and '", 1)[1].split("'", 1)[0]
+        folder_id = folders.get((parent, key))
+        return {"files": [{"id": folder_id}] if folder_id else []}, None
+
+    def _new_batch(callback):
+        batch = MagicMock(name="batch")
+        parts = []
+        batch.add.side_effect = lambda request, request_id: parts.append(
+            (request_id, request)
+        )
+
+        def _execute():
+            drive.batches.append(len(parts))
+            for request_id, request in parts:
+                response, exception = _answer(request.call)
+                callback(request_id, response, exception)
+
+        batch.execute.side_effect = _execute
+        return batch
+
+    drive.new_batch_http_request.side_effect = _new_batch
+    return drive
+
+
+_CHAIN = {
+    ("root", BRAND_CONTENT_ROOT_NAME): "bc",
+    ("bc", "acme"): "brand",
+    ("brand", PRESENTATIONS_SUBFOLDER): "pres",
+    ("brand", TEMPLATES_SUBFOLDER): "tmpl",
+}
+
+
+def test_find_render_folders_probes_all_slugs_in_one_batch_and_caches_hits():
+    folders = {**_CHAIN, ("pres", "a-v2"): "r2", ("pres", "a-v3"): "r3"}
+    drive = _batching_drive(folders)
+    cache = FolderIdCache()
+    mirror = DriveFolderMirror(drive, root_id="root", cache=cache)
+    slugs = [f"a-v{n}" for n in range(2, 7)]
+
+    found = mirror.find_render_folders("acme", "presentations", slugs)
+
+    assert found == {
+        "a-v2": "r2",
+        "a-v3": "r3",
+        "a-v4": None,
+        "a-v5": None,
+        "a-v6": None,
+    }
+    assert drive.batches == [5]
+    assert cache.get("pres", "a-v3") == "r3"
+
+    mirror.find_render_folders("acme", "presentations", ["a-v2"])
+    assert drive.batches == [5]  # served from the cache
+
+
+def test_batch_retries_only_the_parts_that_failed_transiently():
+    drive = _batching_drive(
+        {**_CHAIN, ("pres", "x"): "rx"}, failures={"x": [503]}
+    )
+    retry = RetryPolicy(max_attempts=3, sleep=lambda _: None)
+    mirror = DriveFolderMirror(drive, root_id="root", retry=retry)
+
+    found = mirror.find_render_folders("acme", "presentations", ["x", "y"])
+
+    assert found == {"x": "rx", "y": None}
+    assert drive.batches == [2, 1]
+
+
+def test_trash_render_folders_sends_one_batch_and_ignores_404():
+    drive = _batching_drive({}, failures={"gone": [404]})
+    mirror = DriveFolderMirror(drive, root_id="root")
+
+    mirror.trash_render_folders(["r1", "gone", "r1"])
+
+    assert drive.batches == [2]
+
+
+def test_trash_render_folders_raises_permanent_errors():
+    drive = _batching_drive({}, failures={"r1": [403]})
+    mirror = DriveFolderMirror(drive, root_id="root")
+
+    with pytest.raises(_BatchHttpError):
+        mirror.trash_render_folders(["r1", "r2"])
+    assert drive.batches == [2]
+
+
+def test_list_render_folder_names_follows_pagination():
+    drive = _batching_drive(_CHAIN)
+    pages = iter(
+        [
+            {"files": [{"name": "deck-v2"}], "nextPageToken": "p2"},
+            {"files": [{"name": "deck-v3"}]},
+        ]
+    )
+    seen = []
+
+    def _list(**kwargs):
+        request = MagicMock()
+        if kwargs["q"].startswith("name contains"):
+            seen.append(kwargs)
+            request.execute.return_value = next(pages)
+        else:
+            name = kwargs["q"].split("name = '", 1)[1].split("'", 1)[0]
+            parent = kwargs["q"].split("and '", 1)[1].split("'", 1)[0]
+            request.execute.return_value = {
+                "files": [{"id": _CHAIN[(parent, name)]}]
+            }
+        request.call = ("list", kwargs)
+        return request
+
+    drive.files.return_value.list.side_effect = _list
+    mirror = DriveFolderMirror(drive, root_id="root")
+
+    names = mirror.list_render_folder_names("acme", "presentations", "deck")
+
+    assert names == ["deck-v2", "deck-v3"]
+    assert "'pres' in parents" in seen[0]["q"]
+    assert [kw["pageToken"] for kw in seen] == [None, "p2"]
+
+
+def test_resolve_path_starts_below_deepest_cached_prefix():
+    cache = FolderIdCache()
+    cache.put("root", BRAND_CONTENT_ROOT_NAME, "bc")
+    cache.put("bc", "acme", "brand")
+    drive = _drive_with_list_results([])
+    mirror = DriveFolderMirror(drive, root_id="root", cache=cache)
+
+    ids = mirror.resolve_path(
+        (BRAND_CONTENT_ROOT_NAME, "acme", PRESENTATIONS_SUBFOLDER, "launch"),
+        create=True,
+    )
+
+    assert ids == ("bc", "brand", "new-folder-1", "new-folder-2")
+    # One lookup for the first uncached level; its new child needs none.
+    assert drive.files.return_value.list.call_count == 1
+    assert drive.files.return_value.create.call_count == 2
+    assert cache.get("new-folder-1", "launch") == "new-folder-2"
+
+
+def test_resolve_path_without_create_pads_missing_levels_with_none():
+    drive = _drive_with_list_results([{"id": "bc"}], [])
+    mirror = DriveFolderMirror(drive, root_id="root")
+
+    ids = mirror.resolve_path((BRAND_CONTENT_ROOT_NAME, "acme", "presentations"))
+
+    assert ids == ("bc", None, None)
+    assert drive.files.return_value.list.call_count == 2
+    drive.files.return_value.create.assert_not_called()
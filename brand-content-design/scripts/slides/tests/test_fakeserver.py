@@ -0,0 +1,236 @@
+"""End-to-end runs of ``slides.cli`` against :mod:`slides.fakeserver`.
+
+Real googleapiclient services over real HTTP, no credentials, no network.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from slides import cli
+from slides.fakeserver import FOLDER_MIME, SLIDES_MIME, FakeGoogleServer
+from slides.runner import read_slides_url_file
+
+
+@pytest.fixture
+def fake_google(monkeypatch):
+    for name in (
+        "BCD_SLIDES_SA_KEY_FILE",
+        "BCD_SLIDES_OAUTH_CLIENT_ID",
+        "BCD_SLIDES_OAUTH_CLIENT_SECRET",
+        "BCD_SLIDES_OAUTH_REFRESH_TOKEN",
+        "BRAND_CONTENT_DRIVE_ROOT_ID",
+        "BCD_SLIDES_RATE_LIMIT",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("BCD_SLIDES_RETRY_BASE_DELAY", "0")
+    monkeypatch.setattr(cli, "_mirror_slot", None)
+    with FakeGoogleServer(seed=0) as server:
+        monkeypatch.setenv("BCD_SLIDES_API_ENDPOINT", server.endpoint)
+        yield server
+
+
+def _run(*records):
+    out = io.StringIO()
+    lines = [json.dumps({"command": c, "payload": p}) for c, p in records]
+    code = cli.run_batch(lines, out)
+    return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def _render_dir(tmp_path, pptx=b"PPTX-1"):
+    (tmp_path / "launch.pptx").write_bytes(pptx)
+    (tmp_path / "launch.pdf").write_bytes(b"%PDF-1")
+    (tmp_path / "outline.md").write_text("# Launch\n")
+    return {
+        "brand": "acme",
+        "render_slug": "launch",
+        "local_dir": str(tmp_path),
+        "pptx_path": str(tmp_path / "launch.pptx"),
+        "deck_title": "Launch",
+        "pdf_path": str(tmp_path / "launch.pdf"),
+        "outline_path": str(tmp_path / "outline.md"),
+    }
+
+
+def test_create_deck_and_chunked_batch_update(fake_google):
+    code, [created] = _run(("create_deck", {"title": "Smoke"}))
+    deck_id = created["result"]["deck_id"]
+
+    requests = [{"createSlide": {"objectId": f"s{i}"}} for i in range(5)]
+    code, [updated] = _run(
+        (
+            "apply_batch_update",
+            {
+                "deck_id": deck_id,
+                "requests": requests,
+                "chunked": True,
+                "max_requests_per_batch": 2,
+            },
+        )
+    )
+
+    assert code == 0
+    assert updated["result"]["batchCount"] == 3
+    assert len(fake_google.presentations[deck_id]["slides"]) == 6
+    assert fake_google.calls["slides.presentations.batchUpdate"] == 3
+
+
+def test_apply_batch_update_streams_a_requests_file(fake_google, tmp_path):
+    code, [created] = _run(("create_deck", {"title": "Big"}))
+    deck_id = created["result"]["deck_id"]
+    path = tmp_path / "requests.jsonl"
+    with open(path, "w") as fh:
+        for i in range(7):
+            fh.write(json.dumps({"createSlide": {"objectId": f"s{i}"}}) + "\n")
+
+    code, [updated] = _run(
+        (
+            "apply_batch_update",
+            {
+                "deck_id": deck_id,
+                "requests_file": str(path),
+                "max_requests_per_batch": 3,
+            },
+        )
+    )
+
+    assert code == 0, updated
+    assert updated["result"]["batchCount"] == 3
+    assert len(updated["result"]["replies"]) == 7
+    assert len(fake_google.presentations[deck_id]["slides"]) == 8
+
+
+def test_mirror_then_incremental_replace(fake_google, tmp_path):
+    payload = _render_dir(tmp_path)
+    code, [mirrored] = _run(("mirror_presentation", payload))
+    assert code == 0, mirrored
+    result = mirrored["result"]
+
+    folder = fake_google.files[result["folder_id"]]
+    assert folder["mimeType"] == FOLDER_MIME
+    assert fake_google.files[result["deck_id"]]["mimeType"] == SLIDES_MIME
+    assert fake_google.files[result["pdf_file_id"]]["content"] == b"%PDF-1"
+    assert read_slides_url_file(tmp_path)["deck_id"] == result["deck_id"]
+
+    (tmp_path / "launch.pdf").write_bytes(b"%PDF-2")
+    code, [replaced] = _run(
+        ("replace_render", {**payload, "strategy": "incremental"})
+    )
+
+    assert code == 0, replaced
+    assert replaced["result"]["artifact_actions"] == {
+        "deck": "unchanged",
+        "pdf": "updated",
+        "outline": "unchanged",
+    }
+    assert replaced["result"]["pdf_file_id"] == result["pdf_file_id"]
+    assert fake_google.files[result["pdf_file_id"]]["content"] == b"%PDF-2"
+
+
+def test_missing_deck_id_is_not_mistaken_for_a_stale_folder(fake_google, tmp_path):
+    payload = _render_dir(tmp_path)
+    direct = {**payload, "pptx_path": None, "deck_id": "gone"}
+
+    code, [mirrored, failed] = _run(
+        ("mirror_presentation", payload), ("mirror_presentation", direct)
+    )
+
+    assert code == 1
+    assert failed["error"]["status"] == 404
+    pdfs = [
+        f for f in fake_google.files.values() if f.get("name") == "launch.pdf"
+    ]
+    # The failed round's PDF is trashed and no second round is attempted.
+    assert len(pdfs) == 2
+    assert [f["id"] for f in pdfs if not f["trashed"]] == [
+        mirrored["result"]["pdf_file_id"]
+    ]
+
+
+def test_resumable_upload_in_chunks(fake_google, tmp_path, monkeypatch):
+    monkeypatch.setenv("BCD_SLIDES_RESUMABLE_THRESHOLD_MB", "0.25")
+    monkeypatch.setenv("BCD_SLIDES_UPLOAD_CHUNK_MB", "0.25")
+    payload = _render_dir(tmp_path)
+    big = bytes(range(256)) * 4096  # 1 MiB → four chunks
+    (tmp_path / "launch.pdf").write_bytes(big)
+
+    code, [mirrored] = _run(("mirror_presentation", payload))
+
+    assert code == 0, mirrored
+    assert fake_google.files[mirrored["result"]["pdf_file_id"]]["content"] == big
+
+
+def test_injected_faults_are_retried(fake_google):
+    fake_google.fail_next(503)
+    fake_google.fail_next(403, reason="userRateLimitExceeded")
+
+    code, [ensured] = _run(
+        (
+            "ensure_render_folder",
+            {"brand": "acme", "kind": "presentations", "render_slug": "x"},
+        )
+    )
+
+    assert code == 0, ensured
+    assert ensured["result"]["retries"] == [
+        {"method": "drive.files.list", "retries": 2, "outcome": "ok"}
+    ]
+
+
+def test_non_idempotent_create_is_not_blindly_retried(fake_google):
+    fake_google.fail_next(503)
+
+    code, [created] = _run(("create_deck", {"title": "Flaky"}))
+
+    assert code == 1
+    assert created["error"]["status"] == 503
+    assert fake_google.presentations == {}
+
+
+def test_batched_trash_of_several_renders(fake_google, tmp_path):
+    for slug in ("a", "b"):
+        code, _ = _run(
+            (
+                "ensure_render_folder",
+                {"brand": "acme", "kind": "presentations", "render_slug": slug},
+            )
+        )
+    fake_google.reset_counters()
+
+    code, [trashed] = _run(
+        (
+            "trash_existing_render",
+            {
+                "brand": "acme",
+                "kind": "presentations",
+                "render_slugs": ["a", "b", "missing"],
+            },
+        )
+    )
+
+    assert code == 0, trashed
+    ids = trashed["result"]["trashed_folder_ids"]
+    assert ids["missing"] is None
+    assert all(fake_google.files[ids[s]]["trashed"] for s in ("a", "b"))
+    # Folder chain cached: one lookup (only "missing" is unknown) and one
+    # trash batch.
+    assert fake_google.round_trips == 2
+
+
+def test_async_client_follows_the_endpoint(fake_google):
+    pytest.importorskip("httpx")
+    import asyncio
+
+    from slides.aio import AsyncDriveFolderMirror, AsyncGoogleClient
+
+    async def _main():
+        async with AsyncGoogleClient.from_env() as client:
+            mirror = AsyncDriveFolderMirror(client)
+            return await mirror.ensure_render_folder("acme", "presentations", "x")
+
+    folder_id = asyncio.run(_main())
+
+    assert fake_google.files[folder_id]["name"] == "x"
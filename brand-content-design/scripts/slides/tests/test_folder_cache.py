@@ -0,0 +1,85 @@
+"""Unit tests for slides.cache.FolderIdCache — pure filesystem, no network."""
+
+from __future__ import annotations
+
+import json
+
+from slides.cache import FOLDER_CACHE_VERSION, FolderIdCache, default_cache_dir
+
+
+def test_default_cache_dir_prefers_explicit_env(tmp_path):
+    env = {"BCD_SLIDES_CACHE_DIR": str(tmp_path / "x"), "XDG_CACHE_HOME": "/xdg"}
+    assert default_cache_dir(env) == tmp_path / "x"
+
+
+def test_default_cache_dir_falls_back_to_xdg():
+    path = default_cache_dir({"XDG_CACHE_HOME": "/xdg"})
+    assert str(path) == "/xdg/brand-content-design/slides"
+
+
+def test_for_root_uses_one_file_per_root(_isolated_cache_dir):
+    a = FolderIdCache.for_root("abc-123")
+    b = FolderIdCache.for_root(None)
+    assert a.path == _isolated_cache_dir / "folders-abc-123.json"
+    assert b.path == _isolated_cache_dir / "folders-root.json"
+
+
+def test_put_get_roundtrip_persists_to_disk(tmp_path):
+    path = tmp_path / "folders.json"
+    FolderIdCache(path).put("parent", "brand-content", "bc-id")
+
+    reloaded = FolderIdCache(path)
+    assert reloaded.get("parent", "brand-content") == "bc-id"
+    assert reloaded.get("parent", "other") is None
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["version"] == FOLDER_CACHE_VERSION
+
+
+def test_unknown_version_is_ignored(tmp_path):
+    path = tmp_path / "folders.json"
+    path.write_text(json.dumps({"version": 999, "folders": {"p": {"n": "x"}}}))
+    assert FolderIdCache(path).get("p", "n") is None
+
+
+def test_corrupt_file_is_treated_as_empty(tmp_path):
+    path = tmp_path / "folders.json"
+    path.write_text("{not json")
+    cache = FolderIdCache(path)
+    assert cache.get("p", "n") is None
+    cache.put("p", "n", "x")
+    assert FolderIdCache(path).get("p", "n") == "x"
+
+
+def test_invalidate_drops_folder_and_descendants_only():
+    cache = FolderIdCache()
+    cache.put("root", "brand-content", "bc")
+    cache.put("bc", "acme", "acme-id")
+    cache.put("bc", "other", "other-id")
+    cache.put("acme-id", "presentations", "pres")
+    cache.put("pres", "2026-05-26-launch", "render")
+
+    removed = cache.invalidate("acme-id")
+
+    assert removed == 3
+    assert cache.get("root", "brand-content") == "bc"
+    assert cache.get("bc", "other") == "other-id"
+    assert cache.get("bc", "acme") is None
+    assert cache.get("acme-id", "presentations") is None
+    assert cache.get("pres", "2026-05-26-launch") is None
+
+
+def test_invalidate_without_argument_clears_everything(tmp_path):
+    path = tmp_path / "folders.json"
+    cache = FolderIdCache(path)
+    cache.put("root", "brand-content", "bc")
+    cache.put("bc", "acme", "acme-id")
+
+    assert cache.invalidate() == 2
+    assert FolderIdCache(path).get("root", "brand-content") is None
+
+
+def test_in_memory_cache_never_touches_disk(tmp_path):
+    cache = FolderIdCache()
+    cache.put("p", "n", "x")
+    assert cache.path is None
+    assert list(tmp_path.iterdir()) == []
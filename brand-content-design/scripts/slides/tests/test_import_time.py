@@ -0,0 +1,75 @@
+"""Cold-start budget for ``slides.cli``, measured with ``-X importtime``.
+
+Usage errors, bad JSON and ``--help``-style invocations must not pay for the
+Google client libraries; those load on the first real command.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2]
+
+#: Top-level packages that only a real command may import.
+HEAVY = ("google", "googleapiclient", "google_auth_httplib2", "httplib2")
+
+#: Cumulative import time allowed for ``slides.cli`` itself, microseconds.
+#: Generous for slow CI; the Google stack alone is several times this.
+BUDGET_US = 150_000
+
+
+def _importtime(*args: str, stdin: str = "") -> dict[str, int]:
+    """Module → cumulative import time (µs) for ``python -X importtime``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=SCRIPTS_DIR,
+        input=stdin,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def _heavy(times: dict[str, int]) -> list[str]:
+    return sorted(m for m in times if m.split(".")[0] in HEAVY)
+
+
+def test_importing_cli_skips_google_and_fits_the_budget():
+    times = _importtime("-c", "import slides.cli")
+
+    assert _heavy(times) == []
+    assert times["slides.cli"] < BUDGET_US, times["slides.cli"]
+
+
+def test_usage_and_json_errors_never_import_google():
+    assert _heavy(_importtime("-m", "slides.cli", "no_such_command")) == []
+    assert _heavy(_importtime("-m", "slides.cli", "create_deck", stdin="{")) == []
+
+
+def test_package_exports_resolve_on_access():
+    script = (
+        "import sys, slides\n"
+        "assert 'slides.auth' not in sys.modules\n"
+        "assert slides.SlidesRunner.__module__ == 'slides.runner'\n"
+        "assert callable(slides.build_services)\n"
+        "assert 'slides.auth' in sys.modules\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=SCRIPTS_DIR,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,108 @@
+"""Unit tests for slides.ratelimit — fake clock, real lock files."""
+
+from __future__ import annotations
+
+import pytest
+
+from slides.ratelimit import TokenBucketLimiter, parse_rates
+from slides.retry import RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock, state_dir, **kwargs):
+    return TokenBucketLimiter(
+        {"drive": 2.0},
+        state_dir=state_dir,
+        clock=clock,
+        sleep=clock.sleep,
+        **kwargs,
+    )
+
+
+def test_parse_rates():
+    assert parse_rates("drive=10, slides=2.5") == {"drive": 10.0, "slides": 2.5}
+    with pytest.raises(ValueError):
+        parse_rates("drive")
+    with pytest.raises(ValueError):
+        parse_rates("drive=0")
+
+
+def test_burst_then_throttles_to_rate(tmp_path):
+    clock = FakeClock()
+    limiter = _limiter(clock, tmp_path)
+
+    waits = [limiter.acquire("drive.files.list") for _ in range(4)]
+
+    assert waits == [0.0, 0.0, pytest.approx(0.5), pytest.approx(0.5)]
+
+
+def test_bucket_is_shared_through_state_dir(tmp_path):
+    # Two limiter instances stand in for two worker processes.
+    clock = FakeClock()
+    first = _limiter(clock, tmp_path)
+    second = _limiter(clock, tmp_path)
+
+    first.acquire("drive")
+    first.acquire("drive")
+
+    assert second.acquire("drive.files.create") == pytest.approx(0.5)
+    assert (tmp_path / "drive.json").exists()
+
+
+def test_unlisted_api_is_not_throttled(tmp_path):
+    clock = FakeClock()
+    limiter = _limiter(clock, tmp_path, burst=1)
+
+    waits = [limiter.acquire("slides.presentations.get") for _ in range(3)]
+
+    assert waits == [0.0] * 3
+    assert clock.sleeps == []
+
+
+def test_in_memory_buckets_without_state_dir():
+    clock = FakeClock()
+    limiter = _limiter(clock, None, burst=1)
+
+    assert limiter.acquire("drive") == 0.0
+    assert limiter.acquire("drive") == pytest.approx(0.5)
+
+
+def test_from_env(tmp_path):
+    assert TokenBucketLimiter.from_env({}) is None
+    limiter = TokenBucketLimiter.from_env(
+        {"BCD_SLIDES_RATE_LIMIT": "drive=5", "BCD_SLIDES_CACHE_DIR": str(tmp_path)}
+    )
+    assert limiter.acquire("drive") == 0.0
+    assert (tmp_path / "ratelimit" / "drive.json").exists()
+
+
+def test_retry_policy_throttles_every_attempt():
+    seen = []
+
+    class Boom(Exception):
+        resp = type("R", (), {"status": 503})()
+
+    outcomes = iter([Boom(), "ok"])
+
+    def _fn():
+        item = next(outcomes)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    policy = RetryPolicy(throttle=seen.append, sleep=lambda s: None)
+
+    assert policy.call(_fn, method="drive.files.list") == "ok"
+    assert seen == ["drive.files.list", "drive.files.list"]
@@ -0,0 +1,185 @@
+"""Unit tests for slides.retry — no sleeping, no network."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from slides import cli
+from slides.retry import RetryPolicy, is_rate_limited, is_transient
+from slides.runner import DriveFolderMirror, SlidesRunner
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status, content=b"", headers=None):
+        self.resp = _Resp(status, headers or {})
+        self.content = content
+        super().__init__(f"HTTP {status}")
+
+
+class _Resp(dict):
+    def __init__(self, status, headers):
+        super().__init__(headers)
+        self.status = status
+
+
+def _policy(**kwargs):
+    sleeps = []
+    policy = RetryPolicy(sleep=sleeps.append, rand=lambda: 1.0, **kwargs)
+    return policy, sleeps
+
+
+def _flaky(*outcomes):
+    """Callable returning/raising each outcome in turn."""
+    items = iter(outcomes)
+
+    def _fn():
+        item = next(items)
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    return _fn
+
+
+def test_classification():
+    assert is_transient(FakeHttpError(503))
+    assert is_transient(ConnectionResetError())
+    assert not is_transient(FakeHttpError(404))
+    assert is_rate_limited(FakeHttpError(403, b'{"reason": "userRateLimitExceeded"}'))
+    assert not is_rate_limited(FakeHttpError(403, b'{"reason": "forbidden"}'))
+
+
+def test_retries_transient_errors_with_capped_exponential_backoff():
+    policy, sleeps = _policy(max_attempts=5, base_delay=1.0, max_delay=3.0)
+    fn = _flaky(FakeHttpError(500), FakeHttpError(502), FakeHttpError(503), "ok")
+
+    assert policy.call(fn, method="drive.files.list") == "ok"
+    assert sleeps == [1.0, 2.0, 3.0]
+    assert policy.take_log() == [
+        {"method": "drive.files.list", "retries": 3, "outcome": "ok"}
+    ]
+    assert policy.log == []
+
+
+def test_full_jitter_draws_below_the_ceiling():
+    policy = RetryPolicy(base_delay=2.0, rand=lambda: 0.25)
+    assert policy.delay_for(2, FakeHttpError(503)) == pytest.approx(2.0)
+
+
+def test_honours_retry_after_header():
+    policy, sleeps = _policy()
+    fn = _flaky(FakeHttpError(429, headers={"retry-after": "7"}), "ok")
+
+    assert policy.call(fn) == "ok"
+    assert sleeps == [7.0]
+
+
+def test_gives_up_after_max_attempts_and_logs_failure():
+    policy, sleeps = _policy(max_attempts=2)
+    fn = _flaky(FakeHttpError(503), FakeHttpError(503))
+
+    with pytest.raises(FakeHttpError):
+        policy.call(fn, method="m")
+    assert len(sleeps) == 1
+    assert policy.log == [{"method": "m", "retries": 1, "outcome": "failed"}]
+
+
+def test_non_retryable_error_raises_immediately():
+    policy, sleeps = _policy()
+    with pytest.raises(FakeHttpError):
+        policy.call(_flaky(FakeHttpError(404)))
+    assert sleeps == []
+    assert policy.log == []
+
+
+def test_non_idempotent_without_recover_only_retries_rate_limits():
+    policy, _ = _policy()
+    with pytest.raises(FakeHttpError):
+        policy.call(_flaky(FakeHttpError(503), "ok"), idempotent=False)
+    assert policy.call(_flaky(FakeHttpError(429), "ok"), idempotent=False) == "ok"
+
+
+def test_non_idempotent_recover_short_circuits_duplicate_create():
+    policy, _ = _policy()
+    fn = MagicMock(side_effect=[FakeHttpError(503), {"id": "dup"}])
+
+    result = policy.call(
+        fn, idempotent=False, recover=lambda: {"id": "landed"}, method="create"
+    )
+
+    assert result == {"id": "landed"}
+    assert fn.call_count == 1
+    assert policy.log == [{"method": "create", "retries": 1, "outcome": "recovered"}]
+
+
+def test_from_env_and_validation():
+    policy = RetryPolicy.from_env({"BCD_SLIDES_RETRY_MAX_ATTEMPTS": "2"})
+    assert policy.max_attempts == 2
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+
+
+def test_mirror_folder_create_recovers_by_relisting():
+    policy, _ = _policy()
+    drive = MagicMock()
+    drive.files.return_value.list.return_value.execute.side_effect = [
+        {"files": []},
+        {"files": [{"id": "landed"}]},
+    ]
+    drive.files.return_value.create.return_value.execute.side_effect = (
+        FakeHttpError(503)
+    )
+    mirror = DriveFolderMirror(drive, root_id="root", retry=policy)
+
+    assert mirror._find_or_create_folder("acme", "bc") == "landed"
+    assert drive.files.return_value.create.return_value.execute.call_count == 1
+
+
+def test_run_command_reports_retries_in_output():
+    policy, _ = _policy()
+    slides = MagicMock()
+    slides.presentations.return_value.create.return_value.execute.side_effect = [
+        FakeHttpError(429),
+        {"presentationId": "d"},
+    ]
+    slides.presentations.return_value.create.return_value.methodId = (
+        "slides.presentations.create"
+    )
+    runner = SlidesRunner(slides, MagicMock(), retry=policy)
+
+    code, output = cli.run_command(runner, "create_deck", {"title": "x"})
+    _, clean = cli.run_command(
+        runner, "move_to_folder", {"deck_id": "d", "folder_id": "f"}
+    )
+
+    assert code == 0
+    assert output["retries"] == [
+        {"method": "slides.presentations.create", "retries": 1, "outcome": "ok"}
+    ]
+    assert "retries" not in clean
+
+
+def test_upload_recovers_file_created_by_failed_attempt(tmp_path):
+    policy, _ = _policy()
+    drive = MagicMock()
+    drive.files.return_value.create.return_value.execute.side_effect = (
+        FakeHttpError(502)
+    )
+    drive.files.return_value.list.return_value.execute.return_value = {
+        "files": [{"id": "pdf-landed"}]
+    }
+    pdf = tmp_path / "deck.pdf"
+    pdf.write_bytes(b"%PDF")
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(cli, "MediaFileUpload", MagicMock())
+        file_id = cli._upload_file(
+            drive, "folder", str(pdf), "application/pdf", policy
+        )
+
+    assert file_id == "pdf-landed"
+    q = drive.files.return_value.list.call_args.kwargs["q"]
+    assert "name = 'deck.pdf'" in q
+    assert "createdTime >" in q
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock
 
-from slides.runner import SlidesRunner
+import pytest
+
+from slides.runner import (
+    BatchUpdateChunkError,
+    SlidesRunner,
+    chunk_batch_requests,
+    iter_requests_file,
+)
 
 
 def _make_runner():
@@ -66,3 +74,166 @@ def test_deck_url_is_pure_and_well_formed():
     assert SlidesRunner.deck_url("abc123") == (
         "https://docs.google.com/presentation/d/abc123/edit"
     )
+
+
+# ------------------------------------------------------------ chunked batches
+
+
+def _shape(object_id, page="p1"):
+    return {
+        "createShape": {
+            "objectId": object_id,
+            "shapeType": "TEXT_BOX",
+            "elementProperties": {"pageObjectId": page},
+        }
+    }
+
+
+def _text(object_id, text="x"):
+    return {"insertText": {"objectId": object_id, "text": text}}
+
+
+def test_chunk_batch_requests_respects_count_bound():
+    requests = [{"deleteObject": {"objectId": f"o{i}"}} for i in range(7)]
+
+    chunks = list(chunk_batch_requests(requests, max_requests=3))
+
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    assert [r for c in chunks for r in c] == requests
+
+
+def test_chunk_batch_requests_keeps_create_with_its_dependents():
+    requests = [
+        _shape("a"), _text("a"),
+        _shape("b"), _text("b"), _text("b", "more"),
+        _shape("c"), _text("c"),
+    ]
+
+    chunks = list(chunk_batch_requests(requests, max_requests=4))
+
+    # A naive 4/3 split would separate createShape "b" from its text; the
+    # cut moves back to the previous clean boundary instead.
+    assert chunks == [requests[:2], requests[2:5], requests[5:]]
+
+
+def test_chunk_batch_requests_splits_oversized_dependency_run_in_order():
+    requests = [_shape("a")] + [_text("a", str(i)) for i in range(5)]
+
+    chunks = list(chunk_batch_requests(requests, max_requests=2))
+
+    assert [r for c in chunks for r in c] == requests
+    assert all(len(c) <= 2 for c in chunks)
+
+
+def test_chunk_batch_requests_respects_byte_bound_and_is_lazy():
+    big = {"insertText": {"objectId": "z", "text": "x" * 100}}
+    consumed = []
+
+    def _gen():
+        for i in range(4):
+            consumed.append(i)
+            yield {"deleteObject": {"objectId": f"o{i}"}} if i % 2 else big
+
+    chunks = chunk_batch_requests(_gen(), max_bytes=150)
+    first = next(chunks)
+
+    assert first == [big]
+    assert consumed == [0, 1]  # only pulled enough to close one chunk
+    assert sum(len(c) for c in chunks) == 3
+
+
+def test_iter_requests_file_streams_lines_into_chunks(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    path.write_text(
+        "".join(
+            json.dumps({"createSlide": {"objectId": f"s{i}"}}) + "\n\n"
+            for i in range(5)
+        )
+    )
+
+    chunks = list(chunk_batch_requests(iter_requests_file(path), max_requests=2))
+
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert chunks[-1] == [{"createSlide": {"objectId": "s4"}}]
+
+
+def test_iter_requests_file_names_the_bad_line(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    path.write_text('{"deleteObject": {"objectId": "a"}}\n[1, 2]\n')
+
+    with pytest.raises(ValueError, match=r"requests.jsonl:2: request must be"):
+        list(iter_requests_file(path))
+
+
+def test_bad_line_midway_through_a_requests_file_reports_progress(tmp_path):
+    path = tmp_path / "requests.jsonl"
+    path.write_text(
+        json.dumps(_text("a")) + "\n" + json.dumps(_text("b")) + "\nnot json\n"
+    )
+    runner, slides, _ = _make_runner()
+    slides.presentations.return_value.batchUpdate.return_value.execute.return_value = {
+        "replies": [{}]
+    }
+
+    with pytest.raises(BatchUpdateChunkError, match="requests.jsonl:3") as info:
+        runner.apply_batch_update_chunked(
+            "deck1", iter_requests_file(path), max_requests=1
+        )
+
+    assert info.value.applied == 1
+    assert info.value.replies == [{}]
+    assert isinstance(info.value.__cause__, ValueError)
+
+
+def test_chunk_batch_requests_rejects_non_positive_bounds():
+    with pytest.raises(ValueError):
+        list(chunk_batch_requests([], max_requests=0))
+
+
+def test_apply_batch_update_chunked_chains_revision_and_merges_replies():
+    runner, slides, _ = _make_runner()
+    batch = slides.presentations.return_value.batchUpdate
+    batch.return_value.execute.side_effect = [
+        {"replies": [{"createShape": {"objectId": "a"}}, {}],
+         "writeControl": {"requiredRevisionId": "rev-1"}},
+        {"replies": [{"createShape": {"objectId": "b"}}, {}],
+         "writeControl": {"requiredRevisionId": "rev-2"}},
+    ]
+    requests = [_shape("a"), _text("a"), _shape("b"), _text("b")]
+
+    result = runner.apply_batch_update(
+        "deck1", requests, chunked=True, max_requests=2
+    )
+
+    assert result["replies"] == [
+        {"createShape": {"objectId": "a"}}, {},
+        {"createShape": {"objectId": "b"}}, {},
+    ]
+    assert result["writeControl"] == {"requiredRevisionId": "rev-2"}
+    assert result["batchCount"] == 2
+    first_body = batch.call_args_list[0].kwargs["body"]
+    second_body = batch.call_args_list[1].kwargs["body"]
+    assert "writeControl" not in first_body
+    assert second_body["writeControl"] == {"requiredRevisionId": "rev-1"}
+    assert second_body["requests"] == requests[2:]
+
+
+def test_apply_batch_update_chunked_reports_progress_on_failure():
+    class FakeHttpError(Exception):
+        def __init__(self):
+            self.resp = type("R", (), {"status": 400})()
+            super().__init__("revision mismatch")
+
+    runner, slides, _ = _make_runner()
+    slides.presentations.return_value.batchUpdate.return_value.execute.side_effect = [
+        {"replies": [{}], "writeControl": {"requiredRevisionId": "rev-1"}},
+        FakeHttpError(),
+    ]
+
+    with pytest.raises(BatchUpdateChunkError) as info:
+        runner.apply_batch_update_chunked(
+            "deck1", [_text("a"), _text("b")], max_requests=1
+        )
+
+    assert info.value.applied == 1
+    assert info.value.resp.status == 400
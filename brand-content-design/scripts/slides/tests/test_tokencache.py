@@ -0,0 +1,99 @@
+"""Unit tests for slides.tokencache — no token endpoint, no network."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+
+from slides import auth
+from slides.tokencache import TokenCache
+
+
+def _now():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class FakeCreds:
+    """Stand-in for google-auth credentials; ``refresh`` mints numbered tokens."""
+
+    def __init__(self, client_id="cid", scopes=("a", "b"), lifetime=3600):
+        self.client_id = client_id
+        self.refresh_token = "refresh-secret"
+        self.scopes = list(scopes)
+        self.token = None
+        self.expiry = None
+        self.lifetime = lifetime
+        self.refreshes = 0
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.token = f"{self.client_id}-token-{self.refreshes}"
+        self.expiry = _now() + timedelta(seconds=self.lifetime)
+
+
+def test_second_process_reuses_token_without_refreshing():
+    first = FakeCreds()
+    cache = TokenCache.for_credentials(first)
+    cache.attach(first).refresh(request=None)
+
+    second = FakeCreds()
+    TokenCache.for_credentials(second).attach(second)
+
+    assert second.token == "cid-token-1"
+    assert second.expiry == first.expiry
+    # Even an explicit refresh call picks up the cached token.
+    second.token = None
+    second.refresh(request=None)
+    assert second.refreshes == 0
+    assert second.token == "cid-token-1"
+    assert oct(os.stat(cache.path).st_mode & 0o777) == "0o600"
+    assert "refresh-secret" not in cache.path.read_text()
+
+
+def test_rejected_token_is_refreshed_even_if_cached():
+    creds = FakeCreds()
+    TokenCache.for_credentials(creds).attach(creds)
+    creds.refresh(request=None)
+    # A 401 makes the transport call refresh with the cached token in hand.
+    creds.refresh(request=None)
+
+    assert creds.refreshes == 2
+    assert TokenCache.for_credentials(creds).load()[0] == "cid-token-2"
+
+
+def test_nearly_expired_tokens_are_not_reused():
+    creds = FakeCreds(lifetime=60)
+    cache = TokenCache.for_credentials(creds)
+    cache.attach(creds).refresh(request=None)
+
+    assert cache.load() is None
+    fresh = FakeCreds()
+    TokenCache.for_credentials(fresh).attach(fresh)
+    assert fresh.token is None
+
+
+def test_cache_key_depends_on_identity_and_scopes():
+    base = TokenCache.for_credentials(FakeCreds()).path
+    assert TokenCache.for_credentials(FakeCreds(scopes=("b", "a"))).path == base
+    assert TokenCache.for_credentials(FakeCreds(scopes=("a",))).path != base
+    assert TokenCache.for_credentials(FakeCreds(client_id="other")).path != base
+
+
+def test_build_credentials_seeds_oauth_credentials_from_cache():
+    env = {
+        "BCD_SLIDES_OAUTH_CLIENT_ID": "id",
+        "BCD_SLIDES_OAUTH_CLIENT_SECRET": "sec",
+        "BCD_SLIDES_OAUTH_REFRESH_TOKEN": "tok",
+        "BCD_SLIDES_CACHE_DIR": os.environ["BCD_SLIDES_CACHE_DIR"],
+    }
+    first = auth._build_credentials(env)
+    TokenCache.for_credentials(first, env).store(
+        "cached-access", _now() + timedelta(hours=1)
+    )
+
+    creds = auth._build_credentials(env)
+    assert creds.token == "cached-access"
+    assert creds.valid
+
+    env["BCD_SLIDES_TOKEN_CACHE"] = "0"
+    assert auth._build_credentials(env).token is None
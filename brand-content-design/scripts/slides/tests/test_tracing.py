@@ -0,0 +1,114 @@
+"""Tests for slides.tracing — spans from the CLI, mocked and against the fake."""
+
+from __future__ import annotations
+
+import io
+import json
+from unittest.mock import MagicMock
+
+from slides import cli
+from slides.fakeserver import FakeGoogleServer
+from slides.retry import NO_RETRY, RetryPolicy
+from slides.runner import SlidesRunner
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status):
+        self.resp = type("R", (), {"status": status, "get": lambda *_: None})()
+        super().__init__(f"HTTP {status}")
+
+
+def test_payload_flag_traces_every_attempt_and_detaches_afterwards():
+    slides = MagicMock()
+    create = slides.presentations.return_value.create.return_value
+    create.methodId = "slides.presentations.create"
+    create.execute.side_effect = [FakeHttpError(429), {"presentationId": "d1"}]
+    runner = SlidesRunner(
+        slides, MagicMock(), retry=RetryPolicy(max_attempts=3, sleep=lambda _: None)
+    )
+
+    code, output = cli.run_command(
+        runner, "create_deck", {"title": "x", "trace": True}
+    )
+
+    assert code == 0
+    assert [(s["method"], s["attempt"], s["outcome"], s["status"]) for s in
+            output["trace"]] == [
+        ("slides.presentations.create", 1, "error", 429),
+        ("slides.presentations.create", 2, "ok", None),
+    ]
+    assert all(s["duration_ms"] >= 0 for s in output["trace"])
+    assert runner.retry.tracer is None
+
+    code, output = cli.run_command(runner, "create_deck", {"title": "y"})
+    assert "trace" not in output
+
+
+def test_tracing_a_runner_without_policy_leaves_no_retry_untouched():
+    slides = MagicMock()
+    slides.presentations.return_value.create.return_value.execute.return_value = {
+        "presentationId": "d1"
+    }
+    runner = SlidesRunner(slides, MagicMock())
+    assert runner.retry is NO_RETRY
+
+    code, output = cli.run_command(
+        runner, "create_deck", {"title": "x", "trace": True}
+    )
+
+    assert code == 0 and len(output["trace"]) == 1
+    assert NO_RETRY.tracer is None
+    assert runner.retry is not NO_RETRY and runner.retry.max_attempts == 1
+
+
+def test_env_tracing_reports_http_detail_and_writes_otlp_lines(
+    tmp_path, monkeypatch
+):
+    for name in ("BRAND_CONTENT_DRIVE_ROOT_ID", "BCD_SLIDES_RATE_LIMIT"):
+        monkeypatch.delenv(name, raising=False)
+    trace_file = tmp_path / "trace.jsonl"
+    monkeypatch.setenv("BCD_SLIDES_TRACE", "1")
+    monkeypatch.setenv("BCD_SLIDES_TRACE_FILE", str(trace_file))
+    monkeypatch.setattr(cli, "_mirror_slot", None)
+    (tmp_path / "deck.pdf").write_bytes(b"%PDF" * 100)
+
+    with FakeGoogleServer() as server:
+        monkeypatch.setenv("BCD_SLIDES_API_ENDPOINT", server.endpoint)
+        out = io.StringIO()
+        cli.run_batch(
+            [
+                json.dumps(
+                    {
+                        "command": "mirror_presentation",
+                        "payload": {
+                            "brand": "acme",
+                            "render_slug": "launch",
+                            "local_dir": str(tmp_path),
+                            "deck_id": "unused",
+                            "pdf_path": str(tmp_path / "deck.pdf"),
+                        },
+                    }
+                )
+            ],
+            out,
+        )
+
+    line = json.loads(out.getvalue())
+    spans = (line.get("result") or line)["trace"]
+    lookup = spans[0]
+    assert lookup["method"] == "drive.files.list"
+    assert lookup["http_method"] == "GET"
+    assert lookup["path"] == "/drive/v3/files"
+    assert "name = 'brand-content'" in lookup["params"]["q"]
+    upload = next(
+        s for s in spans
+        if s["method"] == "drive.files.create" and s["bytes_out"] > 400
+    )
+    assert upload["outcome"] == "ok" and upload["bytes_in"] > 0
+
+    otel = [json.loads(raw) for raw in trace_file.read_text().splitlines()]
+    assert len(otel) == len(spans)
+    assert len({span["traceId"] for span in otel}) == 1
+    assert {"key": "bcd.command", "value": {"stringValue": "mirror_presentation"}} in (
+        otel[0]["attributes"]
+    )
@@ -0,0 +1,171 @@
+"""Unit tests for slides.uploads — resumable sessions, no network."""
+
+from __future__ import annotations
+
+import io
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from slides import cli
+from slides.retry import RetryPolicy
+from slides.uploads import (
+    UploadSessionStore,
+    chunk_size,
+    resumable_threshold,
+    run_resumable_upload,
+    session_key,
+)
+
+
+class FakeHttpError(Exception):
+    def __init__(self, status):
+        self.resp = SimpleNamespace(status=status, get=lambda _key: None)
+        super().__init__(f"HTTP {status}")
+
+
+def _progress(done, total):
+    return SimpleNamespace(resumable_progress=done, total_size=total)
+
+
+def _request(*outcomes, uri="https://upload.example/session-1"):
+    """Fake resumable request whose ``next_chunk`` yields ``outcomes``."""
+    request = MagicMock()
+    request.methodId = "drive.files.create"
+    request.resumable_uri = None
+    items = iter(outcomes)
+
+    def _next_chunk():
+        item = next(items)
+        if isinstance(item, BaseException):
+            raise item
+        request.resumable_uri = request.resumable_uri or uri
+        return item
+
+    request.next_chunk.side_effect = _next_chunk
+    return request
+
+
+def _store(tmp_path, now=1000.0):
+    clock = {"now": now}
+    store = UploadSessionStore(tmp_path / "uploads.json", clock=lambda: clock["now"])
+    return store, clock
+
+
+def test_env_knobs_round_chunk_size_to_256k_multiple():
+    assert chunk_size({}) == 8 * 1024 * 1024
+    assert chunk_size({"BCD_SLIDES_UPLOAD_CHUNK_MB": "0.3"}) == 512 * 1024
+    assert resumable_threshold({"BCD_SLIDES_RESUMABLE_THRESHOLD_MB": "1"}) == 1048576
+
+
+def test_session_key_changes_with_file_contents_and_destination(tmp_path):
+    path = tmp_path / "deck.pptx"
+    path.write_bytes(b"v1")
+    key = session_key(str(path), "F1", "deck", "pptx")
+    assert key == session_key(str(path), "F1", "deck", "pptx")
+    assert key != session_key(str(path), "F2", "deck", "pptx")
+    path.write_bytes(b"version-2")
+    assert key != session_key(str(path), "F1", "deck", "pptx")
+
+
+def test_uploads_in_chunks_and_reports_progress(tmp_path):
+    store, _ = _store(tmp_path)
+    request = _request(
+        (_progress(4, 10), None), (_progress(8, 10), None), (None, {"id": "X"})
+    )
+    stream = io.StringIO()
+
+    result = run_resumable_upload(
+        request, key="k", retry=RetryPolicy(max_attempts=1), label="deck.pptx",
+        store=store, progress_stream=stream,
+    )
+
+    assert result == {"id": "X"}
+    assert request.next_chunk.call_count == 3
+    assert "deck.pptx: 40%" in stream.getvalue()
+    assert "deck.pptx: 80%" in stream.getvalue()
+    assert store.get("k") is None  # finished sessions are forgotten
+
+
+def test_failed_chunk_is_retried_in_place(tmp_path):
+    store, _ = _store(tmp_path)
+    request = _request(
+        (_progress(4, 10), None), FakeHttpError(503), (None, {"id": "X"})
+    )
+    retry = RetryPolicy(max_attempts=3, sleep=lambda _s: None)
+
+    result = run_resumable_upload(
+        request, key="k", retry=retry, label="f", store=store,
+        progress_stream=io.StringIO(),
+    )
+
+    assert result == {"id": "X"}
+    assert retry.take_log() == [
+        {"method": "drive.files.create", "retries": 1, "outcome": "ok"}
+    ]
+
+
+def test_interrupted_upload_resumes_saved_session(tmp_path):
+    store, _ = _store(tmp_path)
+    first = _request((_progress(4, 10), None), KeyboardInterrupt())
+    with pytest.raises(KeyboardInterrupt):
+        run_resumable_upload(
+            first, key="k", retry=RetryPolicy(max_attempts=1), label="f",
+            store=store, progress_stream=io.StringIO(),
+        )
+    assert store.get("k") == "https://upload.example/session-1"
+    assert oct(os.stat(tmp_path / "uploads.json").st_mode & 0o777) == "0o600"
+
+    second = _request((None, {"id": "X"}))
+    result = run_resumable_upload(
+        second, key="k", retry=RetryPolicy(max_attempts=1), label="f",
+        store=store, progress_stream=io.StringIO(),
+    )
+
+    assert result == {"id": "X"}
+    assert second.resumable_uri == "https://upload.example/session-1"
+    assert second._in_error_state is True
+    assert second.next_chunk.call_count == 1
+
+
+def test_expired_session_restarts_from_scratch(tmp_path):
+    store, _ = _store(tmp_path)
+    store.put("k", "https://upload.example/gone")
+    request = _request(FakeHttpError(404), (None, {"id": "X"}), uri="https://new")
+
+    result = run_resumable_upload(
+        request, key="k", retry=RetryPolicy(max_attempts=1), label="f",
+        store=store, progress_stream=io.StringIO(),
+    )
+
+    assert result == {"id": "X"}
+    assert request.resumable_progress == 0
+    assert request.next_chunk.call_count == 2
+
+
+def test_stale_sessions_are_not_resumed(tmp_path):
+    store, clock = _store(tmp_path)
+    store.put("k", "https://upload.example/old")
+    clock["now"] += 7 * 24 * 3600
+    assert store.get("k") is None
+
+
+def test_large_files_take_the_resumable_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("BCD_SLIDES_RESUMABLE_THRESHOLD_MB", "0.000001")
+    pdf = tmp_path / "deck.pdf"
+    pdf.write_bytes(b"%PDF-fake")
+    drive = MagicMock()
+    created = {"id": "PDF1", "trashed": False}
+
+    with patch.object(cli, "MediaFileUpload") as media, patch.object(
+        cli, "run_resumable_upload", return_value=created
+    ) as run:
+        file_id = cli._upload_file(drive, "F1", str(pdf), "application/pdf")
+
+    assert file_id == "PDF1"
+    assert media.call_args.kwargs["resumable"] is True
+    assert media.call_args.kwargs["chunksize"] % (256 * 1024) == 0
+    assert run.call_args.kwargs["label"] == "deck.pdf"
+    drive.files.return_value.create.return_value.execute.assert_not_called()
@@ -0,0 +1,162 @@
+"""Access-token cache shared by every ``slides.cli`` process.
+
+Without it each process starts with ``token=None`` and spends a round trip
+to the token endpoint before its first API call. :class:`TokenCache` keeps
+the last access token and its expiry in ``tokens/{key}.json`` under the
+cache directory (mode 0600), keyed by the identity and scopes the token was
+minted for:
+
+* OAuth — client id + a hash of the refresh token + scopes;
+* service account — the account email + scopes.
+
+:meth:`TokenCache.attach` seeds fresh credentials from the file and wraps
+their ``refresh`` so a process whose token is missing or about to expire
+takes an ``flock`` on ``{key}.lock``, re-reads the file (another process may
+have just refreshed) and only then hits the token endpoint. Processes with a
+still-valid token never lock.
+
+``BCD_SLIDES_TOKEN_CACHE=0`` turns it off.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from slides.cache import default_cache_dir, write_json_atomic
+
+try:  # POSIX only; elsewhere refreshes are coordinated per process.
+    import fcntl
+except ImportError:  # pragma: no cover - exercised on Windows only
+    fcntl = None
+
+
+#: Cached tokens with less life left than this are refreshed instead of
+#: reused. Above google-auth's own 3m45s refresh threshold, so a token we
+#: hand out is still ``valid`` to the credentials object.
+MIN_REMAINING = timedelta(minutes=5)
+
+#: Serializes refreshes between threads of one process (flock is per-process).
+_thread_lock = threading.Lock()
+
+
+def _utcnow() -> datetime:
+    # google-auth keeps ``expiry`` as a naive UTC datetime.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def token_cache_enabled(env: dict | None = None) -> bool:
+    """``BCD_SLIDES_TOKEN_CACHE=0`` (or ``false``/``off``) disables it."""
+    if env is None:
+        env = os.environ
+    value = env.get("BCD_SLIDES_TOKEN_CACHE", "1").strip().lower()
+    return value not in ("0", "false", "off", "no")
+
+
+def _identity(creds: Any) -> str:
+    """Stable identity string for ``creds``; never contains a secret."""
+    email = getattr(creds, "service_account_email", None)
+    if isinstance(email, str):
+        principal = f"sa:{email}"
+    else:
+        refresh = getattr(creds, "refresh_token", None)
+        refresh_hash = hashlib.sha256(str(refresh).encode("utf-8")).hexdigest()
+        principal = f"oauth:{getattr(creds, 'client_id', None)}:{refresh_hash}"
+    scopes = getattr(creds, "scopes", None) or []
+    return principal + "|" + " ".join(sorted(scopes))
+
+
+class TokenCache:
+    """One cached access token, shared across processes.
+
+    Parameters
+    ----------
+    path:
+        JSON file holding ``{"token", "expiry"}``. The lock file sits next to
+        it with a ``.lock`` suffix.
+    """
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+
+    @classmethod
+    def for_credentials(cls, creds: Any, env: dict | None = None) -> "TokenCache":
+        """Cache file for ``creds`` under the default cache directory."""
+        key = hashlib.sha256(_identity(creds).encode("utf-8")).hexdigest()[:32]
+        return cls(default_cache_dir(env) / "tokens" / f"{key}.json")
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    # ----- private --------------------------------------------------------- #
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with _thread_lock:
+            if fcntl is None:
+                yield
+                return
+            self._path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            lock_path = self._path.with_suffix(".lock")
+            with open(lock_path, "a+") as lock_file:
+                os.chmod(lock_path, 0o600)
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    # ----- public ---------------------------------------------------------- #
+
+    def load(self) -> Optional[tuple[str, datetime]]:
+        """``(token, expiry)`` if the cached token has enough life left."""
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            token = data["token"]
+            expiry = datetime.fromisoformat(data["expiry"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(token, str) or expiry - _utcnow() < MIN_REMAINING:
+            return None
+        return token, expiry
+
+    def store(self, token: str, expiry: datetime) -> None:
+        self._path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        write_json_atomic(
+            self._path,
+            {"token": token, "expiry": expiry.isoformat()},
+            mode=0o600,
+        )
+
+    def attach(self, creds: Any) -> Any:
+        """Seed ``creds`` from the cache and route its refreshes through it.
+
+        Returns ``creds`` for chaining.
+        """
+        cached = self.load()
+        if cached is not None:
+            creds.token, creds.expiry = cached
+        original_refresh = creds.refresh
+
+        def _refresh(request) -> None:
+            rejected = creds.token
+            with self._locked():
+                cached = self.load()
+                # A cached token equal to ours is the one the API just
+                # rejected (401) — mint a new one.
+                if cached is not None and cached[0] != rejected:
+                    creds.token, creds.expiry = cached
+                    return
+                original_refresh(request)
+                if creds.token and creds.expiry:
+                    self.store(creds.token, creds.expiry)
+
+        creds.refresh = _refresh
+        return creds
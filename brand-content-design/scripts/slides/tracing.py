@@ -0,0 +1,201 @@
+"""Opt-in per-call tracing for the Slides + Drive runner.
+
+With ``BCD_SLIDES_TRACE=1`` in the environment, or ``"trace": true`` in a
+command's payload, the CLI hangs a :class:`Tracer` on the command's
+:class:`~slides.retry.RetryPolicy`. Every attempt of every Google call
+(``SlidesRunner``, ``DriveFolderMirror``, upload chunks, Drive batches) then
+becomes one span:
+
+    {"method": "drive.files.list", "attempt": 1, "http_method": "GET",
+     "path": "/drive/v3/files", "params": {"q": "name = 'acme' and …"},
+     "outcome": "ok", "status": null, "bytes_out": 0, "bytes_in": 58,
+     "start_ms": 12.4, "duration_ms": 183.0}
+
+plus an ``auth.refresh`` span whenever the access token is refreshed. The
+spans come back as a ``"trace"`` array in the command's JSON output.
+``BCD_SLIDES_TRACE_FILE`` additionally appends them, one JSON object per
+line, in OpenTelemetry's OTLP/JSON span shape under one trace id per
+command, for loading into any OTLP-aware viewer.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import secrets
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+#: Query parameters that say nothing about the call.
+_NOISE_PARAMS = ("alt", "prettyPrint")
+
+#: Longest parameter value kept in a span; ``q`` strings can be long.
+MAX_PARAM_CHARS = 120
+
+#: OTLP status codes.
+_OTEL_OK = 1
+_OTEL_ERROR = 2
+
+
+def tracing_enabled(env: dict | None = None) -> bool:
+    """``BCD_SLIDES_TRACE=1`` (or ``true``/``on``) turns tracing on."""
+    if env is None:
+        env = os.environ
+    value = env.get("BCD_SLIDES_TRACE", "").strip().lower()
+    return value in ("1", "true", "on", "yes")
+
+
+def _clip(value: str) -> str:
+    return value if len(value) <= MAX_PARAM_CHARS else value[:MAX_PARAM_CHARS] + "…"
+
+
+def describe_request(request: Any) -> dict[str, Any]:
+    """Method, path, parameter summary and upload size of a googleapiclient
+    request. Empty for anything that is not one (e.g. test doubles)."""
+    uri = getattr(request, "uri", None)
+    if not isinstance(uri, str):
+        return {}
+    parsed = urllib.parse.urlsplit(uri)
+    params = {
+        key: _clip(value)
+        for key, value in urllib.parse.parse_qsl(parsed.query)
+        if key not in _NOISE_PARAMS
+    }
+    body = getattr(request, "body", None)
+    bytes_out = len(body) if isinstance(body, (str, bytes)) else 0
+    resumable = getattr(request, "resumable", None)
+    if resumable is not None:
+        bytes_out = resumable.size() or bytes_out
+    return {
+        "http_method": getattr(request, "method", None),
+        "path": parsed.path,
+        "params": params,
+        "bytes_out": bytes_out,
+    }
+
+
+def _response_size(result: Any) -> int:
+    if isinstance(result, bytes):
+        return len(result)
+    try:
+        return len(json.dumps(result, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+
+class Span:
+    """One timed call. Created by :meth:`Tracer.start`; call :meth:`end` once."""
+
+    def __init__(self, tracer: "Tracer", name: str, attributes: dict[str, Any]):
+        self._tracer = tracer
+        self._start = time.perf_counter()
+        self._start_ns = time.time_ns()
+        self.record: dict[str, Any] = {"method": name, **attributes}
+
+    def end(
+        self, *, result: Any = None, error: Optional[BaseException] = None
+    ) -> None:
+        elapsed = time.perf_counter() - self._start
+        status = getattr(getattr(error, "resp", None), "status", None)
+        self.record.update(
+            outcome="error" if error is not None else "ok",
+            status=int(status) if status is not None else None,
+            bytes_in=_response_size(result) if error is None else 0,
+            start_ms=round((self._start - self._tracer.started) * 1000, 1),
+            duration_ms=round(elapsed * 1000, 1),
+        )
+        if error is not None:
+            self.record["error"] = type(error).__name__
+        self._tracer._finish(self, self._start_ns, self._start_ns + int(elapsed * 1e9))
+
+
+class Tracer:
+    """Collects :class:`Span` records from any number of threads."""
+
+    def __init__(self):
+        self.trace_id = secrets.token_hex(16)
+        self.started = time.perf_counter()
+        self._spans: list[dict[str, Any]] = []
+        self._otel: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def start(self, name: str, **attributes: Any) -> Span:
+        return Span(self, name, attributes)
+
+    def _finish(self, span: Span, start_ns: int, end_ns: int) -> None:
+        record = span.record
+        attributes = [
+            {"key": key, "value": _otel_value(value)}
+            for key, value in record.items()
+            if key != "method" and value is not None
+        ]
+        otel = {
+            "traceId": self.trace_id,
+            "spanId": secrets.token_hex(8),
+            "name": record["method"],
+            "kind": 3,  # SPAN_KIND_CLIENT
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": attributes,
+            "status": {
+                "code": _OTEL_ERROR if record["outcome"] == "error" else _OTEL_OK
+            },
+        }
+        with self._lock:
+            self._spans.append(record)
+            self._otel.append(otel)
+
+    def wrap_refresh(self, credentials: Any) -> Callable[[], None]:
+        """Time ``credentials.refresh`` calls as ``auth.refresh`` spans.
+
+        Returns a callable that puts the original ``refresh`` back.
+        """
+        original = credentials.refresh
+
+        def _refresh(request) -> None:
+            span = self.start("auth.refresh")
+            try:
+                original(request)
+            except Exception as exc:  # noqa: BLE001 — recorded, then re-raised
+                span.end(error=exc)
+                raise
+            span.end()
+
+        credentials.refresh = _refresh
+        return lambda: setattr(credentials, "refresh", original)
+
+    def take(self) -> list[dict[str, Any]]:
+        """Spans so far, in completion order; clears them."""
+        with self._lock:
+            spans, self._spans = self._spans, []
+        return spans
+
+    def export(self, path: Path, command: str) -> None:
+        """Append the OTLP/JSON spans to ``path``, one per line."""
+        with self._lock:
+            otel, self._otel = self._otel, []
+        if not otel:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as fh:
+            for span in otel:
+                span["attributes"].append(
+                    {"key": "bcd.command", "value": {"stringValue": command}}
+                )
+                fh.write(json.dumps(span, separators=(",", ":")) + "\n")
+
+
+def _otel_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, str):
+        return {"stringValue": value}
+    return {"stringValue": json.dumps(value, separators=(",", ":"), default=str)}
@@ -0,0 +1,209 @@
+"""Resumable, chunked media uploads for the Drive mirror path.
+
+Small files go up in one request. Files at or above
+``BCD_SLIDES_RESUMABLE_THRESHOLD_MB`` (default 5) use Drive's resumable
+protocol in ``BCD_SLIDES_UPLOAD_CHUNK_MB`` chunks (default 8), with progress
+on stderr. Each chunk runs under the caller's
+:class:`~slides.retry.RetryPolicy`; after a failed chunk googleapiclient
+asks Drive for the last committed byte and continues from there.
+
+The session URI is saved in ``uploads.json`` under the cache directory,
+keyed by the local file (path, size, mtime) and its Drive destination, so a
+re-run of an interrupted ``mirror_presentation`` picks the same upload up
+where it stopped instead of starting over. Drive expires sessions after a
+week; an expired one is dropped and the upload restarts. Session URIs grant
+upload access on their own, so the file is written owner-only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from slides.cache import default_cache_dir, write_json_atomic
+from slides.retry import RetryPolicy, method_id
+
+
+#: Files at least this large use the resumable protocol.
+DEFAULT_RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+#: Resumable chunk size. Drive requires a multiple of 256 KiB.
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+CHUNK_GRANULARITY = 256 * 1024
+
+#: Saved sessions older than this are not resumed (Drive keeps them ~7 days).
+SESSION_MAX_AGE = 6 * 24 * 3600
+
+#: ``appProperties`` key holding the MD5 of the local file an upload came
+#: from. Drive computes no ``md5Checksum`` for converted (native Slides)
+#: files, so this is the only way to tell whether a deck is current.
+SOURCE_MD5_PROPERTY = "bcdSourceMd5"
+
+
+def _megabytes(env: dict, key: str, default: int) -> int:
+    raw = env.get(key)
+    return int(float(raw) * 1024 * 1024) if raw else default
+
+
+def resumable_threshold(env: dict | None = None) -> int:
+    """Byte size at which uploads switch to the resumable protocol."""
+    if env is None:
+        env = os.environ
+    return _megabytes(
+        env, "BCD_SLIDES_RESUMABLE_THRESHOLD_MB", DEFAULT_RESUMABLE_THRESHOLD
+    )
+
+
+def chunk_size(env: dict | None = None) -> int:
+    """Configured chunk size, rounded up to a 256 KiB multiple."""
+    if env is None:
+        env = os.environ
+    size = _megabytes(env, "BCD_SLIDES_UPLOAD_CHUNK_MB", DEFAULT_CHUNK_SIZE)
+    chunks = max(1, -(-size // CHUNK_GRANULARITY))
+    return chunks * CHUNK_GRANULARITY
+
+
+def file_md5(local_path: str) -> str:
+    """Hex MD5 of a local file, the same digest Drive reports as ``md5Checksum``."""
+    digest = hashlib.md5()
+    with open(local_path, "rb") as fh:
+        for block in iter(lambda: fh.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def session_key(local_path: str, folder_id: str, name: str, mimetype: str) -> str:
+    """Identify one upload of one version of a local file to one destination."""
+    stat = os.stat(local_path)
+    raw = "\0".join(
+        [
+            str(Path(local_path).resolve()),
+            str(stat.st_size),
+            str(stat.st_mtime_ns),
+            folder_id,
+            name,
+            mimetype,
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class UploadSessionStore:
+    """``session_key → {"uri", "saved_at"}`` persisted as owner-only JSON."""
+
+    #: Parallel uploads in one process share the file; serialize rewrites.
+    _lock = threading.Lock()
+
+    def __init__(self, path: Path, *, clock: Callable[[], float] = time.time):
+        self._path = Path(path)
+        self._clock = clock
+
+    @classmethod
+    def default(cls, env: dict | None = None) -> "UploadSessionStore":
+        return cls(default_cache_dir(env) / "uploads.json")
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            return json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._load().get(key)
+        if not entry or self._clock() - entry.get("saved_at", 0) > SESSION_MAX_AGE:
+            return None
+        return entry.get("uri")
+
+    def put(self, key: str, uri: str) -> None:
+        with self._lock:
+            sessions = self._load()
+            sessions[key] = {"uri": uri, "saved_at": self._clock()}
+            write_json_atomic(self._path, sessions, mode=0o600)
+
+    def drop(self, key: str) -> None:
+        with self._lock:
+            sessions = self._load()
+            if sessions.pop(key, None) is not None:
+                write_json_atomic(self._path, sessions, mode=0o600)
+
+
+def _report(label: str, progress, stream) -> None:
+    total = progress.total_size or 0
+    done = progress.resumable_progress
+    if total:
+        stream.write(
+            f"[slides] uploading {label}: {100 * done // total}% "
+            f"({done / 1048576:.1f}/{total / 1048576:.1f} MB)\n"
+        )
+    else:
+        stream.write(f"[slides] uploading {label}: {done / 1048576:.1f} MB\n")
+    stream.flush()
+
+
+def run_resumable_upload(
+    request,
+    *,
+    key: str,
+    retry: RetryPolicy,
+    label: str,
+    store: Optional[UploadSessionStore] = None,
+    progress_stream=None,
+    http: Any = None,
+) -> dict:
+    """Drive a resumable ``files.create`` / ``files.update`` to completion.
+
+    ``request`` is a ``googleapiclient`` request built with a resumable
+    ``MediaFileUpload``; ``http`` optionally overrides its transport.
+    Returns the final response body.
+    """
+    store = store if store is not None else UploadSessionStore.default()
+    stream = progress_stream if progress_stream is not None else sys.stderr
+    method = method_id(request)
+    next_chunk = (
+        request.next_chunk if http is None else partial(request.next_chunk, http=http)
+    )
+
+    saved_uri = store.get(key)
+    resuming = saved_uri is not None
+    if resuming:
+        # Same recovery path googleapiclient takes after a failed chunk: the
+        # next call asks Drive for the committed range before sending data.
+        request.resumable_uri = saved_uri
+        request._in_error_state = True
+        stream.write(f"[slides] resuming upload of {label}\n")
+
+    saved = resuming
+    response = None
+    while response is None:
+        try:
+            status, response = retry.call(
+                next_chunk,
+                method=method,
+                detail={"upload": label, "offset": request.resumable_progress},
+            )
+        except Exception as exc:  # noqa: BLE001 — only expired sessions handled
+            status_code = getattr(getattr(exc, "resp", None), "status", None)
+            if not resuming or status_code not in (404, 410):
+                raise
+            # Saved session expired on Drive's side: start a fresh one.
+            store.drop(key)
+            request.resumable_uri = None
+            request.resumable_progress = 0
+            request._in_error_state = False
+            resuming = saved = False
+            continue
+        resuming = False
+        if not saved and request.resumable_uri:
+            store.put(key, request.resumable_uri)
+            saved = True
+        if status is not None:
+            _report(label, status, stream)
+    store.drop(key)
+    return response
@@ -0,0 +1,77 @@
+"""Shared fixtures for the icons.py tests: fake Lucide icons and cairosvg."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+import icons
+
+#: Lucide's own layout: license comment, ``<svg`` alone on its line.
+LUCIDE_SVG = """<!-- @license lucide-static v0.0.0 - ISC -->
+<svg
+  class="lucide lucide-{name}"
+  xmlns="http://www.w3.org/2000/svg"
+  width="24"
+  height="24"
+  viewBox="0 0 24 24"
+  fill="none"
+  stroke="currentColor"
+  stroke-width="2"
+>
+  <path d="M{index} 2 L22 22" />
+</svg>
+"""
+
+ICON_NAMES = (
+    "rocket",
+    "chart-bar",
+    "chart-line",
+    "bar-chart",
+    "banknote",
+    "target",
+    "trophy",
+)
+
+
+class FakeCairo:
+    """Records renders; returns a tiny fake PNG derived from the input SVG."""
+
+    __version__ = "0.0-test"
+
+    def __init__(self):
+        self.calls = []
+
+    def svg2png(self, bytestring, output_width, output_height):
+        self.calls.append((bytestring.decode("utf-8"), output_width, output_height))
+        return b"\x89PNG" + bytestring[-64:]
+
+
+@pytest.fixture(autouse=True)
+def fake_icons(tmp_path, monkeypatch):
+    """Point icons.py at temp icons/cache dirs with a fake cairosvg."""
+    icons_dir = tmp_path / "lucide-static" / "icons"
+    icons_dir.mkdir(parents=True)
+    for index, name in enumerate(ICON_NAMES):
+        svg = LUCIDE_SVG.format(name=name, index=index)
+        (icons_dir / f"{name}.svg").write_text(svg)
+    cache_dir = tmp_path / "icon-cache"
+    cairo = FakeCairo()
+
+    monkeypatch.setattr(icons, "ICONS_DIR", icons_dir)
+    monkeypatch.setattr(icons, "TAGS_PATH", icons_dir.parent / "tags.json")
+    monkeypatch.setattr(icons, "CACHE_DIR", cache_dir)
+    monkeypatch.setattr(icons, "INDEX_PATH", cache_dir / "icon-index.json")
+    monkeypatch.setattr(icons, "cairosvg", cairo, raising=False)
+    monkeypatch.setattr(icons, "CAIROSVG_AVAILABLE", True)
+    monkeypatch.setattr(
+        icons, "_memory_cache", icons._IconMemoryCache(icons.MEMORY_CACHE_MAX_BYTES)
+    )
+    monkeypatch.setattr(icons, "_stats", Counter())
+    monkeypatch.setattr(icons, "_disk_bytes", None)
+    icons._svg_template.cache_clear()
+    icons._icon_index.cache_clear()
+    yield cairo
+    icons._svg_template.cache_clear()
+    icons._icon_index.cache_clear()
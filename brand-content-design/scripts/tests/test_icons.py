@@ -0,0 +1,376 @@
+"""Unit tests for icons.py — fake Lucide icons and cairosvg, see conftest."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import types
+from pathlib import Path
+from xml.etree import ElementTree
+
+import icons
+
+SVG_NS = "http://www.w3.org/2000/svg"
+
+
+def test_env_bytes_falls_back_on_unset_or_invalid_values(monkeypatch):
+    monkeypatch.setenv("BCD_ICON_CACHE_MB", "x64")
+    assert icons._env_bytes("BCD_ICON_CACHE_MB", 64) == 64 * 1024 * 1024
+
+    monkeypatch.setenv("BCD_ICON_MEMORY_CACHE_MB", "0.5")
+    assert icons._env_bytes("BCD_ICON_MEMORY_CACHE_MB", 32) == 512 * 1024
+
+    monkeypatch.setenv("BCD_ICON_MEMORY_CACHE_MB", "lots")
+    assert icons._env_bytes("BCD_ICON_MEMORY_CACHE_MB", 32) == 32 * 1024 * 1024
+
+    monkeypatch.delenv("BCD_ICON_MEMORY_CACHE_MB")
+    assert icons._env_bytes("BCD_ICON_MEMORY_CACHE_MB", 32) == 32 * 1024 * 1024
+
+
+def test_memory_cache_evicts_least_recently_used_past_the_byte_bound():
+    # Each 2px entry costs len(png) + 2 * 2 * 4 = 20 bytes.
+    cache = icons._IconMemoryCache(max_bytes=50)
+    cache.put(("a", "#000", 2), b"x" * 4)
+    cache.put(("b", "#000", 2), b"x" * 4)
+    cache.get(("a", "#000", 2))  # a is now the most recent
+    cache.put(("c", "#000", 2), b"x" * 4)
+
+    assert cache.get(("b", "#000", 2)) is None
+    assert cache.get(("a", "#000", 2)) is not None
+    assert cache.get(("c", "#000", 2)) is not None
+    assert cache.bytes == 40
+
+
+def test_memory_cache_replacing_a_key_recharges_it():
+    cache = icons._IconMemoryCache(max_bytes=1000)
+    cache.put(("a", "#000", 2), b"x" * 4)
+    cache.put(("a", "#000", 2), b"x" * 10)
+
+    assert cache.bytes == 26
+
+
+def test_memory_cache_keeps_one_entry_even_over_the_bound():
+    cache = icons._IconMemoryCache(max_bytes=10)
+    cache.put(("a", "#000", 2), b"x" * 4)
+    cache.put(("big", "#000", 48), b"x" * 100)
+
+    assert cache.get(("a", "#000", 2)) is None
+    assert cache.get(("big", "#000", 48))["png"] == b"x" * 100
+
+
+def test_repeated_icon_renders_once_and_is_served_from_memory(fake_icons):
+    first = icons.get_icon_png("rocket", "#3B82F6", 48)
+    second = icons.get_icon_png("rocket", "#3B82F6", 48)
+    png = icons.get_icon_png_bytes("rocket", "#3B82F6", 48)
+
+    assert first == second
+    assert len(fake_icons.calls) == 1
+    assert png == open(first, "rb").read()
+    assert icons._stats["memory_hits"] == 2
+
+
+def _specs(names, color="#3B82F6", size=48):
+    return [(name, color, size) for name in names]
+
+
+def test_get_icon_pngs_keeps_input_order_on_a_process_pool(fake_icons):
+    names = ["trophy", "rocket", "target", "chart-bar", "rocket", "banknote"]
+
+    paths = icons.get_icon_pngs(
+        _specs(names) + [("missing", "#000", 48)], max_workers=3
+    )
+
+    assert fake_icons.calls == []  # every render ran in a worker
+    assert paths[1] == paths[4]
+    assert paths[-1] is None
+    for name, path in zip(names, paths):
+        expected = icons._svg_to_png((name, "#3B82F6", 48))
+        assert open(path, "rb").read() == expected
+
+
+class _BrokenPool:
+    def __init__(self, **_kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, keys):
+        raise icons.BrokenProcessPool("worker died on start-up")
+
+
+def test_get_icon_pngs_renders_serially_when_the_pool_breaks(
+    fake_icons, monkeypatch
+):
+    monkeypatch.setattr(icons, "ProcessPoolExecutor", _BrokenPool)
+    names = ["trophy", "rocket", "target", "chart-bar", "banknote"]
+
+    paths = icons.get_icon_pngs(_specs(names), max_workers=4)
+
+    assert all(paths)
+    assert [call[0] for call in fake_icons.calls] == [
+        icons.get_icon_svg(name, "#3B82F6", 48) for name in names
+    ]
+
+
+def test_get_icon_pngs_skips_the_pool_for_a_few_misses(fake_icons, monkeypatch):
+    def _no_pool(**_kwargs):
+        raise AssertionError("pool started for too few misses")
+
+    monkeypatch.setattr(icons, "ProcessPoolExecutor", _no_pool)
+
+    paths = icons.get_icon_pngs(_specs(["rocket", "target"]), max_workers=4)
+
+    assert all(paths)
+    assert len(fake_icons.calls) == 2
+
+
+def test_atlas_places_each_cell_at_its_mapped_offset(fake_icons):
+    names = ["rocket", "target", "trophy", "missing", "rocket"]
+
+    atlas = icons.build_icon_atlas(
+        names, color="#3B82F6", size=48, brand="../Acme Co", padding=2
+    )
+
+    assert atlas["icons"] == {"rocket": [2, 2], "target": [54, 2], "trophy": [2, 54]}
+    assert (atlas["width"], atlas["height"]) == (104, 104)
+    assert Path(atlas["image"]).parent == icons.CACHE_DIR
+    assert Path(atlas["image"]).name.startswith("atlas-Acme-Co-")
+    assert json.loads(Path(atlas["map"]).read_text()) == atlas
+
+    sheet, width, height = fake_icons.calls[-1]
+    cells = ElementTree.fromstring(sheet).findall(f"{{{SVG_NS}}}svg")
+    placed = {
+        cell.get("class").split("lucide-")[1]: [int(cell.get("x")), int(cell.get("y"))]
+        for cell in cells
+    }
+    assert placed == atlas["icons"]
+    assert (width, height) == (104, 104)
+
+
+def test_atlas_is_reused_from_disk(fake_icons):
+    first = icons.build_icon_atlas(["rocket", "target"], brand="acme")
+    second = icons.build_icon_atlas(["rocket", "target"], brand="acme")
+
+    assert first == second
+    assert len(fake_icons.calls) == 1
+
+
+class FakeImageReader:
+    def __init__(self, source):
+        self.source = source
+
+
+class RecordingCanvas:
+    """Just enough of a reportlab canvas to record what gets drawn."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, method):
+        return lambda *args, **kwargs: self.calls.append((method, args, kwargs))
+
+    def beginPath(self):
+        canvas = self
+
+        class ClipPath:
+            def rect(self, *args):
+                canvas.calls.append(("rect", args, {}))
+
+        return ClipPath()
+
+
+def _fake_reportlab(monkeypatch):
+    utils = types.ModuleType("reportlab.lib.utils")
+    utils.ImageReader = FakeImageReader
+    monkeypatch.setitem(sys.modules, "reportlab", types.ModuleType("reportlab"))
+    monkeypatch.setitem(sys.modules, "reportlab.lib", types.ModuleType("reportlab.lib"))
+    monkeypatch.setitem(sys.modules, "reportlab.lib.utils", utils)
+    icons._atlas_image.cache_clear()
+
+
+def test_draw_atlas_icon_offsets_the_sheet_under_a_cell_clip(fake_icons, monkeypatch):
+    _fake_reportlab(monkeypatch)
+    atlas = icons.build_icon_atlas(["rocket", "target", "trophy"], size=48)
+    canvas = RecordingCanvas()
+
+    assert icons.draw_atlas_icon(canvas, atlas, "trophy", 100, 200, 96, 96)
+    assert icons.draw_atlas_icon(canvas, atlas, "rocket", 0, 0)
+    assert not icons.draw_atlas_icon(canvas, atlas, "missing", 0, 0)
+
+    trophy = canvas.calls[:5]
+    assert [call[0] for call in trophy] == [
+        "saveState", "rect", "clipPath", "drawImage", "restoreState"
+    ]
+    assert trophy[1][1] == (100, 200, 96, 96)
+    _, (image, x, y), kwargs = trophy[3]
+    # Cell [2, 54] of a 104px sheet, doubled: its bottom edge sits 2px above
+    # the sheet's, so the sheet is drawn 4pt below and 4pt left of (x, y).
+    assert (x, y) == (96, 196)
+    assert (kwargs["width"], kwargs["height"]) == (208, 208)
+    assert image.source == atlas["image"]
+    assert canvas.calls[8][1][0] is image  # one reader per atlas file
+
+
+def test_get_icon_image_decodes_once(fake_icons, monkeypatch):
+    _fake_reportlab(monkeypatch)
+
+    first = icons.get_icon_image("rocket", "#3B82F6", 48)
+    second = icons.get_icon_image("rocket", "#3B82F6", 48)
+
+    assert first is second
+    assert first.source.getvalue() == icons.get_icon_png_bytes("rocket", "#3B82F6", 48)
+
+
+def _write_tags():
+    icons.TAGS_PATH.write_text(
+        json.dumps({"banknote": ["Money", "cash"], "rocket": ["launch"]})
+    )
+
+
+def test_search_defaults_to_name_substrings_ranked_best_first():
+    _write_tags()
+
+    assert icons.search_icons("chart") == ["chart-bar", "chart-line", "bar-chart"]
+    assert icons.search_icons("bar") == ["bar-chart", "chart-bar"]
+    assert icons.search_icons(" Chart-Bar ") == ["chart-bar"]
+    assert icons.search_icons("chart", limit=1) == ["chart-bar"]
+    for term in ("a", "ch", "ar", "money", "rockt"):
+        expected = {name for name in icons.list_icons() if term in name}
+        assert set(icons.search_icons(term)) == expected
+
+
+def test_search_matches_tags_and_categories_only_when_asked():
+    _write_tags()
+
+    assert icons.search_icons("money", tags=True) == ["banknote"]
+    assert icons.search_icons("launch", tags=True) == ["rocket"]
+    # Curated ICON_CATEGORIES count as tags; names still rank first.
+    assert icons.search_icons("growth", tags=True) == [
+        "target",
+        "trophy",
+        "chart-bar",
+        "chart-line",
+    ]
+    assert icons.get_icon_tags("banknote") == ["money", "cash"]
+
+
+def test_fuzzy_matching_is_opt_in():
+    assert icons.search_icons("rockt") == []
+    assert icons.search_icons("rockt", fuzzy=True) == ["rocket"]
+
+
+def test_index_is_persisted_and_reused_by_the_next_process(monkeypatch):
+    names = icons.list_icons()
+    assert icons.INDEX_PATH.exists()
+
+    def _no_scan():
+        raise AssertionError("icons directory scanned again")
+
+    icons._icon_index.cache_clear()  # as in a fresh process
+    monkeypatch.setattr(icons, "_scan_icons", _no_scan)
+
+    assert icons.list_icons() == names
+    assert names == sorted(path.stem for path in icons.ICONS_DIR.glob("*.svg"))
+
+
+def test_unwritable_index_does_not_break_search(monkeypatch):
+    def _read_only(path, data):
+        raise PermissionError(13, "Read-only file system", str(path))
+
+    monkeypatch.setattr(icons, "_write_atomic", _read_only)
+
+    assert icons.search_icons("chart") == ["chart-bar", "chart-line", "bar-chart"]
+    assert not icons.INDEX_PATH.exists()
+
+
+def _aged(path, seconds_ago):
+    stamp = time.time() - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+def test_cache_files_are_content_addressed():
+    blue = Path(icons.get_icon_png("rocket", "#3B82F6", 48))
+    red = Path(icons.get_icon_png("rocket", "#EF4444", 48))
+
+    assert blue != red
+    assert len(blue.stem) == 64  # full SHA-256
+    assert blue == icons._content_path(
+        icons.get_icon_svg("rocket", "#3B82F6", 48), "#3B82F6", 48
+    )
+    assert not list(icons.CACHE_DIR.glob(".tmp-*"))
+
+
+def test_prune_cache_evicts_least_recently_used_past_the_grace_period():
+    icons.CACHE_DIR.mkdir()
+    for age, name in ((4000, "oldest"), (3000, "older"), (2000, "old")):
+        path = icons.CACHE_DIR / f"{name}.png"
+        path.write_bytes(b"x" * 100)
+        _aged(path, age)
+    recent = icons.CACHE_DIR / "recent.png"
+    recent.write_bytes(b"x" * 100)
+    leftover = icons.CACHE_DIR / ".tmp-crashed.png"
+    leftover.write_bytes(b"x" * 10)
+    _aged(leftover, 4000)
+
+    removed = icons.prune_cache(max_bytes=250, grace_seconds=1000)
+
+    assert removed == 210
+    assert sorted(path.name for path in icons.CACHE_DIR.iterdir()) == [
+        "old.png",
+        "recent.png",
+    ]
+    # Everything left is within the grace period or under the cap.
+    assert icons.prune_cache(max_bytes=0, grace_seconds=3000) == 0
+    assert icons._stats["evictions"] == 3
+
+
+def test_writes_past_the_disk_cap_evict_idle_files(monkeypatch):
+    icons.get_icon_png("rocket", "#000000", 48)
+    one_png = icons.cache_stats()["disk_bytes"]
+    monkeypatch.setattr(icons, "DISK_CACHE_MAX_BYTES", 3 * one_png)
+
+    for color in ("#111111", "#222222", "#333333", "#444444"):
+        for path in icons.CACHE_DIR.iterdir():  # idle past the grace period
+            _aged(path, 2 * icons.EVICTION_GRACE_SECONDS)
+        icons.get_icon_png("rocket", color, 48)
+
+    # The fourth file passes the cap; pruning to 80% drops the two oldest.
+    stats = icons.cache_stats()
+    assert stats["disk_files"] == 3
+    assert stats["disk_bytes"] <= 3 * one_png
+    assert stats["evictions"] == 2
+    assert stats["disk_max_bytes"] == 3 * one_png
+
+
+def test_cache_stats_reports_hit_rate_and_bytes():
+    path = icons.get_icon_png("rocket", "#3B82F6", 48)
+    icons.get_icon_png("rocket", "#3B82F6", 48)
+    icons._memory_cache.clear()
+    icons.get_icon_png("rocket", "#3B82F6", 48)
+    icons.get_icon_png("target", "#3B82F6", 48)
+
+    stats = icons.cache_stats()
+
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (1, 1, 2)
+    assert stats["hit_rate"] == 0.5
+    assert stats["disk_files"] == 2
+    assert stats["disk_bytes"] == sum(
+        entry.stat().st_size for entry in icons.CACHE_DIR.iterdir()
+    )
+    assert stats["memory_entries"] == 2
+    assert Path(path).exists()
+
+
+def test_clear_cache_empties_disk_and_memory():
+    icons.get_icon_png("rocket", "#3B82F6", 48)
+
+    icons.clear_cache()
+
+    assert list(icons.CACHE_DIR.iterdir()) == []
+    assert icons.cache_stats()["memory_entries"] == 0